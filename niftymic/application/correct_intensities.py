@@ -18,6 +18,7 @@ import niftymic.registration.flirt as regflirt
 import niftymic.utilities.intensity_correction as ic
 import pysitk.python_helper as ph
 import pysitk.simple_itk_helper as sitkh
+import niftymic.utilities.scratch_directory as scratch
 from niftymic.utilities.input_arparser import InputArgparser
 
 
@@ -45,10 +46,13 @@ def main():
         "intensity correction.",
         default=0)
     input_parser.add_verbose(default=0)
+    input_parser.add_tmp_dir()
 
     args = input_parser.parse_args()
     input_parser.print_arguments(args)
 
+    scratch.set_root(args.tmp_dir)
+
     if args.log_config:
         input_parser.log_config(os.path.abspath(__file__))
 
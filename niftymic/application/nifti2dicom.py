@@ -40,8 +40,8 @@ import pydicom
 import pysitk.python_helper as ph
 
 import niftymic.base.data_reader as dr
+import niftymic.utilities.scratch_directory as scratch
 from niftymic.utilities.input_arparser import InputArgparser
-from niftymic.definitions import DIR_TMP
 
 
 COPY_DICOM_TAGS = {
@@ -88,14 +88,19 @@ def main():
         action='store_true',
         help="If given, the output DICOM file is combined as 3D volume"
     )
+    input_parser.add_tmp_dir()
+
     args = input_parser.parse_args()
     input_parser.print_arguments(args)
 
+    scratch.set_root(args.tmp_dir)
+
     # Prepare for final DICOM output
     ph.create_directory(args.dir_output)
 
     if args.volume:
-        dir_output_2d_slices = os.path.join(DIR_TMP, "dicom_slices")
+        dir_output_2d_slices = os.path.join(
+            scratch.get_directory(), "dicom_slices")
     else:
         dir_output_2d_slices = os.path.join(args.dir_output, args.label)
     ph.create_directory(dir_output_2d_slices, delete_files=True)
@@ -18,6 +18,7 @@ import niftymic.base.stack as st
 import niftymic.registration.flirt as regflirt
 import niftymic.registration.niftyreg as niftyreg
 import niftymic.utilities.stack_mask_morphological_operations as stmorph
+import niftymic.utilities.scratch_directory as scratch
 from niftymic.utilities.input_arparser import InputArgparser
 
 from niftymic.definitions import V2V_METHOD_OPTIONS, ALLOWED_EXTENSIONS
@@ -52,10 +53,13 @@ def main():
     input_parser.add_dilation_radius(default=1)
     input_parser.add_verbose(default=0)
     input_parser.add_log_config(default=0)
+    input_parser.add_tmp_dir()
 
     args = input_parser.parse_args()
     input_parser.print_arguments(args)
 
+    scratch.set_root(args.tmp_dir)
+
     if np.alltrue([not args.output.endswith(t) for t in ALLOWED_EXTENSIONS]):
         raise ValueError(
             "output filename invalid; allowed extensions are: %s" %
@@ -20,6 +20,7 @@ import niftymic.base.data_writer as dw
 import niftymic.registration.flirt as regflirt
 import niftymic.registration.niftyreg as niftyreg
 import niftymic.registration.simple_itk_registration as regsitk
+import niftymic.reconstruction.acquisition_model as am
 import niftymic.reconstruction.tikhonov_solver as tk
 import niftymic.reconstruction.primal_dual_solver as pd
 import niftymic.reconstruction.scattered_data_approximation as sda
@@ -29,6 +30,7 @@ import niftymic.utilities.intensity_correction as ic
 import niftymic.utilities.joint_image_mask_builder as imb
 import niftymic.utilities.segmentation_propagation as segprop
 import niftymic.utilities.volumetric_reconstruction_pipeline as pipeline
+import niftymic.utilities.scratch_directory as scratch
 from niftymic.utilities.input_arparser import InputArgparser
 
 from niftymic.definitions import V2V_METHOD_OPTIONS, ALLOWED_EXTENSIONS
@@ -77,7 +79,15 @@ def main():
     input_parser.add_write_motion_correction(default=1)
     input_parser.add_verbose(default=0)
     input_parser.add_two_step_cycles(default=3)
+    input_parser.add_warm_start(default=0)
     input_parser.add_use_masks_srr(default=0)
+    input_parser.add_threads(default=1)
+    input_parser.add_use_system_matrix(default=0)
+    input_parser.add_use_separable_psf(default=0)
+    input_parser.add_compress_unknowns(default=0)
+    input_parser.add_precision(default="float64")
+    input_parser.add_preconditioner(default=None)
+    input_parser.add_multigrid_levels(default=1)
     input_parser.add_boundary_stacks(default=[10, 10, 0])
     input_parser.add_metric(default="Correlation")
     input_parser.add_metric_radius(default=10)
@@ -122,10 +132,13 @@ def main():
         "transformations to motion correction output directory",
         default=0,
     )
+    input_parser.add_tmp_dir()
 
     args = input_parser.parse_args()
     input_parser.print_arguments(args)
 
+    scratch.set_root(args.tmp_dir)
+
     rejection_measure = "NCC"
     threshold_v2v = -2  # 0.3
     debug = False
@@ -145,6 +158,10 @@ def main():
     if args.threshold_first > args.threshold:
         raise ValueError("It must hold threshold-first <= threshold")
 
+    if args.precision != "float64" and not args.use_system_matrix:
+        raise ValueError(
+            "Precision '%s' requires --use-system-matrix" % args.precision)
+
     dir_output = os.path.dirname(args.output)
     ph.create_directory(dir_output)
 
@@ -257,6 +274,7 @@ def main():
             registration_method=vol_registration,
             verbose=debug,
             robust=args.v2v_robust,
+            n_threads=args.threads,
         )
         v2vreg.run()
         stacks = v2vreg.get_stacks()
@@ -332,7 +350,9 @@ def main():
         if args.outlier_rejection and threshold_v2v > -1:
             ph.print_subtitle("SDA Approximation")
             SDA = sda.ScatteredDataApproximation(
-                stacks, HR_volume, sigma=args.sigma)
+                stacks, HR_volume, sigma=args.sigma,
+                n_threads=args.threads,
+                precision=args.precision)
             SDA.run()
             HR_volume = SDA.get_reconstruction()
 
@@ -345,19 +365,24 @@ def main():
                 threshold=threshold_v2v,
                 measure=rejection_measure,
                 verbose=True,
+                n_threads=args.threads,
             )
             outlier_rejector.run()
             stacks = outlier_rejector.get_stacks()
 
         ph.print_subtitle("SDA Approximation Image")
         SDA = sda.ScatteredDataApproximation(
-            stacks, HR_volume, sigma=args.sigma)
+            stacks, HR_volume, sigma=args.sigma,
+            n_threads=args.threads,
+            precision=args.precision)
         SDA.run()
         HR_volume = SDA.get_reconstruction()
 
         ph.print_subtitle("SDA Approximation Image Mask")
         SDA = sda.ScatteredDataApproximation(
-            stacks, HR_volume, sigma=args.sigma, sda_mask=True)
+            stacks, HR_volume, sigma=args.sigma, sda_mask=True,
+            n_threads=args.threads,
+            precision=args.precision)
         SDA.run()
         # HR volume contains updated mask based on SDA
         HR_volume = SDA.get_reconstruction()
@@ -371,6 +396,10 @@ def main():
         tmp.insert(0, HR_volume)
         sitkh.show_stacks(tmp, segmentation=HR_volume, viewer=args.viewer)
 
+    # Slice acquisition model shared by all solvers so that masked slice
+    # data and system matrix blocks of unmoved slices are reused
+    acquisition_model = am.AcquisitionModel()
+
     # -----------Two-step Slice-to-Volume Registration-Reconstruction----------
     if args.two_step_cycles > 0:
 
@@ -407,6 +436,8 @@ def main():
                 HR_volume,
                 sigma=args.sigma,
                 use_masks=args.use_masks_srr,
+                n_threads=args.threads,
+                precision=args.precision,
             )
             alpha_range = [args.sigma, args.alpha]
         else:
@@ -419,6 +450,13 @@ def main():
                 iter_max=np.min([args.iter_max_first, args.iter_max]),
                 verbose=True,
                 use_masks=args.use_masks_srr,
+                n_threads=args.threads,
+                use_system_matrix=args.use_system_matrix,
+                use_separable_psf=args.use_separable_psf,
+                compress_unknowns=args.compress_unknowns,
+                precision=args.precision,
+                preconditioner=args.preconditioner,
+                acquisition_model=acquisition_model,
             )
             alpha_range = [args.alpha_first, args.alpha]
 
@@ -446,6 +484,8 @@ def main():
                 viewer=args.viewer,
                 verbose=args.verbose,
                 use_hierarchical_registration=args.s2v_hierarchical,
+                n_threads=args.threads,
+                warm_start=args.warm_start,
             )
         two_step_s2v_reg_recon.run()
         HR_volume_iterations = \
@@ -518,6 +558,8 @@ def main():
             HR_volume,
             sigma=args.alpha,
             use_masks=args.use_masks_srr,
+            n_threads=args.threads,
+            precision=args.precision,
         )
     else:
         if args.reconstruction_type in ["TVL2", "HuberL2"]:
@@ -527,6 +569,12 @@ def main():
                 reg_type="TV" if args.reconstruction_type == "TVL2" else "huber",
                 iterations=args.iterations,
                 use_masks=args.use_masks_srr,
+                n_threads=args.threads,
+                use_system_matrix=args.use_system_matrix,
+                use_separable_psf=args.use_separable_psf,
+                compress_unknowns=args.compress_unknowns,
+                precision=args.precision,
+                acquisition_model=acquisition_model,
             )
         else:
             recon_method = tk.TikhonovSolver(
@@ -534,9 +582,17 @@ def main():
                 reconstruction=HR_volume,
                 reg_type="TK1" if args.reconstruction_type == "TK1L2" else "TK0",
                 use_masks=args.use_masks_srr,
+                n_threads=args.threads,
+                use_system_matrix=args.use_system_matrix,
+                use_separable_psf=args.use_separable_psf,
+                compress_unknowns=args.compress_unknowns,
+                precision=args.precision,
+                preconditioner=args.preconditioner,
+                acquisition_model=acquisition_model,
             )
         recon_method.set_alpha(args.alpha)
         recon_method.set_iter_max(args.iter_max)
+        recon_method.set_n_levels(args.multigrid_levels)
         recon_method.set_verbose(True)
     recon_method.run()
     time_reconstruction += recon_method.get_computational_time()
@@ -544,7 +600,9 @@ def main():
 
     ph.print_subtitle("Final SDA Approximation Image Mask")
     SDA = sda.ScatteredDataApproximation(
-        stacks, HR_volume_final, sigma=args.sigma, sda_mask=True)
+        stacks, HR_volume_final, sigma=args.sigma, sda_mask=True,
+        n_threads=args.threads,
+        precision=args.precision)
     SDA.run()
     # HR volume contains updated mask based on SDA
     HR_volume_final = SDA.get_reconstruction()
@@ -30,6 +30,7 @@ import niftymic.utilities.intensity_correction as ic
 import niftymic.utilities.joint_image_mask_builder as imb
 import niftymic.utilities.segmentation_propagation as segprop
 import niftymic.utilities.volumetric_reconstruction_pipeline as pipeline
+import niftymic.utilities.scratch_directory as scratch
 from niftymic.utilities.input_arparser import InputArgparser
 
 from niftymic.definitions import V2V_METHOD_OPTIONS, ALLOWED_EXTENSIONS
@@ -136,10 +137,13 @@ def main():
         default="Rigid",
         required=False)
     
+    input_parser.add_tmp_dir()
 
     args = input_parser.parse_args()
     input_parser.print_arguments(args)
 
+    scratch.set_root(args.tmp_dir)
+
     rejection_measure = "NCC"
     threshold_v2v = -2  # 0.3
     debug = False
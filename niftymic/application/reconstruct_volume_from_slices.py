@@ -67,6 +67,12 @@ def main():
     input_parser.add_iterations(default=15)
     input_parser.add_log_config(default=1)
     input_parser.add_use_masks_srr(default=0)
+    input_parser.add_threads(default=1)
+    input_parser.add_use_system_matrix(default=0)
+    input_parser.add_use_separable_psf(default=0)
+    input_parser.add_compress_unknowns(default=0)
+    input_parser.add_precision(default="float64")
+    input_parser.add_preconditioner(default=None)
     input_parser.add_slice_thicknesses(default=None)
     input_parser.add_verbose(default=0)
     input_parser.add_viewer(default="itksnap")
@@ -91,6 +97,10 @@ def main():
     if args.reconstruction_type not in ["TK1L2", "TVL2", "HuberL2"]:
         raise IOError("Reconstruction type unknown")
 
+    if args.precision != "float64" and not args.use_system_matrix:
+        raise ValueError(
+            "Precision '%s' requires --use-system-matrix" % args.precision)
+
     if np.alltrue([not args.output.endswith(t) for t in ALLOWED_EXTENSIONS]):
         raise ValueError(
             "output filename '%s' invalid; "
@@ -217,7 +227,9 @@ def main():
     if args.sda:
         ph.print_title("Compute SDA reconstruction")
         SDA = sda.ScatteredDataApproximation(
-            stacks, recon0, sigma=args.alpha, sda_mask=args.mask)
+            stacks, recon0, sigma=args.alpha, sda_mask=args.mask,
+            n_threads=args.threads,
+            precision=args.precision)
         SDA.run()
         recon = SDA.get_reconstruction()
         filename = SDA.get_setting_specific_filename()
@@ -235,7 +247,9 @@ def main():
         if args.reconstruction_type in ["TVL2", "HuberL2"]:
             ph.print_title(
                 "Compute Initial value for %s" % args.reconstruction_type)
-            SRR0 = sda.ScatteredDataApproximation(stacks, recon0, sigma=0.8)
+            SRR0 = sda.ScatteredDataApproximation(
+                stacks, recon0, sigma=0.8, n_threads=args.threads,
+                precision=args.precision)
         else:
             ph.print_title(
                 "Compute %s reconstruction" % args.reconstruction_type)
@@ -249,6 +263,12 @@ def main():
                 data_loss=args.data_loss,
                 data_loss_scale=args.data_loss_scale,
                 use_masks=args.use_masks_srr,
+                n_threads=args.threads,
+                use_system_matrix=args.use_system_matrix,
+                use_separable_psf=args.use_separable_psf,
+                compress_unknowns=args.compress_unknowns,
+                precision=args.precision,
+                preconditioner=args.preconditioner,
                 # verbose=args.verbose,
             )
         SRR0.run()
@@ -287,6 +307,11 @@ def main():
                     iterations=args.iterations,
                     use_masks=args.use_masks_srr,
                     verbose=args.verbose,
+                    n_threads=args.threads,
+                    use_system_matrix=args.use_system_matrix,
+                    use_separable_psf=args.use_separable_psf,
+                    compress_unknowns=args.compress_unknowns,
+                    precision=args.precision,
                 )
 
             else:
@@ -303,6 +328,11 @@ def main():
                     data_loss=args.data_loss,
                     use_masks=args.use_masks_srr,
                     verbose=args.verbose,
+                    n_threads=args.threads,
+                    use_system_matrix=args.use_system_matrix,
+                    use_separable_psf=args.use_separable_psf,
+                    compress_unknowns=args.compress_unknowns,
+                    precision=args.precision,
                 )
             SRR.run()
             recon = SRR.get_reconstruction()
@@ -19,9 +19,10 @@ import niftymic.base.stack as st
 import niftymic.base.data_reader as dr
 import niftymic.registration.niftyreg as niftyreg
 import niftymic.registration.transform_initializer as tinit
+import niftymic.utilities.scratch_directory as scratch
 from niftymic.utilities.input_arparser import InputArgparser
 
-from niftymic.definitions import REGEX_FILENAMES, DIR_TMP
+from niftymic.definitions import REGEX_FILENAMES
 
 
 def main():
@@ -67,10 +68,13 @@ def main():
     input_parser.add_dir_input_mc()
     input_parser.add_verbose(default=0)
     input_parser.add_log_config(default=1)
+    input_parser.add_tmp_dir()
 
     args = input_parser.parse_args()
     input_parser.print_arguments(args)
 
+    scratch.set_root(args.tmp_dir)
+
     if args.log_config:
         input_parser.log_config(os.path.abspath(__file__))
 
@@ -102,7 +106,7 @@ def main():
         extract_slices=False)
 
     path_to_tmp_output = os.path.join(
-        DIR_TMP,
+        scratch.get_directory(),
         ph.append_to_filename(os.path.basename(args.moving), "_warped"))
 
     # ---------------------------- Initialization ----------------------------
@@ -136,7 +140,7 @@ def main():
     if args.method == "RegAladin" and not args.init_pca:
 
         path_to_transform_regaladin = os.path.join(
-            DIR_TMP, "transform_regaladin.txt")
+            scratch.get_directory(), "transform_regaladin.txt")
 
         # Convert SimpleITK to RegAladin transform
         if transform_init_sitk is not None:
@@ -175,7 +179,8 @@ def main():
         ph.execute_command(cmd, verbose=False)
 
     elif args.method == "FLIRT":
-        path_to_transform_flirt = os.path.join(DIR_TMP, "transform_flirt.txt")
+        path_to_transform_flirt = os.path.join(
+            scratch.get_directory(), "transform_flirt.txt")
 
         # Convert SimpleITK into FLIRT transform
         if transform_init_sitk is not None:
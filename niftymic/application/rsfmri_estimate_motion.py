@@ -25,6 +25,7 @@ import niftymic.utilities.data_preprocessing as dp
 import niftymic.utilities.joint_image_mask_builder as imb
 import niftymic.utilities.segmentation_propagation as segprop
 import niftymic.utilities.volumetric_reconstruction_pipeline as pipeline
+import niftymic.utilities.scratch_directory as scratch
 from niftymic.utilities.input_arparser import InputArgparser
 
 from niftymic.definitions import V2V_METHOD_OPTIONS
@@ -70,6 +71,7 @@ def main():
     input_parser.add_target_stack_index(default=0)
     input_parser.add_two_step_cycles(default=3)
     input_parser.add_use_masks_srr(default=0)
+    input_parser.add_threads(default=1)
     input_parser.add_verbose(default=0)
     input_parser.add_v2v_method(default="RegAladin")
     input_parser.add_outlier_rejection(default=1)
@@ -84,10 +86,13 @@ def main():
         "iterative adjustment. "
         "Recommended value is, e.g., --alpha 0.8"
     )
+    input_parser.add_tmp_dir()
 
     args = input_parser.parse_args()
     input_parser.print_arguments(args)
 
+    scratch.set_root(args.tmp_dir)
+
     if args.v2v_method not in V2V_METHOD_OPTIONS:
         raise ValueError("v2v-method must be in {%s}" % (
             ", ".join(V2V_METHOD_OPTIONS)))
@@ -207,6 +212,7 @@ def main():
                 reference=stacks_srr[0],
                 registration_method=registration_v2v,
                 verbose=args.verbose,
+                n_threads=args.threads,
             )
             v2vreg.run()
             stacks_srr = v2vreg.get_stacks()
@@ -230,6 +236,7 @@ def main():
             HR_volume=reference,
             sigma=args.sigma,
             use_masks=args.use_masks_srr,
+            n_threads=args.threads,
         )
         SDA.run()
         reference = SDA.get_reconstruction()
@@ -263,6 +270,7 @@ def main():
                     HR_volume=reference,
                     sigma=args.sigma,
                     use_masks=args.use_masks_srr,
+                    n_threads=args.threads,
                 )
                 alpha_range = [args.sigma, args.alpha]
             else:
@@ -298,6 +306,7 @@ def main():
                     verbose=args.verbose,
                     outlier_rejection=args.outlier_rejection,
                     thresholds=thresholds,
+                    n_threads=args.threads,
                 )
             two_step_s2v_reg_recon.run()
             reference_iterations = \
@@ -320,6 +329,7 @@ def main():
                 reference,
                 sigma=args.alpha,
                 use_masks=args.use_masks_srr,
+                n_threads=args.threads,
             )
         else:
             if args.reconstruction_type in ["TVL2", "HuberL2"]:
@@ -346,7 +356,8 @@ def main():
 
         ph.print_subtitle("Final SDA Approximation Image Mask")
         SDA = sda.ScatteredDataApproximation(
-            stacks_srr, reference, sigma=args.sigma, sda_mask=True)
+            stacks_srr, reference, sigma=args.sigma, sda_mask=True,
+            n_threads=args.threads)
         SDA.run()
         # Reference contains updated mask based on SDA
         reference = SDA.get_reconstruction()
@@ -378,6 +389,7 @@ def main():
         reference=reference,
         registration_method=registration_v2v,
         verbose=False,
+        n_threads=args.threads,
     )
     v2vreg.run()
     time_v2v_reg = v2vreg.get_computational_time()
@@ -388,6 +400,7 @@ def main():
         reference=reference,
         registration_method=registration_s2v,
         verbose=False,
+        n_threads=args.threads,
     )
     s2vreg.run()
     time_s2v_reg = s2vreg.get_computational_time()
@@ -96,12 +96,24 @@ def main():
         default=0,
     )
     input_parser.add_use_masks_srr(default=1)
+    input_parser.add_threads(
+        help="Number of worker processes reconstructing individual time "
+        "points concurrently (beta < 0) or of worker threads evaluating the "
+        "time point blocks of the temporal regularization (beta >= 0). Each "
+        "worker holds its own solver and reconstruction in memory.",
+    )
+    input_parser.add_use_system_matrix(default=0)
+    input_parser.add_precision()
     input_parser.add_log_config(default=1)
     input_parser.add_verbose(default=0)
 
     args = input_parser.parse_args()
     input_parser.print_arguments(args)
 
+    if args.precision != "float64" and not args.use_system_matrix:
+        raise ValueError(
+            "Precision '%s' requires --use-system-matrix" % args.precision)
+
     # Write script execution call
     if args.log_config:
         input_parser.log_config(os.path.abspath(__file__))
@@ -171,6 +183,7 @@ def main():
                     reg_type="TV" if args.reconstruction_type == "TVL2" else "huber",
                     iterations=args.iterations,
                     use_masks=args.use_masks_srr,
+                    use_system_matrix=args.use_system_matrix,
                 )
             else:
                 recon_method = tk.TikhonovSolver(
@@ -178,22 +191,29 @@ def main():
                     reconstruction=reconstruction_space,
                     reg_type="TK1" if args.reconstruction_type == "TK1L2" else "TK0",
                     use_masks=args.use_masks_srr,
+                    use_system_matrix=args.use_system_matrix,
                 )
             recon_method.set_alpha(args.alpha)
             recon_method.set_iter_max(args.iter_max)
             recon_method.set_verbose(True)
 
+            # Reconstructed timepoints are added to the writer in order as
+            # soon as they are available
+            description = recon_method.get_setting_specific_filename()
+            data_writer = dw.MultiComponentImageWriter(
+                [], args.output, description=description)
+
             # ------Update individual timepoints based on updated slice positio
             multi_component_reconstruction = pipeline.MultiComponentReconstruction(
                 stacks=stacks,
                 reconstruction_method=recon_method,
-                suffix="_recon_v2v")
+                suffix="_recon_v2v",
+                n_processes=args.threads,
+                data_writer=data_writer,
+            )
             multi_component_reconstruction.run()
             time_reconstruction = \
                 multi_component_reconstruction.get_computational_time()
-            stacks_recon = multi_component_reconstruction.get_reconstructions()
-            description = multi_component_reconstruction.\
-                get_reconstruction_method().get_setting_specific_filename()
 
         else:
             if not args.reconstruction_type in ["TK0L2", "TK1L2"]:
@@ -209,16 +229,18 @@ def main():
                 alpha=args.alpha,
                 iter_max=args.iter_max,
                 verbose=True,
+                n_threads=args.threads,
+                use_system_matrix=args.use_system_matrix,
+                precision=args.precision,
             )
             recon_method.run()
             time_reconstruction = recon_method.get_computational_time()
-            stacks_recon = recon_method.get_reconstructions()
-            description = recon_method.get_setting_specific_filename()
+            data_writer = dw.MultiComponentImageWriter(
+                recon_method.get_reconstructions(), args.output,
+                description=recon_method.get_setting_specific_filename())
 
     # --------------------------------Write Data------------------------------
     ph.print_title("Write Data")
-    data_writer = dw.MultiComponentImageWriter(
-        stacks_recon, args.output, description=description)
     data_writer.write_data()
 
     if args.verbose:
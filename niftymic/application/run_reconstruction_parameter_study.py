@@ -18,6 +18,8 @@ import niftymic.base.data_reader as dr
 import niftymic.base.stack as st
 import niftymic.reconstruction.tikhonov_solver as tk
 import niftymic.reconstruction.scattered_data_approximation as sda
+import niftymic.reconstruction.parallel_solver_parameter_study as \
+    parallel_study
 from niftymic.utilities.input_arparser import InputArgparser
 
 
@@ -60,6 +62,18 @@ def main():
     input_parser.add_use_masks_srr(default=0)
     input_parser.add_verbose(default=1)
     input_parser.add_slice_thicknesses(default=None)
+    input_parser.add_threads(
+        help="Number of parameter configurations solved concurrently. All "
+        "workers share the same slice acquisition model; use it together "
+        "with '--use-system-matrix' so that the operators can be evaluated "
+        "concurrently.",
+        default=1)
+    input_parser.add_use_system_matrix(default=0)
+    input_parser.add_warm_start(
+        help="Turn on/off warm start of the parameter sweep. Configurations "
+        "differing only in alpha are solved from largest to smallest alpha "
+        "using the previous solution as initial value.",
+        default=0)
     input_parser.add_argument(
         "--append", "-append",
         action='store_true',
@@ -168,44 +182,69 @@ def main():
         minimizer=args.minimizer,
         verbose=args.verbose,
         use_masks=args.use_masks_srr,
+        use_system_matrix=args.use_system_matrix,
     )
     solver = tmp.get_solver()
 
+    # Settings shared by all solvers of the study
+    solver_kwargs = dict(
+        A=solver.get_A(),
+        A_adj=solver.get_A_adj(),
+        D=solver.get_B(),
+        D_adj=solver.get_B_adj(),
+        b=solver.get_b(),
+        x0=solver.get_x0(),
+        alpha=solver.get_alpha(),
+        x_scale=solver.get_x_scale(),
+        data_loss=solver.get_data_loss(),
+        data_loss_scale=solver.get_data_loss_scale(),
+        iter_max=solver.get_iter_max(),
+        minimizer=solver.get_minimizer(),
+        iterations=args.iterations,
+        measures=args.measures,
+        dimension=3,
+        L2=16. / reconstruction_space.sitk.GetSpacing()[0]**2,
+        reconstruction_type=args.reconstruction_type,
+        rho=args.rho,
+        x_ref=x_ref,
+        x_ref_mask=x_ref_mask,
+        tv_solver=args.tv_solver,
+        verbose=args.verbose,
+        append=args.append,
+    )
+
     parameter_study_interface = \
         deconv_interface.DeconvolutionParameterStudyInterface(
-            A=solver.get_A(),
-            A_adj=solver.get_A_adj(),
-            D=solver.get_B(),
-            D_adj=solver.get_B_adj(),
-            b=solver.get_b(),
-            x0=solver.get_x0(),
-            alpha=solver.get_alpha(),
-            x_scale=solver.get_x_scale(),
-            data_loss=solver.get_data_loss(),
-            data_loss_scale=solver.get_data_loss_scale(),
-            iter_max=solver.get_iter_max(),
-            minimizer=solver.get_minimizer(),
-            iterations=args.iterations,
-            measures=args.measures,
-            dimension=3,
-            L2=16. / reconstruction_space.sitk.GetSpacing()[0]**2,
-            reconstruction_type=args.reconstruction_type,
-            rho=args.rho,
             dir_output=args.dir_output,
             parameters=parameters,
             name=name,
             reconstruction_info=reconstruction_info,
-            x_ref=x_ref,
-            x_ref_mask=x_ref_mask,
-            tv_solver=args.tv_solver,
-            verbose=args.verbose,
-            append=args.append,
+            **solver_kwargs
         )
     parameter_study_interface.set_up_parameter_study()
     parameter_study = parameter_study_interface.get_parameter_study()
 
+    if args.threads > 1 or args.warm_start:
+        def get_solver():
+            solver_interface = \
+                deconv_interface.DeconvolutionSolverStudyInterface(
+                    **solver_kwargs)
+            solver_interface.set_up_solver()
+            return solver_interface.get_solver()
+
+        parameter_study = parallel_study.ParallelSolverParameterStudy(
+            parameter_study=parameter_study,
+            get_solver=get_solver,
+            measures=parameter_study_interface.get_measures(),
+            n_threads=args.threads,
+            warm_start=args.warm_start,
+        )
+
     # Run parameter study
-    parameter_study.run()
+    try:
+        parameter_study.run()
+    finally:
+        tmp.close()
 
     print("\nComputational time for Deconvolution Parameter Study %s: %s" %
           (name, parameter_study.get_computational_time()))
@@ -22,6 +22,7 @@ import niftymic.application.show_slice_coverage as show_slice_coverage
 import niftymic.validation.export_side_by_side_simulated_vs_original_slice_comparison as \
     export_side_by_side_simulated_vs_original_slice_comparison
 import niftymic.utilities.target_stack_estimator as ts_estimator
+import niftymic.utilities.scratch_directory as scratch
 from niftymic.utilities.input_arparser import InputArgparser
 import niftymic.utilities.template_stack_estimator as tse
 
@@ -144,10 +145,13 @@ def main():
         "reference/target stack.",
         default=1,
     )
+    input_parser.add_tmp_dir()
 
     args = input_parser.parse_args()
     input_parser.print_arguments(args)
 
+    scratch.set_root(args.tmp_dir)
+
     if args.template is not None:
         if args.template_mask is None:
             raise ValueError(
@@ -265,6 +269,8 @@ def main():
         cmd_args.append("--threshold %f" % args.threshold)
         cmd_args.append("--verbose %d" % args.verbose)
         cmd_args.append("--log-config %d" % args.log_config)
+        if args.tmp_dir is not None:
+            cmd_args.append("--tmp-dir '%s'" % args.tmp_dir)
 
         if args.isotropic_resolution is not None:
             isotropic_resolution = args.isotropic_resolution
@@ -351,6 +357,8 @@ def main():
         cmd_args.append("--output '%s'" % trafo_template)
         cmd_args.append("--verbose %s" % args.verbose)
         cmd_args.append("--log-config %d" % args.log_config)
+        if args.tmp_dir is not None:
+            cmd_args.append("--tmp-dir '%s'" % args.tmp_dir)
         if args.initial_transform is None:
             cmd_args.append("--init-pca")
         else:
@@ -8,6 +8,7 @@
 
 import os
 import sys
+import collections
 import numpy as np
 import SimpleITK as sitk
 from abc import ABCMeta, abstractmethod
@@ -134,6 +135,10 @@ class MultipleStacksWriter(StacksWriter):
                         suffix_mask=self._suffix_mask)
 
 
+# Image data of a component added to MultiComponentImageWriter
+_Component = collections.namedtuple("_Component", ["sitk", "sitk_mask"])
+
+
 class MultiComponentImageWriter(StacksWriter):
 
     def __init__(self,
@@ -155,6 +160,25 @@ class MultiComponentImageWriter(StacksWriter):
     def set_filename(self, filename):
         self._filename = filename
 
+    ##
+    # Adds a component to the components to be written, e.g. as soon as its
+    # reconstruction is available. Only the image (and mask) data are kept,
+    # in the data types they are written with.
+    # \date       2026-10-17 06:23:52+0000
+    #
+    # \param      self   The object
+    # \param      stack  Stack object
+    #
+    def add_stack(self, stack):
+        image_sitk = stack.sitk
+        image_sitk_mask = stack.sitk_mask if self._write_mask else None
+        if self._compress:
+            if not "integer" in image_sitk.GetPixelIDTypeAsString():
+                image_sitk = sitk.Cast(image_sitk, sitk.sitkFloat32)
+            if image_sitk_mask is not None:
+                image_sitk_mask = sitk.Cast(image_sitk_mask, sitk.sitkUInt8)
+        self._stacks.append(_Component(image_sitk, image_sitk_mask))
+
     def write_data(self):
 
         if self._filename is None:
@@ -23,6 +23,11 @@ from niftymic.definitions import VIEWER
 #  also contains additional variables helpful to work with the data
 class Slice:
 
+    def __init__(self):
+        # Incremented whenever the position of the slice in physical space
+        # changes so that cached geometry information can be invalidated
+        self._motion_correction_version = 0
+
     # Create Slice instance with additional information to actual slice
     #  \param[in] slice_sitk 3D slice in \R x \R x 1, sitk.Image object
     #  \param[in] filename of parent stack, string
@@ -293,6 +298,18 @@ class Slice:
     def get_motion_correction_transform(self):
         return self._history_motion_corrections[-1]
 
+    ##
+    # Gets the motion correction version, i.e. a counter that is incremented
+    # every time the slice position in physical space gets updated.
+    # \date       2026-10-17 05:09:01+0000
+    #
+    # \param      self  The object
+    #
+    # \return     The motion correction version as integer.
+    #
+    def get_motion_correction_version(self):
+        return self._motion_correction_version
+
     # Get history history of affine transforms, i.e. encoded spatial
     #  position+orientation of slice, and rigid motion estimates of slice
     #  obtained in the course of the registration/reconstruction process
@@ -404,6 +421,9 @@ class Slice:
         # Append transform to registration history
         self._history_affine_transforms.append(affine_transform_sitk)
 
+        # Invalidate cached geometry information of slice
+        self._motion_correction_version += 1
+
         # Get origin and direction of transformed 3D slice given the new
         # spatial transform
         origin = sitkh.get_sitk_image_origin_from_sitk_affine_transform(
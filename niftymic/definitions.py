@@ -23,3 +23,4 @@ TEMPLATES_INFO = "templates_info.json"
 VIEWER = ITKSNAP_EXE
 VIEWER_OPTIONS = ["itksnap", "fsleyes"]
 V2V_METHOD_OPTIONS = ["FLIRT", "RegAladin"]
+PRECISION_OPTIONS = ["float64", "float32"]
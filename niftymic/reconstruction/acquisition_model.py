@@ -0,0 +1,513 @@
+##
+# \file acquisition_model.py
+# \brief      Slice acquisition model M A shared by several solvers, i.e.
+#             per-slice geometry, masked slice data M y and sparse system
+#             matrix together with their caches.
+#
+# \author     agent (agent@local)
+# \date       October 2026
+#
+
+
+# Import libraries
+import itk
+import threading
+import SimpleITK as sitk
+import numpy as np
+import scipy.sparse
+
+import pysitk.python_helper as ph
+
+import niftymic.reconstruction.linear_operators as lin_op
+
+
+##
+# Class holding the quantities of the slice acquisition model which are
+# independent of a particular solver, i.e. the slice geometry (slice spacing
+# and PSF covariance in reconstruction space), the masked slice data M y and
+# the sparse system matrix M A.
+#
+# All quantities are computed on demand and cached per slice. Cache entries
+# are versioned by the slice motion correction, slice data and mask and the
+# reconstruction grid so that they are invalidated automatically. Solvers
+# sharing the model by reference, e.g. the solvers of the two-step cycles and
+# the final reconstruction, reuse them instead of recomputing them. Shared
+# solvers are expected to operate on the same slices; cache entries of slices
+# not requested anymore are dropped.
+# \date       2026-10-17 05:49:29+0000
+#
+class AcquisitionModel(object):
+
+    ##
+    # Store settings of the slice acquisition model
+    # \date       2026-10-17 05:49:52+0000
+    #
+    # \param      self                   The object
+    # \param      alpha_cut              Cut-off distance for Gaussian
+    #                                    blurring filter
+    # \param      deconvolution_mode     Either "full_3D" or "only_in_plane".
+    #                                    Indicates whether full 3D or only
+    #                                    in-plane deconvolution is considered
+    # \param      predefined_covariance  Either only diagonal entries
+    #                                    (sigma_x2, sigma_y2, sigma_z2) or as
+    #                                    full 3x3 numpy array
+    # \param      image_type             itk.Image type
+    #
+    def __init__(self,
+                 alpha_cut=3,
+                 deconvolution_mode="full_3D",
+                 predefined_covariance=None,
+                 image_type=itk.Image.D3,
+                 ):
+
+        self._alpha_cut = alpha_cut
+        self._deconvolution_mode = deconvolution_mode
+        self._predefined_covariance = predefined_covariance
+        self._image_type = image_type
+
+        self._linear_operators = lin_op.LinearOperators(
+            deconvolution_mode=deconvolution_mode,
+            predefined_covariance=predefined_covariance,
+            alpha_cut=alpha_cut,
+            image_type=image_type,
+        )
+        self._itk2np = itk.PyBuffer[image_type]
+
+        # Cache holding slice spacing and PSF covariance in reconstruction
+        # space for each slice, i.e. {slice: (version, grid_signature,
+        # slice_spacing, cov)}
+        self._slice_geometry = {}
+
+        # Masked slice data M y of all slices stacked to 1D array, the
+        # settings it was computed for and the location of each slice
+        # within, i.e. {slice: (slice_itk, slice_itk_mask, i_min, i_max)}.
+        # M y stays valid across motion correction updates as long as slice
+        # data and mask are not replaced
+        self._M_y = None
+        self._M_y_settings = None
+        self._M_y_blocks = {}
+        self._M_y_lock = threading.Lock()
+
+        # Sparse system matrix M A together with the signature of the slice
+        # geometry and the slice masks (compared by identity) it was
+        # assembled for
+        self._system_matrix = None
+        self._system_matrix_signature = None
+        self._system_matrix_masks = []
+
+        # Cache holding the row blocks M_k A_k of the system matrix so that
+        # only blocks of moved slices need to be reassembled, i.e.
+        # {slice: (signature, block, slice_sitk_mask)}. The mask is compared
+        # by identity
+        self._system_matrix_blocks = {}
+        self._system_matrix_lock = threading.Lock()
+
+    def get_alpha_cut(self):
+        return self._alpha_cut
+
+    def get_deconvolution_mode(self):
+        return self._deconvolution_mode
+
+    def get_predefined_covariance(self):
+        return self._predefined_covariance
+
+    def get_image_type(self):
+        return self._image_type
+
+    def get_linear_operators(self):
+        return self._linear_operators
+
+    ##
+    # Check whether the model describes the acquisition assumed by the given
+    # settings, i.e. whether a solver using them can share the model.
+    # \date       2026-10-17 05:50:15+0000
+    #
+    # \param      self                   The object
+    # \param      alpha_cut              Cut-off distance for Gaussian
+    #                                    blurring filter
+    # \param      deconvolution_mode     Either "full_3D" or "only_in_plane"
+    # \param      predefined_covariance  Predefined covariance or None
+    # \param      image_type             itk.Image type
+    #
+    # \return     True if compatible, False otherwise
+    #
+    def is_compatible(self,
+                      alpha_cut,
+                      deconvolution_mode,
+                      predefined_covariance,
+                      image_type):
+        if predefined_covariance is None or \
+                self._predefined_covariance is None:
+            covariance_match = predefined_covariance is None and \
+                self._predefined_covariance is None
+        else:
+            covariance_match = np.array_equal(
+                predefined_covariance, self._predefined_covariance)
+
+        return covariance_match and \
+            alpha_cut == self._alpha_cut and \
+            deconvolution_mode == self._deconvolution_mode and \
+            image_type == self._image_type
+
+    ##
+    # Gets the signature of a reconstruction grid which the cached slice
+    # geometries and system matrix blocks are expressed in.
+    # \date       2026-10-17 05:50:38+0000
+    #
+    # \param      image_sitk  Reconstruction image as sitk.Image object
+    #
+    # \return     Tuple of origin, spacing, direction and size
+    #
+    @staticmethod
+    def get_grid_signature(image_sitk):
+        return (
+            image_sitk.GetOrigin(),
+            image_sitk.GetSpacing(),
+            image_sitk.GetDirection(),
+            image_sitk.GetSize(),
+        )
+
+    ##
+    # Gets the slice spacing and the PSF covariance in reconstruction space of
+    # a slice.
+    #
+    # Values are cached per slice and recomputed only if the slice position
+    # was updated since, as indicated by its motion correction version, or
+    # the reconstruction grid changed.
+    # \date       2026-10-17 05:51:01+0000
+    #
+    # \param      self                The object
+    # \param      slice_k             Slice object
+    # \param      reconstruction_itk  Reconstruction image as itk.Image object
+    # \param      grid_signature      Signature of reconstruction grid, see
+    #                                 get_grid_signature
+    #
+    # \return     slice spacing as 1D numpy array and covariance as 3x3 numpy
+    #             array
+    #
+    def get_slice_geometry(self, slice_k, reconstruction_itk, grid_signature):
+
+        version = slice_k.get_motion_correction_version()
+        geometry = self._slice_geometry.get(slice_k)
+        if geometry is not None and geometry[0] == version and \
+                geometry[1] == grid_signature:
+            return geometry[2], geometry[3]
+
+        # Get slice spacing relevant for Gaussian blurring estimate
+        in_plane_res = slice_k.get_inplane_resolution()
+        slice_thickness = slice_k.get_slice_thickness()
+        slice_spacing = np.array([in_plane_res, in_plane_res, slice_thickness])
+
+        # Covariance describing PSF orientation of slice in reconstruction
+        # space
+        cov = self._linear_operators.get_covariance(
+            reconstruction_itk, slice_k.itk, np.array(slice_spacing))
+
+        self._slice_geometry[slice_k] = (
+            version, grid_signature, slice_spacing, cov)
+
+        return slice_spacing, cov
+
+    ##
+    # Update the slice geometry cache for the given slices. Entries of slices
+    # which are no longer used are dropped.
+    # \date       2026-10-17 05:51:24+0000
+    #
+    # \param      self                The object
+    # \param      slices              List of Slice objects
+    # \param      reconstruction_itk  Reconstruction image as itk.Image object
+    # \param      grid_signature      Signature of reconstruction grid, see
+    #                                 get_grid_signature
+    #
+    def update_slice_geometry(self,
+                              slices,
+                              reconstruction_itk,
+                              grid_signature):
+
+        slices_set = set(slices)
+        self._slice_geometry = {
+            s: g for s, g in self._slice_geometry.items() if s in slices_set
+        }
+
+        for slice_k in slices:
+            self.get_slice_geometry(
+                slice_k, reconstruction_itk, grid_signature)
+
+    ##
+    # Gets the masked slice data M y of the given slices stacked to a 1D
+    # array.
+    #
+    # The array is shared by all callers and must not be modified. It is only
+    # reallocated if slices were added, removed or reordered, or their data or
+    # mask replaced; the blocks of unchanged slices are then copied over
+    # instead of being recomputed.
+    # \date       2026-10-17 05:51:47+0000
+    #
+    # \param      self       The object
+    # \param      slices     List of Slice objects
+    # \param      N          Length of the stacked slice vector
+    # \param      use_masks  Apply the slice masks, boolean
+    # \param      dtype      Data type of the array
+    #
+    # \return     My, i.e. all masked slices stacked to read-only 1D array
+    #
+    def get_M_y(self, slices, N, use_masks=True, dtype=np.float64):
+
+        settings = (bool(use_masks), np.dtype(dtype), N)
+
+        with self._M_y_lock:
+            if settings == self._M_y_settings:
+                M_y_blocks = self._M_y_blocks
+            else:
+                M_y_blocks = {}
+
+            # Define location of each slice and check whether it is unchanged
+            slices_ranges = []
+            up_to_date = settings == self._M_y_settings and \
+                len(slices) == len(M_y_blocks)
+            i_min = 0
+            for slice_k in slices:
+                i_max = i_min + np.array(slice_k.sitk.GetSize()).prod()
+                slices_ranges.append((slice_k, i_min, i_max))
+                cached = M_y_blocks.get(slice_k)
+                up_to_date = up_to_date and cached is not None and \
+                    cached[0] is slice_k.itk and \
+                    cached[1] is slice_k.itk_mask and \
+                    cached[2] == i_min
+                i_min = i_max
+
+            if up_to_date:
+                return self._M_y
+
+            # Allocate new memory as previously returned arrays may still be
+            # in use
+            My = np.zeros(N, dtype=settings[1])
+            blocks = {}
+            for slice_k, i_min, i_max in slices_ranges:
+                cached = M_y_blocks.get(slice_k)
+                if cached is not None and \
+                        cached[0] is slice_k.itk and \
+                        cached[1] is slice_k.itk_mask:
+                    My[i_min:i_max] = self._M_y[cached[2]:cached[3]]
+                else:
+                    My[i_min:i_max] = self._get_M_y_block(slice_k, use_masks)
+                blocks[slice_k] = (
+                    slice_k.itk, slice_k.itk_mask, i_min, i_max)
+            My.flags.writeable = False
+
+            self._M_y = My
+            self._M_y_settings = settings
+            self._M_y_blocks = blocks
+
+        return My
+
+    ##
+    # Gets the sparse system matrix M A of the given slices.
+    #
+    # The matrix is assembled on first use and reassembled only once slices
+    # were moved, removed, the masking setting or the reconstruction grid
+    # changed. In that case, only the row blocks of the affected slices are
+    # reassembled.
+    # \date       2026-10-17 05:52:10+0000
+    #
+    # \param      self                The object
+    # \param      slices              List of Slice objects
+    # \param      N                   Number of rows, i.e. length of the
+    #                                 stacked slice vector. Rows beyond the
+    #                                 given slices, e.g. of deleted slices,
+    #                                 are zero
+    # \param      reconstruction_itk  Reconstruction image as itk.Image object
+    # \param      grid_signature      Signature of reconstruction grid, see
+    #                                 get_grid_signature
+    # \param      use_masks           Apply the slice masks, boolean
+    # \param      dtype               Data type of the matrix
+    # \param      memory_limit        Memory limit in bytes
+    # \param      map_func            Function to evaluate the assembly of
+    #                                 chunks of row blocks, i.e.
+    #                                 map_func(func, N) returning [func(0),
+    #                                 ..., func(N-1)]
+    # \param      n_threads           Number of chunks to split the assembly
+    #                                 into
+    # \param      verbose             Verbose output, boolean
+    #
+    # \return     System matrix as scipy.sparse.csr_matrix; None if it exceeds
+    #             the memory limit
+    #
+    def get_system_matrix(self,
+                          slices,
+                          N,
+                          reconstruction_itk,
+                          grid_signature,
+                          use_masks=True,
+                          dtype=np.float64,
+                          memory_limit=np.inf,
+                          map_func=lambda func, N: [func(i) for i in range(N)],
+                          n_threads=1,
+                          verbose=False,
+                          ):
+        with self._system_matrix_lock:
+            return self._get_system_matrix(
+                slices, N, reconstruction_itk, grid_signature, use_masks,
+                np.dtype(dtype), memory_limit, map_func, n_threads, verbose)
+
+    def _get_system_matrix(self,
+                           slices,
+                           N,
+                           reconstruction_itk,
+                           grid_signature,
+                           use_masks,
+                           dtype,
+                           memory_limit,
+                           map_func,
+                           n_threads,
+                           verbose,
+                           ):
+
+        signature = (N, use_masks, dtype, grid_signature, tuple(
+            (slice_k, slice_k.get_motion_correction_version())
+            for slice_k in slices))
+        masks = [slice_k.sitk_mask for slice_k in slices]
+        if signature == self._system_matrix_signature and all(
+                mask is mask_prev for mask, mask_prev in zip(
+                    masks, self._system_matrix_masks)):
+            return self._system_matrix
+        self._system_matrix_signature = signature
+        self._system_matrix_masks = masks
+
+        # Estimate memory requirement of CSR format, i.e. 8 (double) or 4
+        # (single precision) bytes for each value and 4 bytes for each column
+        # index. The cached row blocks require the same amount again
+        nnz = 0
+        for slice_k in slices:
+            if use_masks:
+                N_rows = np.count_nonzero(
+                    sitk.GetArrayFromImage(slice_k.sitk_mask))
+            else:
+                N_rows = np.array(slice_k.sitk.GetSize()).prod()
+            nnz += self._linear_operators.get_A_sparse_nnz_estimate(
+                reconstruction_itk,
+                self.get_slice_geometry(
+                    slice_k, reconstruction_itk, grid_signature)[1],
+                N_rows)
+        memory = 2 * (dtype.itemsize + 4) * nnz
+        if memory > memory_limit:
+            if verbose:
+                ph.print_warning(
+                    "System matrix requires up to %.1f GB (limit: %.1f GB). "
+                    "Filter-based operators are used instead." % (
+                        memory / 1024.**3, memory_limit / 1024.**3))
+            self._system_matrix = None
+            self._system_matrix_blocks = {}
+            return None
+
+        time_start = ph.start_timing()
+
+        # Reuse the cached row blocks of slices which were not moved since
+        # their assembly
+        system_matrix_blocks = {}
+        slices_update = []
+        for slice_k in slices:
+            signature_k = (
+                slice_k.get_motion_correction_version(),
+                use_masks,
+                dtype,
+                grid_signature,
+            )
+            cached = self._system_matrix_blocks.get(slice_k)
+            if cached is not None and cached[0] == signature_k and \
+                    cached[2] is slice_k.sitk_mask:
+                system_matrix_blocks[slice_k] = cached
+            else:
+                slices_update.append((slice_k, signature_k))
+
+        # Assemble row blocks of moved or new slices
+        N_chunks = max(1, min(n_threads, len(slices_update)))
+        chunks_update = [
+            [slices_update[k] for k in indices]
+            for indices in np.array_split(
+                np.arange(len(slices_update)), N_chunks)
+        ]
+        blocks = map_func(
+            lambda i: [
+                (slice_k, (signature_k, self._get_system_matrix_block(
+                    slice_k, reconstruction_itk, grid_signature, use_masks,
+                    dtype), slice_k.sitk_mask))
+                for slice_k, signature_k in chunks_update[i]],
+            len(chunks_update))
+        for blocks_chunk in blocks:
+            system_matrix_blocks.update(blocks_chunk)
+
+        # Blocks of deleted slices are dropped
+        self._system_matrix_blocks = system_matrix_blocks
+
+        # Row blocks are stacked in the order of the slices, i.e. at the
+        # index ranges of the stacked slice vector. Rows of deleted slices
+        # at its end remain zero so that M A x matches the length of M y
+        blocks = [system_matrix_blocks[slice_k][1] for slice_k in slices]
+        N_rows = sum(block.shape[0] for block in blocks)
+        if N_rows < N:
+            blocks.append(scipy.sparse.csr_matrix(
+                (N - N_rows, int(np.prod(grid_signature[3]))), dtype=dtype))
+        self._system_matrix = scipy.sparse.vstack(blocks, format="csr")
+        if verbose:
+            ph.print_info(
+                "System matrix assembled (%d non-zero elements, %d/%d row "
+                "blocks updated, %s)" % (
+                    self._system_matrix.nnz,
+                    len(slices_update), len(slices),
+                    ph.stop_timing(time_start)))
+
+        return self._system_matrix
+
+    ##
+    # Gets M_k y_k for a single slice.
+    # \date       2026-10-17 05:52:33+0000
+    #
+    # \param      self       The object
+    # \param      slice_k    Slice object
+    # \param      use_masks  Apply the slice mask, boolean
+    #
+    # \return     M_k y_k as 1D array
+    #
+    def _get_M_y_block(self, slice_k, use_masks):
+        if use_masks:
+            slice_itk = self._linear_operators.M_itk(
+                slice_k.itk, slice_k.itk_mask)
+        else:
+            slice_itk = slice_k.itk
+        return self._itk2np.GetArrayViewFromImage(slice_itk).ravel()
+
+    ##
+    # Gets the sparse matrix M_k A_k of a slice
+    # \date       2026-10-17 05:52:56+0000
+    #
+    # \param      self                The object
+    # \param      slice_k             Slice object
+    # \param      reconstruction_itk  Reconstruction image as itk.Image object
+    # \param      grid_signature      Signature of reconstruction grid
+    # \param      use_masks           Apply the slice mask, boolean
+    # \param      dtype               Data type of the matrix
+    #
+    # \return     Sparse matrix as scipy.sparse.csr_matrix
+    #
+    def _get_system_matrix_block(self,
+                                 slice_k,
+                                 reconstruction_itk,
+                                 grid_signature,
+                                 use_masks,
+                                 dtype):
+
+        slice_spacing, cov = self.get_slice_geometry(
+            slice_k, reconstruction_itk, grid_signature)
+
+        if use_masks:
+            weights_nda = sitk.GetArrayFromImage(slice_k.sitk_mask)
+        else:
+            weights_nda = None
+
+        return self._linear_operators.get_A_sparse(
+            reconstruction_itk,
+            slice_k.itk,
+            slice_spacing,
+            cov=cov,
+            weights_nda=weights_nda).astype(dtype)
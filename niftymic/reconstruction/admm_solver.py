@@ -10,10 +10,8 @@
 
 # Import libraries
 import SimpleITK as sitk
-import numpy as np
 
 import nsol.admm_linear_solver as admm
-import nsol.linear_operators as linop
 import pysitk.python_helper as ph
 import pysitk.simple_itk_helper as sitkh
 from niftymic.reconstruction.solver import Solver
@@ -49,6 +47,23 @@ class ADMMSolver(Solver):
     #                                       augmented Lagrangian term, scalar
     # \param[in]     iterations             number of ADMM iterations, scalar
     # \param         verbose                The verbose
+    # \param         n_threads              Number of worker threads used to
+    #                                       evaluate the slice acquisition
+    #                                       operators
+    # \param         use_system_matrix      Use sparse system matrix for
+    #                                       operator evaluations if it fits
+    #                                       the memory limit
+    # \param         use_separable_psf      Apply the PSF once per group of
+    #                                       equally oriented slices as
+    #                                       separable filter
+    # \param         compress_unknowns      Only optimize for the voxels
+    #                                       within the reconstruction mask
+    # \param         precision              Floating point precision of the
+    #                                       solver vectors, 'float64' or
+    #                                       'float32'
+    # \param         acquisition_model      AcquisitionModel object shared
+    #                                       with other solvers; None to create
+    #                                       a new one
     #
     def __init__(self,
                  stacks,
@@ -67,6 +82,12 @@ class ADMMSolver(Solver):
                  iterations=10,
                  use_masks=1,
                  verbose=1,
+                 n_threads=1,
+                 use_system_matrix=False,
+                 use_separable_psf=False,
+                 compress_unknowns=False,
+                 precision="float64",
+                 acquisition_model=None,
                  ):
 
         # Run constructor of superclass
@@ -85,6 +106,12 @@ class ADMMSolver(Solver):
                         predefined_covariance=predefined_covariance,
                         use_masks=use_masks,
                         verbose=verbose,
+                        n_threads=n_threads,
+                        use_system_matrix=use_system_matrix,
+                        use_separable_psf=use_separable_psf,
+                        compress_unknowns=compress_unknowns,
+                        precision=precision,
+                        acquisition_model=acquisition_model,
                         )
 
         # Settings for optimizer
@@ -157,15 +184,7 @@ class ADMMSolver(Solver):
         x0 = self.get_x0()
         x_scale = self.get_x_scale()
 
-        spacing = np.array(self._reconstruction.sitk.GetSpacing())
-        linear_operators = linop.LinearOperators3D(spacing=spacing)
-        grad, grad_adj = linear_operators.get_gradient_operators()
-
-        X_shape = self._reconstruction_shape
-        Z_shape = grad(x0.reshape(*X_shape)).shape
-
-        B = lambda x: grad(x.reshape(*X_shape)).flatten()
-        B_adj = lambda x: grad_adj(x.reshape(*Z_shape)).flatten()
+        B, B_adj = self.get_gradient_operators()
 
         # Set up solver
         solver = admm.ADMMLinearSolver(
@@ -212,7 +231,7 @@ class ADMMSolver(Solver):
 
         # Update volume
         self._reconstruction.itk = self._get_itk_image_from_array_vec(
-            solver.get_x(), self._reconstruction.itk)
+            self._get_x_full(solver.get_x()), self._reconstruction.itk)
         self._reconstruction.sitk = sitkh.get_sitk_from_itk_image(
             self._reconstruction.itk)
 
@@ -10,6 +10,8 @@
 # Import libraries
 import itk
 import numpy as np
+import scipy.ndimage
+import scipy.sparse
 
 import pysitk.simple_itk_helper as sitkh
 
@@ -50,6 +52,8 @@ class LinearOperators(object):
                  ):
 
         self._deconvolution_mode = deconvolution_mode
+        self._alpha_cut = alpha_cut
+        self._image_type = image_type
 
         # In case only diagonal entries are given, create diagonal matrix
         if predefined_covariance is not None:
@@ -105,15 +109,20 @@ class LinearOperators(object):
     #                                 [in-plane x, in-plane y, slice-thickness]
     #                                 resolution information. Required to
     #                                 estimate Gaussian blurring.
+    # \param      cov                 Precomputed covariance describing the
+    #                                 PSF orientation of the slice in
+    #                                 reconstruction space as 3x3 numpy array
+    #                                 (optional, see get_covariance)
     #
     # \return     Image A(x) as itk.Image object in slice_itk image space
     #
-    def A_itk(self, reconstruction_itk, slice_itk, slice_spacing):
+    def A_itk(self, reconstruction_itk, slice_itk, slice_spacing, cov=None):
 
         # Get covariance describing PSF orientation of slice in reconstruction
         # space
-        cov = self._get_covariance[self._deconvolution_mode](
-            reconstruction_itk, slice_itk, slice_spacing)
+        if cov is None:
+            cov = self.get_covariance(
+                reconstruction_itk, slice_itk, slice_spacing)
 
         reconstruction_itk.Update()
         self._filter_oriented_gaussian.SetCovariance(cov.flatten())
@@ -212,18 +221,32 @@ class LinearOperators(object):
     #                                 [in-plane x, in-plane y, slice-thickness]
     #                                 resolution information. Required to
     #                                 estimate Gaussian blurring.
+    # \param      cov                 Precomputed covariance describing the
+    #                                 PSF orientation of the slice in
+    #                                 reconstruction space as 3x3 numpy array
+    #                                 (optional, see get_covariance)
+    #
+    # \param      region              Optional region (index, size) of the
+    #                                 reconstruction space the output is
+    #                                 restricted to, e.g. as given by
+    #                                 get_adjoint_region
     #
     # \return     Image A^*(y) as itk.Image object in reconstruction_itk image
-    #             space
+    #             space (or its region if given)
     #
-    def A_adj_itk(self, slice_itk, reconstruction_itk, slice_spacing):
+    def A_adj_itk(self, slice_itk, reconstruction_itk, slice_spacing,
+                  cov=None, region=None):
 
         # Get covariance describing PSF orientation of slice in reconstruction
         # space
-        cov = self._get_covariance[self._deconvolution_mode](
-            reconstruction_itk, slice_itk, slice_spacing)
+        if cov is None:
+            cov = self.get_covariance(
+                reconstruction_itk, slice_itk, slice_spacing)
 
         reconstruction_itk.Update()
+        if region is not None:
+            reconstruction_itk = self._get_region_image_itk(
+                reconstruction_itk, region)
         self._filter_adjoint_oriented_gaussian.SetCovariance(cov.flatten())
         self._filter_adjoint_oriented_gaussian.SetInput(slice_itk)
         self._filter_adjoint_oriented_gaussian.SetOutputParametersFromImage(
@@ -236,6 +259,344 @@ class LinearOperators(object):
 
         return A_adj_itk_slice
 
+    ##
+    # Gets the region of the reconstruction space affected by the backward
+    # operation A_adj_itk of a slice (or stack), i.e. the bounding box of its
+    # voxels enlarged by the cut-off distance of the oriented Gaussian PSF.
+    # Voxels outside this region are zero in the output of A_adj_itk.
+    # \date       2026-10-17 05:26:18+0000
+    #
+    # \param      self                The object
+    # \param      slice_itk           Slice image as itk.Image object
+    # \param      reconstruction_itk  Reconstruction image as itk.Image object
+    # \param      cov                 Covariance describing the PSF
+    #                                 orientation of the slice in
+    #                                 reconstruction space as 3x3 numpy array
+    #
+    # \return     Region as tuple (index, size) of 1D numpy arrays in (x, y, z)
+    #             order; None if the slice does not affect the reconstruction
+    #             space
+    #
+    def get_adjoint_region(self, slice_itk, reconstruction_itk, cov):
+        origin_r, spacing_r, direction_r, size_r = \
+            self._get_geometry_itk(reconstruction_itk)
+
+        # Slice voxel centers at the corners of the slice grid
+        points = self._get_corner_points_itk(slice_itk)
+        corners_r = direction_r.transpose().dot(
+            points - origin_r[:, np.newaxis]) / spacing_r[:, np.newaxis]
+
+        # Cut-off distance of oriented Gaussian in voxels (plus one voxel to
+        # account for rounding)
+        margin = self._alpha_cut * np.sqrt(np.diag(cov)) / spacing_r + 1
+
+        index_min = np.maximum(
+            np.floor(corners_r.min(axis=1) - margin), 0).astype(int)
+        index_max = np.minimum(
+            np.ceil(corners_r.max(axis=1) + margin), size_r - 1).astype(int)
+
+        if np.any(index_min > index_max):
+            return None
+
+        return index_min, index_max - index_min + 1
+
+    ##
+    # Assemble the forward operation of a slice as sparse matrix, i.e.
+    # \f$ A_k \in \mathbb{R}^{m_k \times n}
+    # \f$ such that A_k x equals the flattened output of A_itk.
+    #
+    # The weights of the oriented Gaussian interpolation (truncated at
+    # alpha_cut standard deviations and normalized to sum up to one) are
+    # evaluated for each slice voxel; slice voxels mapped outside the
+    # reconstruction space yield zero rows. Rows and columns follow the
+    # C-ordering of the flattened numpy data arrays. The adjoint operation
+    # A_adj_itk is given by the transpose.
+    # \date       2026-10-17 05:13:07+0000
+    #
+    # \param      self                The object
+    # \param      reconstruction_itk  Reconstruction image as itk.Image object
+    # \param      slice_itk           Slice image as itk.Image object
+    # \param      slice_spacing       Slice spacing as list/array that holds
+    #                                 [in-plane x, in-plane y, slice-thickness]
+    #                                 resolution information.
+    # \param      cov                 Precomputed covariance describing the
+    #                                 PSF orientation of the slice in
+    #                                 reconstruction space as 3x3 numpy array
+    #                                 (optional, see get_covariance)
+    # \param      weights_nda         Optional weights to scale the rows with,
+    #                                 e.g. slice mask as numpy data array.
+    #                                 Rows with zero weight are left empty.
+    # \param      N_rows_block        Number of rows evaluated at once
+    #
+    # \return     Sparse matrix as scipy.sparse.csr_matrix of shape
+    #             (N_slice_voxels, N_reconstruction_voxels)
+    #
+    def get_A_sparse(self,
+                     reconstruction_itk,
+                     slice_itk,
+                     slice_spacing,
+                     cov=None,
+                     weights_nda=None,
+                     N_rows_block=1024,
+                     ):
+
+        if cov is None:
+            cov = self.get_covariance(
+                reconstruction_itk, slice_itk, slice_spacing)
+
+        origin_r, spacing_r, direction_r, size_r = \
+            self._get_geometry_itk(reconstruction_itk)
+        origin_s, spacing_s, direction_s, size_s = \
+            self._get_geometry_itk(slice_itk)
+
+        N_rows = int(np.prod(size_s))
+        N_cols = int(np.prod(size_r))
+
+        # Rows to evaluate
+        if weights_nda is None:
+            weights_vec = np.ones(N_rows)
+        else:
+            weights_vec = np.asarray(weights_nda, dtype=np.float64).ravel()
+        rows = np.flatnonzero(weights_vec)
+
+        # Continuous reconstruction indices of slice voxel centers, i.e.
+        # (x, y, z)-ordering
+        index_s = np.array(np.unravel_index(rows, size_s[::-1]))[::-1].T
+        points = origin_s + np.dot(index_s * spacing_s, direction_s.T)
+        cindex = np.dot(points - origin_r, direction_r) / spacing_r
+
+        # Neighbourhood offsets covering the cut-off box
+        cov_inv = np.linalg.inv(cov)
+        radius = self._alpha_cut * np.sqrt(np.diag(cov)) / spacing_r
+        offsets = [np.arange(-int(np.ceil(r)), int(np.ceil(r)) + 2)
+                   for r in radius]
+        offsets = np.array(np.meshgrid(*offsets, indexing="ij")).reshape(3, -1).T
+
+        data_blocks = []
+        rows_blocks = []
+        cols_blocks = []
+        for i in range(0, rows.size, N_rows_block):
+            c = cindex[i:i + N_rows_block]
+
+            # Points outside the reconstruction space evaluate to zero
+            inside = np.all((c >= -0.5) & (c <= size_r - 0.5), axis=1)
+
+            neighbours = np.floor(c)[:, np.newaxis, :] + offsets
+            diff = neighbours - c[:, np.newaxis, :]
+            valid = np.all(np.abs(diff) <= radius, axis=2)
+            valid &= np.all((neighbours >= 0) & (neighbours < size_r), axis=2)
+            valid &= inside[:, np.newaxis]
+
+            diff *= spacing_r
+            weights = np.exp(-0.5 * np.einsum(
+                "bni,bni->bn", np.dot(diff, cov_inv), diff))
+            weights *= valid
+
+            # Normalize weights and scale rows
+            weights_sum = weights.sum(axis=1)
+            weights_sum[weights_sum == 0] = 1
+            weights *= (weights_vec[rows[i:i + N_rows_block]] /
+                        weights_sum)[:, np.newaxis]
+
+            i_row, i_neighbour = np.nonzero(weights)
+            nb = neighbours[i_row, i_neighbour].astype(np.int64)
+            data_blocks.append(weights[i_row, i_neighbour])
+            rows_blocks.append(rows[i + i_row])
+            cols_blocks.append(
+                (nb[:, 2] * size_r[1] + nb[:, 1]) * size_r[0] + nb[:, 0])
+
+        if len(data_blocks) == 0:
+            return scipy.sparse.csr_matrix((N_rows, N_cols))
+
+        A_sparse = scipy.sparse.csr_matrix(
+            (np.concatenate(data_blocks),
+             (np.concatenate(rows_blocks), np.concatenate(cols_blocks))),
+            shape=(N_rows, N_cols))
+
+        return A_sparse
+
+    ##
+    # Estimate the number of non-zero elements of the sparse matrix obtained
+    # by get_A_sparse without assembling it.
+    # \date       2026-10-17 05:13:30+0000
+    #
+    # \param      self                The object
+    # \param      reconstruction_itk  Reconstruction image as itk.Image object
+    # \param      cov                 Covariance describing the PSF orientation
+    #                                 of the slice in reconstruction space as
+    #                                 3x3 numpy array
+    # \param      N_rows              Number of evaluated rows, integer
+    #
+    # \return     Upper bound of number of non-zero elements, integer
+    #
+    def get_A_sparse_nnz_estimate(self, reconstruction_itk, cov, N_rows):
+        spacing_r = np.array(reconstruction_itk.GetSpacing())
+        radius = self._alpha_cut * np.sqrt(np.diag(cov)) / spacing_r
+        return int(N_rows * np.prod(2 * np.floor(radius) + 2))
+
+    ##
+    # Gets the grid on which the PSF of slices sharing the same orientation is
+    # separable, i.e. a grid aligned with the slice axes which covers the
+    # slices within the reconstruction space (enlarged by the cut-off
+    # distance of the PSF). Its isotropic spacing equals the finest spacing
+    # of the reconstruction.
+    # \date       2026-10-17 05:43:04+0000
+    #
+    # \param      self                The object
+    # \param      reconstruction_itk  Reconstruction image as itk.Image object
+    # \param      slices_itk          Slices sharing the same orientation as
+    #                                 list of itk.Image objects
+    # \param      cov                 Covariance describing the PSF
+    #                                 orientation of the slices in
+    #                                 reconstruction space as 3x3 numpy array
+    # \param      tolerance           Relative tolerance for off-diagonal
+    #                                 covariance entries w.r.t. the slice axes
+    #
+    # \return     None if the PSF is not separable w.r.t. the slice axes or
+    #             the slices do not overlap with the reconstruction space;
+    #             otherwise tuple (grid_itk, sigma) with grid_itk the grid
+    #             as itk.Image object (without allocated buffer) and sigma the
+    #             standard deviations of the PSF along the grid axes in voxels
+    #
+    def get_separable_psf_grid(self,
+                               reconstruction_itk,
+                               slices_itk,
+                               cov,
+                               tolerance=1e-3,
+                               ):
+        origin_r, spacing_r, direction_r, size_r = \
+            self._get_geometry_itk(reconstruction_itk)
+        direction = self._get_geometry_itk(slices_itk[0])[2]
+
+        # Covariance w.r.t. slice axes
+        cov_world = direction_r.dot(cov).dot(direction_r.transpose())
+        cov_slice = direction.transpose().dot(cov_world).dot(direction)
+        off_diagonal = cov_slice - np.diag(np.diag(cov_slice))
+        if np.abs(off_diagonal).max() > \
+                tolerance * np.abs(np.diag(cov_slice)).max():
+            return None
+
+        spacing = np.ones(3) * spacing_r.min()
+        sigma = np.sqrt(np.maximum(np.diag(cov_slice), 0)) / spacing
+
+        # Bounding boxes of slices and reconstruction space in grid
+        # coordinates
+        points_s = np.concatenate(
+            [self._get_corner_points_itk(s) for s in slices_itk], axis=1)
+        points_r = self._get_corner_points_itk(reconstruction_itk)
+        coords_s = direction.transpose().dot(points_s) / spacing[:, np.newaxis]
+        coords_r = direction.transpose().dot(points_r) / spacing[:, np.newaxis]
+
+        # Margin accounts for cut-off distance of PSF and interpolation
+        margin = np.ceil(self._alpha_cut * sigma) + 1
+        index_min = np.floor(np.maximum(
+            coords_s.min(axis=1), coords_r.min(axis=1)) - margin)
+        index_max = np.ceil(np.minimum(
+            coords_s.max(axis=1), coords_r.max(axis=1)) + margin)
+        if np.any(index_min > index_max):
+            return None
+
+        grid_itk = self._image_type.New()
+        grid_itk.SetRegions([int(n) for n in index_max - index_min + 1])
+        grid_itk.SetOrigin(direction.dot(spacing * index_min).tolist())
+        grid_itk.SetSpacing(spacing.tolist())
+        grid_itk.SetDirection(slices_itk[0].GetDirection())
+
+        return grid_itk, sigma
+
+    ##
+    # Perform separable Gaussian blurring with zero boundary conditions on a
+    # numpy data array. The operation is self-adjoint.
+    # \date       2026-10-17 05:43:27+0000
+    #
+    # \param      self   The object
+    # \param      nda    Image data array in (z, y, x) order
+    # \param      sigma  Standard deviations in voxels in (x, y, z) order
+    #
+    # \return     Blurred numpy data array
+    #
+    def B_separable_nda(self, nda, sigma):
+        for i, sigma_i in enumerate(sigma):
+
+            # Kernel would reduce to identity
+            if self._alpha_cut * sigma_i < 0.5:
+                continue
+
+            nda = scipy.ndimage.gaussian_filter1d(
+                nda, sigma_i, axis=nda.ndim - 1 - i, mode="constant",
+                truncate=self._alpha_cut)
+
+        return nda
+
+    ##
+    # Assemble the linear interpolation of an image at the voxel centers of
+    # a grid as sparse matrix. Grid voxels outside the image space are
+    # interpolated using zero extension. Rows and columns follow the
+    # C-ordering of the flattened numpy data arrays; the adjoint operation
+    # is given by the transpose.
+    # \date       2026-10-17 05:43:50+0000
+    #
+    # \param      self         The object
+    # \param      image_itk    Image to be interpolated as itk.Image object
+    # \param      grid_itk     Grid defining the output space as itk.Image
+    #                          object
+    # \param      weights_nda  Optional weights to scale the rows with, e.g.
+    #                          grid mask as numpy data array. Rows with zero
+    #                          weight are left empty.
+    #
+    # \return     Sparse matrix as scipy.sparse.csr_matrix of shape
+    #             (N_grid_voxels, N_image_voxels)
+    #
+    def get_interpolation_sparse(self, image_itk, grid_itk, weights_nda=None):
+        origin_i, spacing_i, direction_i, size_i = \
+            self._get_geometry_itk(image_itk)
+        origin_g, spacing_g, direction_g, size_g = \
+            self._get_geometry_itk(grid_itk)
+
+        N_rows = int(np.prod(size_g))
+        N_cols = int(np.prod(size_i))
+
+        if weights_nda is None:
+            weights_vec = np.ones(N_rows)
+        else:
+            weights_vec = np.asarray(weights_nda, dtype=np.float64).ravel()
+        rows = np.flatnonzero(weights_vec)
+
+        # Continuous image indices of grid voxel centers, i.e.
+        # (x, y, z)-ordering
+        index_g = np.array(np.unravel_index(rows, size_g[::-1]))[::-1].T
+        points = origin_g + np.dot(index_g * spacing_g, direction_g.T)
+        cindex = np.dot(points - origin_i, direction_i) / spacing_i
+
+        index_0 = np.floor(cindex)
+        fraction = cindex - index_0
+
+        data_blocks = []
+        rows_blocks = []
+        cols_blocks = []
+        for offset in np.ndindex(2, 2, 2):
+            offset = np.array(offset)
+            neighbours = (index_0 + offset).astype(np.int64)
+            weights = np.prod(
+                np.where(offset, fraction, 1 - fraction), axis=1) * \
+                weights_vec[rows]
+            valid = np.all(
+                (neighbours >= 0) & (neighbours < size_i), axis=1) & \
+                (weights != 0)
+
+            nb = neighbours[valid]
+            data_blocks.append(weights[valid])
+            rows_blocks.append(rows[valid])
+            cols_blocks.append(
+                (nb[:, 2] * size_i[1] + nb[:, 1]) * size_i[0] + nb[:, 0])
+
+        interpolation_sparse = scipy.sparse.csr_matrix(
+            (np.concatenate(data_blocks),
+             (np.concatenate(rows_blocks), np.concatenate(cols_blocks))),
+            shape=(N_rows, N_cols))
+
+        return interpolation_sparse
+
     ##
     # Perform masking operation on itk.Image object
     # \date       2017-10-31 23:59:00+0000
@@ -258,6 +619,84 @@ class LinearOperators(object):
 
         return Mk_slice_itk
 
+    ##
+    # Gets the covariance describing the PSF orientation of the slice in
+    # reconstruction space according to the chosen deconvolution mode.
+    #
+    # The result only depends on the slice geometry and can be reused for
+    # subsequent A_itk/A_adj_itk calls as long as the slice does not move.
+    # \date       2026-10-17 05:09:24+0000
+    #
+    # \param      self                The object
+    # \param      reconstruction_itk  Reconstruction image as itk.Image object
+    # \param      slice_itk           Slice image as itk.Image object
+    # \param      slice_spacing       Slice spacing as list/array that holds
+    #                                 [in-plane x, in-plane y, slice-thickness]
+    #                                 resolution information.
+    #
+    # \return     The covariance as 3x3 numpy array
+    #
+    def get_covariance(self, reconstruction_itk, slice_itk, slice_spacing):
+        return self._get_covariance[self._deconvolution_mode](
+            reconstruction_itk, slice_itk, slice_spacing)
+
+    ##
+    # Gets an image (without allocated buffer) which describes a region of
+    # the reconstruction space and can be used to define the output of the
+    # filters.
+    # \date       2026-10-17 05:26:41+0000
+    #
+    # \param      self                The object
+    # \param      reconstruction_itk  Reconstruction image as itk.Image object
+    # \param      region              Region as tuple (index, size) in
+    #                                 (x, y, z) order
+    #
+    # \return     Image as itk.Image object
+    #
+    def _get_region_image_itk(self, reconstruction_itk, region):
+        index, size = region
+        origin, spacing, direction, _ = self._get_geometry_itk(
+            reconstruction_itk)
+
+        region_itk = self._image_type.New()
+        region_itk.SetRegions([int(n) for n in size])
+        region_itk.SetOrigin(
+            (origin + direction.dot(spacing * index)).tolist())
+        region_itk.SetSpacing(reconstruction_itk.GetSpacing())
+        region_itk.SetDirection(reconstruction_itk.GetDirection())
+
+        return region_itk
+
+    ##
+    # Gets the physical points of the voxel centers at the corners of an
+    # image grid.
+    # \date       2026-10-17 05:44:13+0000
+    #
+    # \param      image_itk  Image as itk.Image object
+    #
+    # \return     Points as 3x8 numpy array
+    #
+    @classmethod
+    def _get_corner_points_itk(cls, image_itk):
+        origin, spacing, direction, size = cls._get_geometry_itk(image_itk)
+        corners = np.array([
+            [x, y, z]
+            for x in [0, size[0] - 1]
+            for y in [0, size[1] - 1]
+            for z in [0, size[2] - 1]
+        ]).transpose()
+        return direction.dot(spacing[:, np.newaxis] * corners) + \
+            origin[:, np.newaxis]
+
+    @staticmethod
+    def _get_geometry_itk(image_itk):
+        origin = np.array(image_itk.GetOrigin())
+        spacing = np.array(image_itk.GetSpacing())
+        direction = np.array(sitkh.get_sitk_from_itk_direction(
+            image_itk.GetDirection())).reshape(3, 3)
+        size = np.array(image_itk.GetLargestPossibleRegion().GetSize())
+        return origin, spacing, direction, size
+
     def _get_covariance_full_3d(
         self,
         reconstruction_itk,
@@ -0,0 +1,317 @@
+##
+# \file parallel_solver_parameter_study.py
+# \brief      Run the parameter configurations of a solver parameter study
+#             concurrently on a shared acquisition model.
+#
+# \author     agent (agent@local)
+# \date       October 2026
+#
+
+import six
+import itertools
+import collections
+import numpy as np
+from six.moves import queue
+from multiprocessing.pool import ThreadPool
+
+import pysitk.python_helper as ph
+import nsol.observer as Observer
+import nsol.tikhonov_linear_solver as tk
+from nsol.reader_parameter_study import ReaderParameterStudy
+
+
+##
+# Run the parameter configurations of a solver parameter study as provided
+# by nsol, e.g. via DeconvolutionParameterStudyInterface, concurrently.
+#
+# All workers share the operators of the study, i.e. the acquisition model
+# including its caches, right hand-side and initial value, and each
+# parameter configuration is solved by a new solver instance. Results are
+# written to the files of the study as soon as they are available.
+# \date       2026-10-17 05:47:05+0000
+#
+class ParallelSolverParameterStudy(object):
+
+    ##
+    # Store information for parameter study
+    # \date       2026-10-17 05:47:28+0000
+    #
+    # \param      self             The object
+    # \param      parameter_study  nsol SolverParameterStudy object defining
+    #                              the study files and parameters to sweep
+    #                              through
+    # \param      get_solver       Function returning a new solver object
+    #                              with the settings of the study's solver,
+    #                              i.e. get_solver()
+    # \param      measures         Dictionary of measures to evaluate, i.e.
+    #                              {name: f} with f = lambda x: f(x)
+    # \param      n_threads        Number of parameter configurations solved
+    #                              concurrently, integer
+    # \param      warm_start       Solve configurations differing only in
+    #                              alpha consecutively (from largest to
+    #                              smallest alpha) and use the previous
+    #                              solution as initial value
+    #
+    def __init__(self,
+                 parameter_study,
+                 get_solver,
+                 measures,
+                 n_threads=1,
+                 warm_start=False,
+                 ):
+
+        self._parameter_study = parameter_study
+        self._get_solver = get_solver
+        self._measures = measures
+        self._n_threads = int(n_threads)
+        self._warm_start = warm_start
+
+        self._computational_time = None
+
+    def get_computational_time(self):
+        return self._computational_time
+
+    ##
+    # Run parameter study and write results to the files of the study
+    # \date       2026-10-17 05:47:51+0000
+    #
+    # \param      self  The object
+    #
+    def run(self):
+
+        parameter_study = self._parameter_study
+
+        # Create or append to a previous study (see nsol's
+        # SolverParameterStudy.run)
+        bool_prev_study = ph.file_exists(
+            parameter_study._get_path_to_file_parameters())
+        if not parameter_study._append or not bool_prev_study:
+            parameter_study._create_file_parameters()
+            parameter_study._create_files_measures()
+            parameter_study._create_file_computational_time()
+
+            # Overwrite append-flag in case set as a new study is created
+            parameter_study._append = False
+        else:
+            ph.print_info("Append previous study ... ")
+            parameter_study._check_that_studies_match()
+
+        time_start = ph.start_timing()
+
+        self._run()
+
+        self._computational_time = ph.stop_timing(time_start)
+
+    def _run(self):
+
+        parameter_study = self._parameter_study
+        name = parameter_study.get_parameter_study_name()
+        parameters = parameter_study.get_parameters()
+        keys = list(parameters.keys())
+        configurations = list(itertools.product(*parameters.values()))
+
+        if parameter_study._append:
+            # Retrieve previous reconstructions and iterations
+            reader_parameter_study = ReaderParameterStudy(
+                directory=parameter_study._directory, name=name)
+            reader_parameter_study.read_study()
+            previous_iterations = len(
+                reader_parameter_study.get_parameters_to_line().keys())
+            dic_x = dict(reader_parameter_study.get_reconstructions())
+        else:
+            previous_iterations = 0
+            dic_x = {k: v for k, v in six.iteritems(
+                parameter_study._reconstruction_info)}
+
+        # Workers put their results into the queue as soon as they finish
+        chains = self._get_chains(keys, configurations)
+        results = queue.Queue()
+        N_workers = max(1, min(self._n_threads, len(chains)))
+        pool = ThreadPool(N_workers)
+        pool.map_async(
+            lambda chain: self._run_chain(keys, chain, results), chains)
+        pool.close()
+
+        for i in range(len(configurations)):
+            result = results.get()
+            if isinstance(result, Exception):
+                pool.terminate()
+                raise result
+            dic_parameter, measures, computational_time, x = result
+
+            ph.print_title("%s: Iteration %d/%d" %
+                           (name, i + 1, len(configurations)))
+            for key in dic_parameter.keys():
+                ph.print_info(key + " = %s" % (dic_parameter[key]))
+
+            # Write all measure results to file for all iterations
+            for measure in measures:
+                parameter_study._add_to_file_measures(
+                    measure, measures[measure].reshape(1, -1))
+
+            # Write required computational time
+            parameter_study._add_to_file_computational_time(
+                computational_time)
+
+            # Write current parameter values to file
+            parameter_study._add_to_file_parameters(dic_parameter)
+
+            # Data array is associated to line in parameters file
+            dic_x[str(i + previous_iterations)] = np.array(
+                x, dtype=np.float16)
+            parameter_study._write_to_file_reconstructions(dic_x)
+
+        pool.join()
+
+    ##
+    # Gets the chains of parameter configurations, i.e. lists of
+    # configurations solved consecutively by one worker. With warm start,
+    # configurations differing only in alpha are distributed to contiguous
+    # chains ordered from largest to smallest alpha.
+    # \date       2026-10-17 05:48:14+0000
+    #
+    # \param      self            The object
+    # \param      keys            Parameter names as list
+    # \param      configurations  List of parameter values tuples
+    #
+    # \return     List of chains
+    #
+    def _get_chains(self, keys, configurations):
+
+        if not self._warm_start or "alpha" not in keys:
+            return [[values] for values in configurations]
+
+        i_alpha = keys.index("alpha")
+        groups = collections.OrderedDict()
+        for values in configurations:
+            key = values[:i_alpha] + values[i_alpha + 1:]
+            groups.setdefault(key, []).append(values)
+
+        N_chains_group = max(
+            1, int(np.ceil(self._n_threads / float(len(groups)))))
+        chains = []
+        for group in groups.values():
+            group = sorted(group, key=lambda v: v[i_alpha], reverse=True)
+            N_chains = min(N_chains_group, len(group))
+            chains.extend([
+                [group[k] for k in indices]
+                for indices in np.array_split(np.arange(len(group)), N_chains)
+            ])
+
+        return chains
+
+    ##
+    # Solve a chain of parameter configurations and put the results into the
+    # queue. Errors are put into the queue as well.
+    # \date       2026-10-17 05:48:37+0000
+    #
+    # \param      self     The object
+    # \param      keys     Parameter names as list
+    # \param      chain    List of parameter values tuples
+    # \param      results  Queue receiving the results
+    #
+    def _run_chain(self, keys, chain, results):
+        x0 = None
+        for values in chain:
+            try:
+                result = self._run_configuration(keys, values, x0)
+            except Exception as e:
+                results.put(e)
+                return
+            results.put(result)
+            if self._warm_start:
+                x0 = result[-1]
+
+    ##
+    # Solve a single parameter configuration
+    # \date       2026-10-17 05:49:00+0000
+    #
+    # \param      self    The object
+    # \param      keys    Parameter names as list
+    # \param      values  Parameter values as tuple
+    # \param      x0      Initial value as 1D numpy array; None to use the
+    #                     one of the study
+    #
+    # \return     Tuple (dic_parameter, measures, computational_time, x)
+    #
+    def _run_configuration(self, keys, values, x0):
+
+        solver = self._get_solver()
+
+        dic_parameter = collections.OrderedDict()
+        for key, value in zip(keys, values):
+            getattr(solver, "set_%s" % key)(value)
+            dic_parameter[key] = str(getattr(solver, "get_%s" % key)())
+
+        x_offset = None
+        if x0 is not None:
+            solver, x_offset, bounds = self._get_warm_started_solver(
+                solver, x0)
+
+        observer = Observer.Observer()
+        observer.set_measures(self._measures)
+        solver.set_observer(observer)
+        solver.run()
+
+        # Monitored iterates of correction solver. Bounds of the original
+        # solver apply to the sum
+        x_list = observer.get_x_list()
+        if x_offset is not None:
+            x_list[:] = [x_offset + x for x in x_list]
+            if bounds is not None:
+                x_list[:] = [
+                    np.clip(x, bounds[0], bounds[1]) for x in x_list]
+
+        observer.compute_measures()
+
+        return (
+            dic_parameter,
+            observer.get_measures(),
+            observer.get_computational_time(),
+            x_list[-1],
+        )
+
+    ##
+    # Gets the solver starting at the given initial value. As lsmr always
+    # starts from zero, TikhonovLinearSolver objects using lsmr are replaced
+    # by an unbounded solver for the correction x - x0.
+    # \date       2026-10-17 05:49:23+0000
+    #
+    # \param      solver  Solver object
+    # \param      x0      Initial value as 1D numpy array
+    #
+    # \return     Tuple (solver, x_offset, bounds) with x_offset the initial
+    #             value to be added to the iterates of the solver and bounds
+    #             the bounds of the original solver to clip the sum with;
+    #             (solver, None, None) if the solver itself starts at x0
+    #
+    @staticmethod
+    def _get_warm_started_solver(solver, x0):
+
+        if not isinstance(solver, tk.TikhonovLinearSolver) or \
+                solver.get_minimizer() != "lsmr":
+            solver.set_x0(x0)
+            return solver, None, None
+
+        A = solver.get_A()
+        B = solver.get_B()
+        solver_correction = tk.TikhonovLinearSolver(
+            A=A,
+            A_adj=solver.get_A_adj(),
+            B=B,
+            B_adj=solver.get_B_adj(),
+            b=solver.get_b() - A(x0),
+            b_reg=solver.get_b_reg() - B(x0),
+            x0=np.zeros_like(x0),
+            alpha=solver.get_alpha(),
+            data_loss=solver.get_data_loss(),
+            data_loss_scale=solver.get_data_loss_scale(),
+            minimizer="lsmr",
+            iter_max=solver.get_iter_max(),
+            x_scale=solver.get_x_scale(),
+            verbose=solver.get_verbose(),
+            bounds=None,
+        )
+
+        # nsol provides no accessor for the bounds
+        return solver_correction, x0, solver._bounds
@@ -17,9 +17,7 @@
 #
 
 # Import libraries
-import numpy as np
 
-import nsol.linear_operators as linop
 import nsol.primal_dual_solver as pd
 import pysitk.python_helper as ph
 import pysitk.simple_itk_helper as sitkh
@@ -52,6 +50,12 @@ class PrimalDualSolver(Solver):
                  alg_type="ALG2",
                  use_masks=1,
                  verbose=0,
+                 n_threads=1,
+                 use_system_matrix=False,
+                 use_separable_psf=False,
+                 compress_unknowns=False,
+                 precision="float64",
+                 acquisition_model=None,
                  ):
 
         super(self.__class__, self).__init__(
@@ -69,6 +73,12 @@ class PrimalDualSolver(Solver):
             predefined_covariance=predefined_covariance,
             use_masks=use_masks,
             verbose=verbose,
+            n_threads=n_threads,
+            use_system_matrix=use_system_matrix,
+            use_separable_psf=use_separable_psf,
+            compress_unknowns=compress_unknowns,
+            precision=precision,
+            acquisition_model=acquisition_model,
         )
 
         # regularization type
@@ -126,15 +136,7 @@ class PrimalDualSolver(Solver):
         x0 = self.get_x0()
         x_scale = self.get_x_scale()
 
-        spacing = np.array(self._reconstruction.sitk.GetSpacing())
-        linear_operators = linop.LinearOperators3D(spacing=spacing)
-        grad, grad_adj = linear_operators.get_gradient_operators()
-
-        X_shape = self._reconstruction_shape
-        Z_shape = grad(x0.reshape(*X_shape)).shape
-
-        B = lambda x: grad(x.reshape(*X_shape)).flatten()
-        B_adj = lambda x: grad_adj(x.reshape(*Z_shape)).flatten()
+        B, B_adj = self.get_gradient_operators()
 
         prox_f = lambda x, tau: prox.prox_linear_least_squares(
             x=x, tau=tau,
@@ -184,7 +186,7 @@ class PrimalDualSolver(Solver):
 
         # Update volume
         self._reconstruction.itk = self._get_itk_image_from_array_vec(
-            solver.get_x(), self._reconstruction.itk)
+            self._get_x_full(solver.get_x()), self._reconstruction.itk)
         self._reconstruction.sitk = sitkh.get_sitk_from_itk_image(
             self._reconstruction.itk)
 
@@ -14,12 +14,14 @@ import itk
 import time
 import numpy as np
 import SimpleITK as sitk
+from multiprocessing.pool import ThreadPool
 
 import pysitk.python_helper as ph
 import pysitk.simple_itk_helper as sitkh
 
 import niftymic.base.stack as st
 import niftymic.utilities.binary_mask_from_mask_srr_estimator as bm
+from niftymic.definitions import PRECISION_OPTIONS
 
 
 # Class implementing Scattered Data Approximation
@@ -40,6 +42,11 @@ class ScatteredDataApproximation:
     # \param         sigma_array  Sigma is measured in the units of image
     #                             spacing; set sigma_array if you need
     #                             different values along each axis
+    # \param         n_threads    Number of threads used to accumulate the
+    #                             numerator and denominator
+    # \param         precision    Floating point precision of accumulated
+    #                             numerator and denominator, i.e. 'float64'
+    #                             or 'float32'
     # \post          HR_volume is updated with current volumetric estimate
     #
     def __init__(self,
@@ -50,6 +57,8 @@ class ScatteredDataApproximation:
                  use_masks=False,
                  sda_mask=False,
                  verbose=True,
+                 n_threads=1,
+                 precision="float64",
                  ):
 
         # Initialize variables
@@ -59,6 +68,19 @@ class ScatteredDataApproximation:
         self._use_masks = use_masks
         self._sda_mask = sda_mask
         self._verbose = verbose
+        self._n_threads = n_threads
+        self.set_precision(precision)
+
+        # Accumulated (unsmoothed) numerator and denominator of last run
+        self._helper_N_nda = None
+        self._helper_D_nda = None
+
+        # Accumulated slices together with their image and mask objects and
+        # a snapshot of the image used for the accumulation, i.e. {slice:
+        # (slice.sitk, slice.sitk_mask, slice_sitk)}. Slice objects update
+        # their images in place once moved; the snapshot keeps the position
+        # at accumulation time so that the contribution can be subtracted
+        self._accumulated_slices = {}
 
         self._get_slice = {
             # (use_mask, sda_mask)
@@ -81,6 +103,21 @@ class ScatteredDataApproximation:
             "Shepard-YVV":   self._run_discrete_shepard_reconstruction,
             "Shepard-Deriche":   self._run_discrete_shepard_based_on_Deriche_reconstruction,
         }
+
+        # Define dictionaries to compute the HR volume from the accumulated
+        # numerator and denominator for each approach
+        self._contribution_threshold = {
+            # Only consider intensities that would have been identified as
+            # slice contribution by an intensity offset of one
+            "Shepard-YVV": -1,
+            # Only consider struck voxels with positive intensities
+            "Shepard-Deriche": 0,
+        }
+        self._update_reconstruction = {
+            "Shepard-YVV": self._update_discrete_shepard_reconstruction,
+            "Shepard-Deriche":
+            self._update_discrete_shepard_based_on_Deriche_reconstruction,
+        }
         self._sda_approach = "Shepard-YVV"    # default approximation approach
 
     # Set sigma used for recursive Gaussian smoothing. Same sigma is used
@@ -94,6 +131,27 @@ class ScatteredDataApproximation:
         self._stacks = stacks
         self._N_stacks = len(stacks)
 
+    ##
+    # Sets the floating point precision of the accumulated numerator and
+    # denominator. Smoothing and the obtained HR volume are computed in double
+    # precision.
+    # \date       2026-10-17 05:37:15+0000
+    #
+    # \param      self       The object
+    # \param      precision  either 'float64' or 'float32'
+    #
+    def set_precision(self, precision):
+        if precision not in PRECISION_OPTIONS:
+            raise ValueError("Precision must be in " + str(PRECISION_OPTIONS))
+        self._precision = precision
+        self._dtype = np.dtype(precision)
+
+        # Accumulation needs to be recomputed in new precision
+        self._reset_accumulation()
+
+    def get_precision(self):
+        return self._precision
+
     # ## Get sigma used for recursive Gaussian smoothing.
     # #  \return sigma array, numpy array
     # def get_sigma(self):
@@ -124,6 +182,10 @@ class ScatteredDataApproximation:
             raise ValueError(
                 "Error: SDA approach can only be either 'Shepard-YVV' or 'Shepard-Deriche'")
 
+        # Accumulated numerator and denominator depend on approach
+        if sda_approach != self._sda_approach:
+            self._reset_accumulation()
+
         self._sda_approach = sda_approach
 
     # Get chosen type of regularization.
@@ -131,11 +193,68 @@ class ScatteredDataApproximation:
     def get_approach(self):
         return self._sda_approach
 
+    ##
+    # Sets the number of threads used to accumulate the numerator and
+    # denominator.
+    # \date       2026-10-17 05:23:33+0000
+    #
+    # \param      self       The object
+    # \param      n_threads  Number of threads, integer
+    #
+    def set_n_threads(self, n_threads):
+        self._n_threads = n_threads
+
+    def get_n_threads(self):
+        return self._n_threads
+
+    ##
+    # Gets the numerator and denominator accumulated over all slices prior to
+    # the Gaussian smoothing step of the last run.
+    #
+    # Both are sums over the contributions of the individual slices and can
+    # therefore be updated incrementally.
+    # \date       2026-10-17 05:23:56+0000
+    #
+    # \param      self  The object
+    #
+    # \return     Numerator and denominator as tuple of numpy arrays in HR
+    #             volume space
+    #
+    def get_numerator_and_denominator(self):
+        return self._helper_N_nda, self._helper_D_nda
+
     # Get current estimate of HR volume
     #  \return current estimate of HR volume, instance of Stack
     def get_reconstruction(self):
         return self._HR_volume
 
+    ##
+    # Sets the HR volume to be updated. Accumulated slice contributions are
+    # kept if the HR volume space remains unchanged.
+    # \date       2026-10-17 05:23:51+0000
+    #
+    # \param      self       The object
+    # \param      HR_volume  Stack object defining the HR space
+    #
+    def set_reconstruction(self, HR_volume):
+        geometry_HR = self._get_geometry(self._HR_volume.sitk)
+        geometry_HR_new = self._get_geometry(HR_volume.sitk)
+        if not all(np.array_equal(g, g_new)
+                   for g, g_new in zip(geometry_HR, geometry_HR_new)):
+            self._reset_accumulation()
+        self._HR_volume = HR_volume
+
+    ##
+    # Gets the slices whose contributions are currently accumulated.
+    # \date       2026-10-17 05:24:14+0000
+    #
+    # \param      self  The object
+    #
+    # \return     List of Slice objects
+    #
+    def get_accumulated_slices(self):
+        return list(self._accumulated_slices.keys())
+
     def get_setting_specific_filename(self, prefix="SDA_"):
 
         # Build filename
@@ -179,6 +298,77 @@ class ScatteredDataApproximation:
                           (self.get_computational_time()))
         # print("Elapsed time for SDA: %s seconds" %(time_elapsed))
 
+    ##
+    # Remove the contributions of slices from the accumulated numerator and
+    # denominator and update the HR volume estimate. Computational cost is
+    # proportional to the number of removed slices.
+    # \date       2026-10-17 05:24:37+0000
+    #
+    # \param      self    The object
+    # \param      slices  List of Slice objects, e.g. rejected slices.
+    #                     Slices which were not accumulated are ignored.
+    # \post       HR_volume is updated with current volumetric estimate
+    #
+    def remove_slices(self, slices):
+        if self._helper_N_nda is None:
+            self._init_accumulation()
+
+        time_start = ph.start_timing()
+
+        slices_sitk = [
+            self._accumulated_slices.pop(slice)[2] for slice in slices
+            if slice in self._accumulated_slices
+        ]
+        self._subtract_contributions(slices_sitk)
+        self._update_reconstruction[self._sda_approach]()
+
+        self._computational_time = ph.stop_timing(time_start)
+        if self._verbose:
+            ph.print_info("Removed %d slices. Required computational time: %s"
+                          % (len(slices_sitk), self.get_computational_time()))
+
+    ##
+    # Update the contributions of slices in the accumulated numerator and
+    # denominator and update the HR volume estimate. Only slices that were
+    # not accumulated yet, were moved or whose image or mask was replaced
+    # since their accumulation are considered. Computational cost is
+    # proportional to the number of changed slices.
+    # \date       2026-10-17 05:25:00+0000
+    #
+    # \param      self    The object
+    # \param      slices  List of Slice objects
+    # \post       HR_volume is updated with current volumetric estimate
+    #
+    def update_slices(self, slices):
+        if self._helper_N_nda is None:
+            self._init_accumulation()
+
+        time_start = ph.start_timing()
+
+        slices = [
+            slice for slice in slices if not self._is_accumulated(slice)
+        ]
+
+        # Remove contributions of previous slice positions
+        self._subtract_contributions([
+            self._accumulated_slices.pop(slice)[2] for slice in slices
+            if slice in self._accumulated_slices
+        ])
+
+        # Add contributions of current slice positions
+        slices_sitk = self._add_accumulated_slices(slices)
+        helper_N_nda, helper_D_nda = self._compute_numerator_and_denominator(
+            slices_sitk, self._contribution_threshold[self._sda_approach])
+        self._helper_N_nda += helper_N_nda
+        self._helper_D_nda += helper_D_nda
+
+        self._update_reconstruction[self._sda_approach]()
+
+        self._computational_time = ph.stop_timing(time_start)
+        if self._verbose:
+            ph.print_info("Updated %d slices. Required computational time: %s"
+                          % (len(slices), self.get_computational_time()))
+
     ##
     # Add mask based on union of all masks
     # \date       2017-02-03 16:46:33+0000
@@ -304,70 +494,297 @@ class ScatteredDataApproximation:
     def _get_mask_slice(slice):
         return slice.sitk_mask
 
-    # Recontruct volume based on discrete Shepard's like method, cf. Vercauteren2006, equation (19).
-    #  The computation here is based on the YVV variant of Recursive Gaussian Filter and executed
-    #  via ITK
-    #  \remark Obtained intensity values are positive.
-    def _run_discrete_shepard_reconstruction(self):
+    ##
+    # Gets the image geometry required to map voxel indices to physical
+    # space.
+    # \date       2026-10-17 05:23:27+0000
+    #
+    # \param      image_sitk  Image as sitk.Image object
+    #
+    # \return     Tuple (origin, A, size) with A = direction * spacing as 3x3
+    #             numpy array such that a point p associated with the
+    #             (continuous) index i is given by p = origin + A i. size is
+    #             in (x, y, z) order
+    #
+    @staticmethod
+    def _get_geometry(image_sitk):
+        origin = np.array(image_sitk.GetOrigin())
+        direction = np.array(image_sitk.GetDirection()).reshape(3, 3)
+        A = direction.dot(np.diag(image_sitk.GetSpacing()))
+        size = np.array(image_sitk.GetSize())
+        return origin, A, size
 
+    ##
+    # Gets the HR volume voxels struck by a slice together with their nearest
+    # neighbour slice intensities.
+    #
+    # Equivalent to the nearest neighbour resampling of the slice onto the HR
+    # volume grid (sitk.Resample with sitk.sitkNearestNeighbor) but only the
+    # HR voxels within the bounding box of the slice are visited. Each HR
+    # voxel index is mapped to the continuous slice index, rounded and
+    # checked to be within the slice buffer, i.e. within [-0.5, size-0.5).
+    # \date       2026-10-17 05:23:50+0000
+    #
+    # \param      self         The object
+    # \param      slice_sitk   Slice as sitk.Image object
+    # \param      geometry_HR  Geometry of HR volume as given by _get_geometry
+    #
+    # \return     Tuple (indices, values) of flattened HR volume voxel indices
+    #             and associated slice intensities as 1D-arrays
+    #
+    def _get_slice_contributions(self, slice_sitk, geometry_HR):
+        origin_HR, A_HR, size_HR = geometry_HR
+        origin_slice, A_slice, size_slice = self._get_geometry(slice_sitk)
+
+        # Bounding box of slice in HR voxel indices
+        corners = np.array([
+            [x, y, z]
+            for x in [-0.5, size_slice[0] - 0.5]
+            for y in [-0.5, size_slice[1] - 0.5]
+            for z in [-0.5, size_slice[2] - 0.5]
+        ]).transpose()
+        corners_HR = np.linalg.solve(
+            A_HR, A_slice.dot(corners) + (origin_slice - origin_HR)[:, None])
+        index_min = np.maximum(
+            np.floor(corners_HR.min(axis=1)), 0).astype(int)
+        index_max = np.minimum(
+            np.ceil(corners_HR.max(axis=1)), size_HR - 1).astype(int)
+
+        if np.any(index_min > index_max):
+            return np.zeros(0, dtype=int), np.zeros(0)
+
+        # Affine map from HR voxel index to continuous slice index
+        T = np.linalg.solve(A_slice, A_HR)
+        t = np.linalg.solve(A_slice, origin_HR - origin_slice)
+
+        # Voxel indices of bounding box along each axis as (z, y, x)-shaped
+        # arrays to be broadcast
+        ranges = [
+            np.arange(index_min[i], index_max[i] + 1).reshape(
+                [-1 if j == 2 - i else 1 for j in range(3)])
+            for i in range(3)
+        ]
+
+        inside = np.ones(1, dtype=bool)
+        indices_slice = []
+        for i in range(3):
+            c = t[i] + T[i, 0] * ranges[0] + T[i, 1] * ranges[1] + \
+                T[i, 2] * ranges[2]
+            inside = inside & (c >= -0.5) & (c < size_slice[i] - 0.5)
+            indices_slice.append(np.floor(c + 0.5).astype(int))
+
+        # Voxels of bounding box struck by slice
+        kz, ky, kx = np.nonzero(inside)
+        indices = (ranges[2].ravel()[kz] * size_HR[1] +
+                   ranges[1].ravel()[ky]) * size_HR[0] + ranges[0].ravel()[kx]
+
+        slice_nda = sitk.GetArrayFromImage(slice_sitk)
+        values = slice_nda[
+            indices_slice[2][inside],
+            indices_slice[1][inside],
+            indices_slice[0][inside],
+        ].astype(np.float64)
+
+        return indices, values
+
+    def _reset_accumulation(self):
+        self._helper_N_nda = None
+        self._helper_D_nda = None
+        self._accumulated_slices = {}
+
+    def _init_accumulation(self):
         shape = sitk.GetArrayFromImage(self._HR_volume.sitk).shape
-        helper_N_nda = np.zeros(shape)
-        helper_D_nda = np.zeros(shape)
+        self._helper_N_nda = np.zeros(shape, dtype=self._dtype)
+        self._helper_D_nda = np.zeros(shape, dtype=self._dtype)
+        self._accumulated_slices = {}
+
+    ##
+    # Register slices as accumulated using their current position. A copy of
+    # each slice image is kept as the slice images are updated in place once
+    # the slice is moved.
+    # \date       2026-10-17 05:25:23+0000
+    #
+    # \param      self    The object
+    # \param      slices  List of Slice objects
+    #
+    # \return     List of slice images to be accumulated as sitk.Image objects
+    #
+    def _add_accumulated_slices(self, slices):
+        slices_sitk = []
+        for slice in slices:
+            slice_sitk = sitk.Image(self._get_slice[(
+                bool(self._use_masks), bool(self._sda_mask))](slice))
+            self._accumulated_slices[slice] = (
+                slice.sitk, slice.sitk_mask, slice_sitk)
+            slices_sitk.append(slice_sitk)
+        return slices_sitk
 
-        default_pixel_value = 0.0
+    ##
+    # Check whether the accumulated contribution of a slice is up to date,
+    # i.e. whether the slice was accumulated at its current position using
+    # its current image and mask.
+    # \date       2026-10-17 06:10:23+0000
+    #
+    # \param      self   The object
+    # \param      slice  Slice object
+    #
+    # \return     True if contribution is up to date, False otherwise
+    #
+    def _is_accumulated(self, slice):
+        accumulated = self._accumulated_slices.get(slice)
+        if accumulated is None:
+            return False
+        slice_sitk_source, slice_sitk_mask_source, slice_sitk = accumulated
+        return slice_sitk_source is slice.sitk and \
+            slice_sitk_mask_source is slice.sitk_mask and \
+            slice_sitk.GetOrigin() == slice.sitk.GetOrigin() and \
+            slice_sitk.GetDirection() == slice.sitk.GetDirection() and \
+            slice_sitk.GetSpacing() == slice.sitk.GetSpacing()
 
-        for i in range(0, self._N_stacks):
-            if self._verbose:
-                ph.print_info("Stack %s/%s" % (i + 1, self._N_stacks))
-            stack = self._stacks[i]
-            slices = stack.get_slices()
-            N_slices = stack.get_number_of_slices()
+    ##
+    # Accumulate numerator and denominator over all slices of all stacks.
+    # \date       2026-10-17 05:25:46+0000
+    #
+    # \param      self  The object
+    # \post       self._helper_N_nda, self._helper_D_nda and
+    #             self._accumulated_slices updated
+    #
+    def _accumulate_slices(self):
+        self._reset_accumulation()
+        slices_sitk = self._add_accumulated_slices([
+            slice for stack in self._stacks for slice in stack.get_slices()
+        ])
+        self._helper_N_nda, self._helper_D_nda = \
+            self._compute_numerator_and_denominator(
+                slices_sitk, self._contribution_threshold[self._sda_approach])
+
+    ##
+    # Subtract the contributions of slice images from the accumulated
+    # numerator and denominator.
+    # \date       2026-10-17 05:26:09+0000
+    #
+    # \param      self         The object
+    # \param      slices_sitk  List of slice images as sitk.Image objects as
+    #                          used for their accumulation
+    #
+    def _subtract_contributions(self, slices_sitk):
+        helper_N_nda, helper_D_nda = self._compute_numerator_and_denominator(
+            slices_sitk, self._contribution_threshold[self._sda_approach])
+        self._helper_N_nda -= helper_N_nda
+        self._helper_D_nda -= helper_D_nda
+
+    ##
+    # Compute numerator and denominator by accumulating the contributions of
+    # slice images. Slice images are distributed over n_threads workers which
+    # accumulate into their own partial arrays. The partials are reduced
+    # subsequently.
+    # \date       2026-10-17 05:24:19+0000
+    #
+    # \param      self                    The object
+    # \param      slices_sitk             List of slice images as sitk.Image
+    #                                     objects
+    # \param      contribution_threshold  Slice intensities need to exceed
+    #                                     this threshold to contribute
+    #
+    # \return     Numerator and denominator as tuple of numpy arrays in HR
+    #             volume space
+    #
+    def _compute_numerator_and_denominator(
+            self, slices_sitk, contribution_threshold):
+        shape = sitk.GetArrayFromImage(self._HR_volume.sitk).shape
+        geometry_HR = self._get_geometry(self._HR_volume.sitk)
+
+        # Split slices into contiguous chunks, one per worker
+        N_workers = max(1, min(self._n_threads, len(slices_sitk)))
+        chunks = np.array_split(np.arange(len(slices_sitk)), N_workers)
+        if self._verbose:
+            ph.print_info(
+                "Accumulate %d slices (%d threads)" % (
+                    len(slices_sitk), N_workers))
+
+        get_partials = lambda chunk: \
+            self._get_partial_numerator_and_denominator(
+                [slices_sitk[j] for j in chunk],
+                shape,
+                geometry_HR,
+                contribution_threshold,
+            )
+
+        if N_workers > 1:
+            pool = ThreadPool(N_workers)
+            try:
+                partials = pool.map(get_partials, chunks)
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            partials = [get_partials(chunk) for chunk in chunks]
 
-            # for j in range(10, 11):
-            for j in range(0, N_slices):
-                # print("\t\tSlice %s/%s" %(j,N_slices-1))
-                slice = slices[j]
-                slice_sitk = self._get_slice[(
-                    bool(self._use_masks), bool(self._sda_mask))](slice)
+        # Reduce partial numerators and denominators
+        helper_N_nda, helper_D_nda = partials[0]
+        for partial_N_nda, partial_D_nda in partials[1:]:
+            helper_N_nda += partial_N_nda
+            helper_D_nda += partial_D_nda
 
-                # Add intensity offset so that a "zero" intensity can be
-                # identified as contribution of image slice (line 353/356)
-                slice_sitk += 1
+        return helper_N_nda, helper_D_nda
 
-                # Nearest neighbour resampling of slice to target space (HR
-                # volume)
-                slice_resampled_sitk = sitk.Resample(
-                    slice_sitk,
-                    self._HR_volume.sitk,
-                    sitk.Euler3DTransform(),
-                    sitk.sitkNearestNeighbor,
-                    default_pixel_value,
-                    self._HR_volume.sitk.GetPixelIDValue())
+    ##
+    # Gets the partial numerator and denominator associated with a list of
+    # slice images.
+    # \date       2026-10-17 05:24:42+0000
+    #
+    # \param      self                    The object
+    # \param      slices_sitk             List of slice images as sitk.Image
+    #                                     objects
+    # \param      shape                   Shape of HR volume data array
+    # \param      geometry_HR             Geometry of HR volume as given by
+    #                                     _get_geometry
+    # \param      contribution_threshold  Slice intensities need to exceed
+    #                                     this threshold to contribute
+    #
+    # \return     Partial numerator and denominator as tuple of numpy arrays
+    #
+    def _get_partial_numerator_and_denominator(
+            self, slices_sitk, shape, geometry_HR, contribution_threshold):
+        helper_N_nda = np.zeros(shape, dtype=self._dtype)
+        helper_D_nda = np.zeros(shape, dtype=self._dtype)
+        helper_N_nda_vec = helper_N_nda.reshape(-1)
+        helper_D_nda_vec = helper_D_nda.reshape(-1)
 
-                # sitkh.show_sitk_image(slice_resampled_sitk)
+        for slice_sitk in slices_sitk:
 
-                # Extract array of pixel intensities
-                nda_slice = sitk.GetArrayFromImage(slice_resampled_sitk)
+            # Nearest neighbour intensities of HR volume voxels which are
+            # struck by the slice
+            indices, values = self._get_slice_contributions(
+                slice_sitk, geometry_HR)
 
-                # Get voxels in HR volume space which are struck by the slice
-                ind_nonzero = nda_slice > 0
+            contributes = values > contribution_threshold
+            indices = indices[contributes]
 
-                # update numerator (correct previous intensity offset)
-                helper_N_nda[ind_nonzero] += nda_slice[ind_nonzero] - 1
+            # update numerator and denominator. HR voxel indices are unique
+            # for each slice, hence no buffered accumulation (np.add.at) is
+            # required
+            helper_N_nda_vec[indices] += values[contributes]
+            helper_D_nda_vec[indices] += 1
 
-                # update denominator
-                helper_D_nda[ind_nonzero] += 1
+        return helper_N_nda, helper_D_nda
 
-                # test = sitk.GetImageFromArray(helper_N_nda)
-                # sitkh.show_sitk_image(test,title="N")
+    # Recontruct volume based on discrete Shepard's like method, cf. Vercauteren2006, equation (19).
+    #  The computation here is based on the YVV variant of Recursive Gaussian Filter and executed
+    #  via ITK
+    #  \remark Obtained intensity values are positive.
+    def _run_discrete_shepard_reconstruction(self):
+        self._accumulate_slices()
+        self._update_discrete_shepard_reconstruction()
 
-                # test = sitk.GetImageFromArray(helper_D_nda)
-                # sitkh.show_sitk_image(test,title="D")
+    # Compute HR volume from accumulated numerator and denominator based on
+    # YVV variant of Recursive Gaussian Filter
+    def _update_discrete_shepard_reconstruction(self):
 
-                # print("helper_N_nda: (min, max) = (%s, %s)" %(np.min(helper_N_nda), np.max(helper_N_nda)))
-                # print("helper_D_nda: (min, max) = (%s, %s)" %(np.min(helper_D_nda), np.max(helper_D_nda)))
+        helper_N_nda = self._helper_N_nda.astype(np.float64, copy=False)
 
         # TODO: Set zero entries to one; Otherwise results are very weird!?
+        helper_D_nda = np.array(self._helper_D_nda, dtype=np.float64)
         helper_D_nda[helper_D_nda == 0] = 1
 
         # Create itk-images with correct header data
@@ -437,51 +854,17 @@ class ScatteredDataApproximation:
     #  via SimpleITK.
     #  \remark Obtained intensity values can be negative.
     def _run_discrete_shepard_based_on_Deriche_reconstruction(self):
+        self._accumulate_slices()
+        self._update_discrete_shepard_based_on_Deriche_reconstruction()
 
-        shape = sitk.GetArrayFromImage(self._HR_volume.sitk).shape
-        helper_N_nda = np.zeros(shape)
-        helper_D_nda = np.zeros(shape)
-
-        default_pixel_value = 0.0
+    # Compute HR volume from accumulated numerator and denominator based on
+    # Deriche variant of Recursive Gaussian Filter
+    def _update_discrete_shepard_based_on_Deriche_reconstruction(self):
 
-        for i in range(0, self._N_stacks):
-            if self._verbose:
-                ph.print_info("Stack %s/%s" % (i + 1, self._N_stacks))
-            stack = self._stacks[i]
-            slices = stack.get_slices()
-            N_slices = stack.get_number_of_slices()
-
-            for j in range(0, N_slices):
-
-                slice = slices[j]
-                slice_sitk = self._get_slice[(
-                    bool(self._use_masks), bool(self._sda_mask))](slice)
-
-                # Nearest neighbour resampling of slice to target space (HR
-                # volume)
-                slice_resampled_sitk = sitk.Resample(
-                    slice_sitk,
-                    self._HR_volume.sitk,
-                    sitk.Euler3DTransform(),
-                    sitk.sitkNearestNeighbor,
-                    default_pixel_value,
-                    self._HR_volume.sitk.GetPixelIDValue())
-
-                # Extract array of pixel intensities
-                nda_slice = sitk.GetArrayFromImage(slice_resampled_sitk)
-
-                # Look for indices which are stroke by the slice in the
-                # isotropic grid
-                ind_nonzero = nda_slice > 0
-
-                # update arrays of numerator and denominator
-                helper_N_nda[ind_nonzero] += nda_slice[ind_nonzero]
-                helper_D_nda[ind_nonzero] += 1
-
-                # print("helper_N_nda: (min, max) = (%s, %s)" %(np.min(helper_N_nda), np.max(helper_N_nda)))
-                # print("helper_D_nda: (min, max) = (%s, %s)" %(np.min(helper_D_nda), np.max(helper_D_nda)))
+        helper_N_nda = self._helper_N_nda.astype(np.float64, copy=False)
 
         # TODO: Set zero entries to one; Otherwise results are very weird!?
+        helper_D_nda = np.array(self._helper_D_nda, dtype=np.float64)
         helper_D_nda[helper_D_nda == 0] = 1
 
         # Create sitk-images with correct header data
@@ -11,18 +11,29 @@
 # Import libraries
 from abc import ABCMeta, abstractmethod
 import sys
+import copy
 import itk
+import threading
 import SimpleITK as sitk
 import numpy as np
+import scipy.sparse
+from multiprocessing.pool import ThreadPool
 
+import nsol.linear_operators as linop
 import pysitk.python_helper as ph
 import pysitk.simple_itk_helper as sitkh
 
+import niftymic.base.stack as st
+import niftymic.reconstruction.acquisition_model as am
 import niftymic.reconstruction.linear_operators as lin_op
+from niftymic.definitions import PRECISION_OPTIONS
 
 # Allowed data loss functions
 DATA_LOSS = ['linear', 'soft_l1', 'huber', 'cauchy', 'arctan']
 
+# Default memory limit (in bytes) for the sparse system matrix
+SYSTEM_MATRIX_MEMORY_LIMIT = 4 * 1024**3
+
 
 ##
 # This class contains the common functions/attributes of the solvers
@@ -59,6 +70,31 @@ class Solver(object):
     #                                       (sigma_x2, sigma_y2, sigma_z2) or
     #                                       as full 3x3 numpy array
     # \param         verbose                The verbose
+    # \param         n_threads              Number of worker threads used to
+    #                                       evaluate the slice acquisition
+    #                                       operators; 1 means serial
+    #                                       evaluation
+    # \param         use_system_matrix      Assemble M A as sparse matrix
+    #                                       once per slice geometry and use
+    #                                       it for the operator evaluations
+    #                                       if it fits the memory limit
+    # \param         use_separable_psf      Apply the PSF once per group of
+    #                                       equally oriented slices as
+    #                                       separable filter on a grid
+    #                                       aligned with the slices
+    # \param         compress_unknowns      Only optimize for the voxels
+    #                                       within the reconstruction mask;
+    #                                       voxels outside are set to zero
+    # \param         precision              Floating point precision of the
+    #                                       solver vectors and the system
+    #                                       matrix, i.e. 'float64' or
+    #                                       'float32'. 'float32' requires
+    #                                       the system matrix
+    # \param         acquisition_model      AcquisitionModel object to share
+    #                                       slice geometry, masked slice data
+    #                                       and system matrix with other
+    #                                       solvers; a new one is created if
+    #                                       None
     #
     def __init__(self,
                  stacks,
@@ -76,28 +112,97 @@ class Solver(object):
                  verbose,
                  image_type=itk.Image.D3,
                  use_masks=True,
+                 n_threads=1,
+                 use_system_matrix=False,
+                 use_separable_psf=False,
+                 compress_unknowns=False,
+                 precision="float64",
+                 acquisition_model=None,
                  ):
 
         # Initialize variables
         self._stacks = stacks
         self._reconstruction = reconstruction
+        self._reconstruction_grid = am.AcquisitionModel.get_grid_signature(
+            reconstruction.sitk)
 
         # Cut-off distance for Gaussian blurring filter
         self._alpha_cut = alpha_cut
 
         self._deconvolution_mode = deconvolution_mode
         self._predefined_covariance = predefined_covariance
-        self._linear_operators = lin_op.LinearOperators(
-            deconvolution_mode=self._deconvolution_mode,
-            predefined_covariance=self._predefined_covariance,
-            alpha_cut=self._alpha_cut,
-            image_type=image_type
-        )
+        self._image_type = image_type
+        self._linear_operators = self._create_linear_operators()
+
+        # Slice acquisition model holding the slice geometry, masked slice
+        # data M y and system matrix M A, possibly shared with other solvers
+        if acquisition_model is None:
+            acquisition_model = am.AcquisitionModel(
+                alpha_cut=alpha_cut,
+                deconvolution_mode=deconvolution_mode,
+                predefined_covariance=predefined_covariance,
+                image_type=image_type,
+            )
+        elif not acquisition_model.is_compatible(
+                alpha_cut=alpha_cut,
+                deconvolution_mode=deconvolution_mode,
+                predefined_covariance=predefined_covariance,
+                image_type=image_type):
+            raise ValueError(
+                "Acquisition model settings do not match the ones of the "
+                "solver")
+        self._acquisition_model = acquisition_model
+
+        # Worker pool to evaluate the slice acquisition operators. Each worker
+        # owns its own set of linear operators (i.e. ITK filters)
+        self._n_threads = int(n_threads)
+        self._linear_operators_workers = [self._linear_operators]
+        self._pool = None
+
+        # Operators may be evaluated concurrently by several callers, e.g.
+        # parameter studies. Filter-based evaluations share the worker
+        # filters and buffers and are serialized; the system matrix is
+        # assembled only once by the acquisition model
+        self._operator_lock = threading.Lock()
+
+        # Cache holding for each stack whether its slices are still aligned
+        # with the stack so that the operators can be evaluated on the entire
+        # stack at once, i.e. {stack: (signature, stack_group)}
+        self._stack_groups = {}
+
+        # Groups of slices sharing the same orientation so that the PSF can
+        # be applied once per group as separable filter on a grid aligned
+        # with the slices, i.e. {stack: (signature, psf_groups)}
+        self._use_separable_psf = use_separable_psf
+        self._psf_groups = {}
+
+        # Arrays reused by the workers across operator evaluations, i.e.
+        # {(i_worker, key): nda}
+        self._buffers = {}
+
+        # Use sparse system matrix M A provided by the acquisition model
+        self._use_system_matrix = use_system_matrix
+        self._system_matrix_memory_limit = SYSTEM_MATRIX_MEMORY_LIMIT
+
+        # Data type of solver vectors and system matrix. ITK images and
+        # filters remain in double precision
+        self.set_precision(precision)
 
         # Settings for solver
         self._alpha = alpha
         self._iter_max = iter_max
 
+        # Number of grid levels of the coarse-to-fine reconstruction; 1 means
+        # that the reconstruction is only solved on its own grid
+        self._n_levels = 1
+
+        # Indicates whether the initial value is an upsampled coarse level
+        # estimate, i.e. whether solvers ignoring x0 (lsmr) shall use it
+        self._initial_value_from_coarse_level = False
+
+        # Solvers ignoring x0 (lsmr) start from the current reconstruction
+        self._warm_start = False
+
         self._use_masks = use_masks
 
         self._minimizer = minimizer
@@ -138,13 +243,19 @@ class Solver(object):
             self._N_total_slice_voxels += N_stack_voxels
 
         # Extract information ready to use for itk image conversion operations
-        self._reconstruction_shape = sitk.GetArrayFromImage(
-            self._reconstruction.sitk).shape
+        self._reconstruction_shape = tuple(
+            self._reconstruction.sitk.GetSize())[::-1]
 
         # Compute total amount of voxels of x:
         self._N_voxels_recon = np.array(
             self._reconstruction.sitk.GetSize()).prod()
 
+        # Flattened indices of the voxels within the reconstruction mask the
+        # unknowns are compressed to (None, if all voxels are used)
+        self._compress_unknowns = compress_unknowns
+        self._x_support = None
+        self._update_support()
+
     def set_stacks(self, stacks):
         self._stacks = stacks
 
@@ -157,6 +268,11 @@ class Solver(object):
             N_stack_voxels = np.array(self._stacks[i].sitk.GetSize()).prod()
             self._N_total_slice_voxels += N_stack_voxels
 
+        self._stack_groups = {}
+        self._psf_groups = {}
+        self._buffers = {}
+        self._update_slice_geometry()
+
     ##
     # Specify whether masks shall be used during reconstruction, i.e. whether
     # masking operator is applied (and, thus, zeros everything outside it).
@@ -168,17 +284,121 @@ class Solver(object):
     def set_use_masks(self, use_masks):
         self._use_masks = use_masks
 
+    ##
+    # Specify whether the operators M A and A^* M shall be evaluated using a
+    # sparse system matrix which is assembled once per slice geometry.
+    # \date       2026-10-17 05:13:53+0000
+    #
+    # \param      self               The object
+    # \param      use_system_matrix  boolean
+    #
+    def set_use_system_matrix(self, use_system_matrix):
+        if not use_system_matrix and self._precision != "float64":
+            raise ValueError(
+                "Precision '%s' requires the system matrix" %
+                self._precision)
+        self._use_system_matrix = use_system_matrix
+
+    def get_use_system_matrix(self):
+        return self._use_system_matrix
+
+    ##
+    # Sets the memory limit for the sparse system matrix. If the estimated
+    # size exceeds it, the filter-based operators are used instead.
+    # \date       2026-10-17 05:14:16+0000
+    #
+    # \param      self          The object
+    # \param      memory_limit  memory limit in bytes
+    #
+    def set_system_matrix_memory_limit(self, memory_limit):
+        self._system_matrix_memory_limit = memory_limit
+
+    def get_system_matrix_memory_limit(self):
+        return self._system_matrix_memory_limit
+
+    ##
+    # Specify whether the PSF shall be applied once per group of slices
+    # sharing the same orientation. The reconstruction is then linearly
+    # interpolated on a grid aligned with the slices, blurred by separable
+    # Gaussian filters and linearly interpolated at the slice voxels. This
+    # approximates the oriented Gaussian interpolation at a fraction of the
+    # cost. Groups with a non-separable PSF are evaluated slice-wise.
+    # \date       2026-10-17 05:44:36+0000
+    #
+    # \param      self               The object
+    # \param      use_separable_psf  boolean
+    #
+    def set_use_separable_psf(self, use_separable_psf):
+        self._use_separable_psf = use_separable_psf
+
+    def get_use_separable_psf(self):
+        return self._use_separable_psf
+
+    ##
+    # Specify whether the unknowns shall be compressed to the voxels within
+    # the reconstruction mask. The operators (get_A, get_A_adj), the initial
+    # value (get_x0) and the regularizers then act on the masked voxels only.
+    # \date       2026-10-17 05:32:57+0000
+    #
+    # \param      self               The object
+    # \param      compress_unknowns  boolean
+    #
+    def set_compress_unknowns(self, compress_unknowns):
+        self._compress_unknowns = compress_unknowns
+        self._update_support()
+
+    def get_compress_unknowns(self):
+        return self._compress_unknowns
+
+    ##
+    # Sets the floating point precision of the solver vectors, i.e. the
+    # initial value, the right hand-side and operator outputs, and of the
+    # sparse system matrix.
+    #
+    # Single precision is only supported for the system matrix. The ITK
+    # filters operate on double precision images as the conversions of
+    # pysitk are fixed to itk.D, i.e. the filter-based operators would need
+    # to copy the solver vectors at each evaluation.
+    # \date       2026-10-17 05:37:38+0000
+    #
+    # \param      self       The object
+    # \param      precision  either 'float64' or 'float32'
+    #
+    def set_precision(self, precision):
+        if precision not in PRECISION_OPTIONS:
+            raise ValueError("Precision must be in " + str(PRECISION_OPTIONS))
+        if precision != "float64" and not self._use_system_matrix:
+            raise ValueError(
+                "Precision '%s' requires the system matrix" % precision)
+        self._precision = precision
+        self._dtype = np.dtype(precision)
+
+        # PSF groups hold interpolation matrices in solver precision
+        self._psf_groups = {}
+
+    def get_precision(self):
+        return self._precision
+
     def set_reconstruction(self, reconstruction):
         self._reconstruction = reconstruction
 
+        # PSF covariances and system matrix are expressed in reconstruction
+        # space. Cached ones of the acquisition model are versioned by the
+        # reconstruction grid
+        self._reconstruction_grid = am.AcquisitionModel.get_grid_signature(
+            reconstruction.sitk)
+        self._psf_groups = {}
+
         # Extract information ready to use for itk image conversion operations
-        self._reconstruction_shape = sitk.GetArrayFromImage(
-            self._reconstruction.sitk).shape
+        self._reconstruction_shape = tuple(
+            self._reconstruction.sitk.GetSize())[::-1]
 
         # Compute total amount of voxels of x:
         self._N_voxels_recon = np.array(
             self._reconstruction.sitk.GetSize()).prod()
 
+        self._update_support()
+
     #
     # Set regularization parameter for Tikhonov regularization
     # \date       2017-07-25 15:15:54+0100
@@ -213,6 +433,42 @@ class Solver(object):
     def get_iter_max(self):
         return self._iter_max
 
+    ##
+    # Sets the number of grid levels for a coarse-to-fine reconstruction. The
+    # reconstruction is first obtained on a grid with 2^(n_levels-1) times
+    # the reconstruction spacing, whose upsampled result serves as initial
+    # value for the next finer level until the reconstruction grid is
+    # reached. Each level uses the same settings, e.g. alpha and iter_max.
+    # \date       2026-10-17 05:42:02+0000
+    #
+    # \param      self      The object
+    # \param      n_levels  number of levels, integer; 1 means single-level
+    #                        reconstruction
+    #
+    def set_n_levels(self, n_levels):
+        if int(n_levels) < 1:
+            raise ValueError("Number of levels must be at least 1")
+        self._n_levels = int(n_levels)
+
+    def get_n_levels(self):
+        return self._n_levels
+
+    ##
+    # Specify whether the solver shall start from the current reconstruction
+    # also for minimizers which otherwise start from zero, i.e. lsmr. Useful
+    # if the reconstruction holds an estimate of a previous, similar
+    # reconstruction problem, e.g. of a previous two-step cycle.
+    # \date       2026-10-17 06:20:04+0000
+    #
+    # \param      self        The object
+    # \param      warm_start  boolean
+    #
+    def set_warm_start(self, warm_start):
+        self._warm_start = bool(warm_start)
+
+    def get_warm_start(self):
+        return self._warm_start
+
     ##
     #       Sets the minimizer.
     # \date       2016-11-05 23:40:31+0000
@@ -247,19 +503,220 @@ class Solver(object):
     def set_verbose(self, verbose):
         self._verbose = verbose
 
+    ##
+    # Sets the number of worker threads used to evaluate the forward and
+    # adjoint slice acquisition operators.
+    # \date       2026-10-17 05:07:45+0000
+    #
+    # \param      self       The object
+    # \param      n_threads  number of threads, integer; 1 means serial
+    #                        evaluation
+    #
+    def set_n_threads(self, n_threads):
+        if int(n_threads) < 1:
+            raise ValueError("Number of threads must be at least 1")
+        self._n_threads = int(n_threads)
+
+        # Pool size changed; (re-)create it on next use
+        self.close()
+
+    def get_n_threads(self):
+        return self._n_threads
+
+    ##
+    # Closes the worker pool used to evaluate the slice acquisition
+    # operators and joins its threads. The pool is re-created on next use;
+    # callers evaluating the operators outside of run, e.g. via get_A, are
+    # expected to close the solver afterwards.
+    # \date       2026-10-17 06:08:57+0000
+    #
+    # \param      self  The object
+    #
+    def close(self):
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
     def get_verbose(self):
         return self._verbose
 
     def run(self):
 
+        # Obtain initial value on coarser grids first
+        computational_time = None
+        if self._n_levels > 1:
+            computational_time = self._run_coarse_levels()
+
+        # Precompute slice geometry for current slice positions
+        self._update_slice_geometry()
+
+        # Reconstruction mask may have changed since last run
+        self._update_support()
+
         # Run solver specific reconstruction
-        self._run()
+        try:
+            self._run()
+        finally:
+            self.close()
+        self._initial_value_from_coarse_level = False
+
+        if computational_time is not None:
+            self._computational_time += computational_time
+
+    ##
+    # Run the solver specific reconstruction on the coarse levels, i.e. on
+    # grids with 2^(n_levels-1), ..., 2 times the reconstruction spacing. The
+    # upsampled estimate of the finest coarse level replaces the image of
+    # the reconstruction (in place) to serve as initial value.
+    # \date       2026-10-17 05:42:25+0000
+    #
+    # \param      self  The object
+    #
+    # \return     Accumulated computational time of the coarse levels
+    #
+    def _run_coarse_levels(self):
+        reconstruction = self._reconstruction
+        estimate = reconstruction
+        computational_time = None
+
+        for level in range(self._n_levels - 1, 0, -1):
+            reconstruction_level = self._get_coarse_reconstruction(
+                reconstruction, estimate, 2**level)
+
+            if self._verbose:
+                ph.print_info(
+                    "Coarse-to-fine reconstruction: Level %d/%d (%s voxels)"
+                    % (self._n_levels - level, self._n_levels,
+                       "x".join([str(s) for s in
+                                 reconstruction_level.sitk.GetSize()])))
+
+            self.set_reconstruction(reconstruction_level)
+            self._update_slice_geometry()
+            try:
+                self._run()
+            finally:
+                self.close()
+            self._initial_value_from_coarse_level = True
+
+            if computational_time is None:
+                computational_time = self._computational_time
+            else:
+                computational_time += self._computational_time
+            estimate = self._reconstruction
+
+        # Upsample estimate to reconstruction grid
+        reconstruction.sitk = sitk.Resample(
+            estimate.sitk,
+            reconstruction.sitk,
+            sitk.Euler3DTransform(),
+            sitk.sitkLinear,
+            0.,
+            reconstruction.sitk.GetPixelIDValue())
+        reconstruction.itk = sitkh.get_itk_from_sitk_image(reconstruction.sitk)
+        self.set_reconstruction(reconstruction)
+
+        return computational_time
+
+    ##
+    # Gets the reconstruction on a grid coarser by an integer factor. The
+    # coarse grid covers the same field of view and its voxel centers are
+    # placed at the centers of the corresponding blocks of fine voxels.
+    # \date       2026-10-17 05:42:48+0000
+    #
+    # \param      self            The object
+    # \param      reconstruction  Reconstruction defining the fine grid and
+    #                              mask, Stack object
+    # \param      estimate        Current estimate to be resampled to the
+    #                              coarse grid, Stack object
+    # \param      factor          Coarsening factor, integer
+    #
+    # \return     Coarse reconstruction as Stack object
+    #
+    def _get_coarse_reconstruction(self, reconstruction, estimate, factor):
+        image_sitk = reconstruction.sitk
+        dimension = image_sitk.GetDimension()
+
+        spacing = np.array(image_sitk.GetSpacing())
+        size = np.array(image_sitk.GetSize())
+        direction = np.array(image_sitk.GetDirection()).reshape(
+            dimension, dimension)
+
+        spacing_coarse = spacing * factor
+        size_coarse = np.ceil(size / float(factor)).astype(int)
+        origin_coarse = np.array(image_sitk.GetOrigin()) + \
+            direction.dot((factor - 1) / 2. * spacing)
+
+        resampler = sitk.ResampleImageFilter()
+        resampler.SetSize([int(s) for s in size_coarse])
+        resampler.SetOutputSpacing(spacing_coarse)
+        resampler.SetOutputOrigin(origin_coarse)
+        resampler.SetOutputDirection(image_sitk.GetDirection())
+        resampler.SetOutputPixelType(image_sitk.GetPixelIDValue())
+        resampler.SetInterpolator(sitk.sitkLinear)
+        image_sitk_coarse = resampler.Execute(estimate.sitk)
+
+        resampler.SetOutputPixelType(
+            reconstruction.sitk_mask.GetPixelIDValue())
+        resampler.SetInterpolator(sitk.sitkNearestNeighbor)
+        image_sitk_mask_coarse = resampler.Execute(reconstruction.sitk_mask)
+
+        return st.Stack.from_sitk_image(
+            image_sitk=image_sitk_coarse,
+            slice_thickness=spacing_coarse[-1],
+            filename=reconstruction.get_filename(),
+            image_sitk_mask=image_sitk_mask_coarse,
+            extract_slices=False,
+        )
 
     # Get current estimate of reconstruction
     #  \return current estimate of reconstruction, instance of Stack
     def get_reconstruction(self):
         return self._reconstruction
 
+    ##
+    # Gets the slice acquisition model which can be shared with other solvers
+    # operating on the same slices, see AcquisitionModel.
+    # \date       2026-10-17 05:53:19+0000
+    #
+    # \param      self  The object
+    #
+    # \return     AcquisitionModel object
+    #
+    def get_acquisition_model(self):
+        return self._acquisition_model
+
+    ##
+    # Gets a copy of the solver with identical settings. The copy owns its
+    # reconstruction, operators and acquisition model so that copies can be
+    # run independently of each other, e.g. by concurrent workers.
+    # \date       2026-10-17 05:54:25+0000
+    #
+    # \param      self  The object
+    #
+    # \return     Solver object of same type.
+    #
+    def get_copy(self):
+        solver = copy.copy(self)
+        solver._reconstruction = st.Stack.from_stack(self._reconstruction)
+
+        solver._linear_operators = solver._create_linear_operators()
+        solver._linear_operators_workers = [solver._linear_operators]
+        solver._pool = None
+        solver._operator_lock = threading.Lock()
+        solver._stack_groups = {}
+        solver._psf_groups = {}
+        solver._buffers = {}
+
+        solver._acquisition_model = am.AcquisitionModel(
+            alpha_cut=self._alpha_cut,
+            deconvolution_mode=self._deconvolution_mode,
+            predefined_covariance=self._predefined_covariance,
+            image_type=self._image_type,
+        )
+
+        return solver
+
     # Get cut-off distance
     #  \return scalar value
     def get_alpha_cut(self):
@@ -279,7 +736,7 @@ class Solver(object):
     # \return     Function call mapping from and to 1D numpy array.
     #
     def get_A(self):
-        return lambda x: self._MA(x)
+        return lambda x: self._MA(self._get_x_full(x))
 
     ##
     # Gets function call A^* = lambda y: A^*(y) with A: R^m -> R^n
@@ -290,7 +747,19 @@ class Solver(object):
     # \return     Function call mapping from and to 1D numpy array.
     #
     def get_A_adj(self):
-        return lambda x: self._A_adj_M(x)
+        return lambda x: self._get_x_compressed(self._A_adj_M(x))
+
+    ##
+    # Gets the sparse system matrix M A for the current slice geometry.
+    # \date       2026-10-17 05:14:39+0000
+    #
+    # \param      self  The object
+    #
+    # \return     System matrix as scipy.sparse.csr_matrix; None if system
+    #             matrix is not used or exceeds the memory limit
+    #
+    def get_system_matrix(self):
+        return self._get_system_matrix()
 
     ##
     # Gets the right hand-side vector b \in R^m
@@ -313,7 +782,9 @@ class Solver(object):
     # \return     1D numpy array
     #
     def get_x0(self):
-        return sitk.GetArrayFromImage(self._reconstruction.sitk).flatten()
+        return self._get_x_compressed(
+            sitk.GetArrayFromImage(self._reconstruction.sitk).ravel()).astype(
+                self._dtype, copy=False)
 
     def get_x_scale(self):
         return self._x_scale
@@ -340,6 +811,98 @@ class Solver(object):
     def get_solver(self):
         pass
 
+    ##
+    # Gets the first-order differential operator (forward differences with
+    # zero boundary conditions) and its adjoint acting on the unknowns.
+    #
+    # If the unknowns are compressed to the reconstruction mask, the
+    # operator is restricted to the masked voxels, i.e. it evaluates the
+    # differences for the masked voxels only whereby unmasked neighbours are
+    # zero.
+    # \date       2026-10-17 05:33:20+0000
+    #
+    # \param      self  The object
+    #
+    # \return     Function calls B and B_adj mapping from and to 1D numpy
+    #             arrays. The output of B stacks the x-, y- and
+    #             z-differentials.
+    #
+    def get_gradient_operators(self):
+        spacing = np.array(self._reconstruction.sitk.GetSpacing())
+
+        if self._x_support is None:
+            linear_operators = linop.LinearOperators3D(spacing=spacing)
+            grad, grad_adj = linear_operators.get_gradient_operators()
+
+            X_shape = self._reconstruction_shape
+            Z_shape = (len(spacing) * X_shape[0],) + X_shape[1:]
+
+            B = lambda x: grad(x.reshape(*X_shape)).ravel()
+            B_adj = lambda x: grad_adj(x.reshape(*Z_shape)).ravel()
+
+        else:
+            D = self._get_support_gradient_matrix(spacing).astype(self._dtype)
+            D_adj = D.transpose().tocsr()
+
+            B = lambda x: D.dot(x)
+            B_adj = lambda x: D_adj.dot(x)
+
+        return B, B_adj
+
+    ##
+    # Gets the diagonal of B^* B for the first-order differential operator B
+    # as returned by get_gradient_operators.
+    # \date       2026-10-17 05:39:14+0000
+    #
+    # \param      self  The object
+    #
+    # \return     Diagonal as 1D numpy array acting on the unknowns
+    #
+    def get_gradient_operators_diagonal(self):
+        spacing = np.array(self._reconstruction.sitk.GetSpacing())
+
+        if self._x_support is not None:
+            D = self._get_support_gradient_matrix(spacing)
+            return np.asarray(
+                D.multiply(D).sum(axis=0)).ravel().astype(self._dtype)
+
+        # Forward difference with zero boundary: each voxel enters the
+        # difference of itself and the one of its preceding neighbour
+        shape = self._reconstruction_shape
+        diagonal = np.zeros(shape, dtype=self._dtype)
+        for axis, h in zip([2, 1, 0], spacing):
+            counts = np.full(shape[axis], 2.)
+            counts[0] = 1
+            counts_shape = [1] * len(shape)
+            counts_shape[axis] = shape[axis]
+            diagonal += counts.reshape(counts_shape) / h**2
+
+        return diagonal.ravel()
+
+    ##
+    # Gets the diagonal of A^* A acting on the unknowns.
+    #
+    # If the system matrix is used, the diagonal is computed exactly.
+    # Otherwise, it is bounded from above by the row sums A^* A 1 using one
+    # evaluation of the forward and adjoint operator since all entries of A
+    # are non-negative.
+    # \date       2026-10-17 05:39:37+0000
+    #
+    # \param      self  The object
+    #
+    # \return     Diagonal as 1D numpy array acting on the unknowns
+    #
+    def get_A_adj_A_diagonal(self):
+
+        system_matrix = self._get_system_matrix()
+        if system_matrix is not None:
+            diagonal = np.asarray(
+                system_matrix.multiply(system_matrix).sum(axis=0)).ravel()
+            return self._get_x_compressed(diagonal).astype(self._dtype)
+
+        ones = np.ones_like(self.get_x0())
+        return self.get_A_adj()(self.get_A()(ones))
+
     ##
     #       Gets the predefined covariance.
     # \date       2016-10-14 16:52:10+0100
@@ -351,6 +914,104 @@ class Solver(object):
     def get_predefined_covariance(self):
         return self._predefined_covariance
 
+    ##
+    # Update the voxel indices the unknowns are compressed to based on the
+    # current reconstruction mask.
+    # \date       2026-10-17 05:33:43+0000
+    #
+    # \param      self  The object
+    #
+    def _update_support(self):
+        self._x_support = None
+        if not self._compress_unknowns:
+            return
+
+        mask_nda = sitk.GetArrayFromImage(self._reconstruction.sitk_mask)
+        x_support = np.flatnonzero(mask_nda)
+        if x_support.size == 0:
+            ph.print_warning(
+                "Reconstruction mask is empty. All voxels are used as "
+                "unknowns.")
+            return
+
+        self._x_support = x_support
+
+    ##
+    # Map compressed unknowns to the flattened reconstruction data array.
+    # \date       2026-10-17 05:34:06+0000
+    #
+    # \param      self  The object
+    # \param      x     unknowns as 1D array
+    #
+    # \return     reconstruction data as 1D array
+    #
+    def _get_x_full(self, x):
+        if self._x_support is None:
+            return x
+        x_full = np.zeros(self._N_voxels_recon, dtype=x.dtype)
+        x_full[self._x_support] = x
+        return x_full
+
+    ##
+    # Map the flattened reconstruction data array to the compressed
+    # unknowns.
+    # \date       2026-10-17 05:34:29+0000
+    #
+    # \param      self    The object
+    # \param      x_full  reconstruction data as 1D array
+    #
+    # \return     unknowns as 1D array
+    #
+    def _get_x_compressed(self, x_full):
+        if self._x_support is None:
+            return x_full
+        return x_full[self._x_support]
+
+    ##
+    # Gets the forward difference operators restricted to the voxels the
+    # unknowns are compressed to as sparse matrix. Consistent with
+    # nsol.linear_operators.LinearOperators3D.get_gradient_operators applied
+    # to the zero-filled reconstruction, evaluated at the masked voxels.
+    # \date       2026-10-17 05:34:52+0000
+    #
+    # \param      self     The object
+    # \param      spacing  reconstruction spacing in (x, y, z) order
+    #
+    # \return     Sparse matrix of shape (3 N, N) with N being the number of
+    #             unknowns
+    #
+    def _get_support_gradient_matrix(self, spacing):
+        N = self._x_support.size
+        shape = self._reconstruction_shape
+
+        # Map from reconstruction voxel to index of unknown
+        index_map = -np.ones(self._N_voxels_recon, dtype=np.int64)
+        index_map[self._x_support] = np.arange(N)
+        indices = np.unravel_index(self._x_support, shape)
+
+        rows = np.arange(N)
+        blocks = []
+
+        # x-, y- and z-differentials along axes 2, 1 and 0 of data array
+        for axis, h in zip([2, 1, 0], spacing):
+            indices_neighbour = list(indices)
+            indices_neighbour[axis] = indices[axis] + 1
+            is_inside = indices_neighbour[axis] < shape[axis]
+
+            cols_neighbour = -np.ones(N, dtype=np.int64)
+            cols_neighbour[is_inside] = index_map[np.ravel_multi_index(
+                [i[is_inside] for i in indices_neighbour], shape)]
+            has_neighbour = cols_neighbour >= 0
+
+            blocks.append(scipy.sparse.csr_matrix(
+                (np.concatenate([
+                    -np.ones(N), np.ones(np.sum(has_neighbour))]) / h,
+                 (np.concatenate([rows, rows[has_neighbour]]),
+                  np.concatenate([rows, cols_neighbour[has_neighbour]]))),
+                shape=(N, N)))
+
+        return scipy.sparse.vstack(blocks, format="csr")
+
     ##
     # Evaluate
     # \f$ M \vec{y}
@@ -364,42 +1025,12 @@ class Solver(object):
     # \return     My, i.e. all masked slices stacked to 1D array
     #
     def _get_M_y(self):
-
-        # Allocate memory
-        My = np.zeros(self._N_total_slice_voxels)
-
-        # Define index for first voxel of first slice within array
-        i_min = 0
-
-        for i, stack in enumerate(self._stacks):
-            slices = stack.get_slices()
-
-            # Get number of voxels of each slice in current stack
-            N_slice_voxels = np.array(slices[0].sitk.GetSize()).prod()
-
-            for j, slice_j in enumerate(slices):
-
-                # Define index for last voxel to specify current slice
-                # (exlusive)
-                i_max = i_min + N_slice_voxels
-
-                # Apply M_k y_k
-                if self._use_masks:
-                    slice_itk = self._linear_operators.M_itk(
-                        slice_j.itk, slice_j.itk_mask)
-                else:
-                    slice_itk = slice_j.itk
-                slice_nda_vec = self._itk2np.GetArrayFromImage(
-                    slice_itk).flatten()
-
-                # Fill respective elements
-                My[i_min:i_max] = slice_nda_vec
-
-                # Define index for first voxel to specify subsequent slice
-                # (inclusive)
-                i_min = i_max
-
-        return My
+        slices = [s for stack in self._stacks for s in stack.get_slices()]
+        return self._acquisition_model.get_M_y(
+            slices,
+            self._N_total_slice_voxels,
+            use_masks=self._use_masks,
+            dtype=self._dtype)
 
     ##
     # Operation M_k A_k x
@@ -408,25 +1039,28 @@ class Solver(object):
     # \param      self       The object
     # \param      reconstruction_itk  reconstruction image as itk.Image object
     # \param      slice_k    Slice object which defines operator M_k and A_k
+    # \param      linear_operators  LinearOperators object to use; defaults to
+    #                              the ones of the solver
     #
     # \return     { description_of_the_return_value }
     #
-    def _Mk_Ak(self, reconstruction_itk, slice_k):
+    def _Mk_Ak(self, reconstruction_itk, slice_k, linear_operators=None):
 
-        # Get slice spacing relevant for Gaussian blurring estimate
-        in_plane_res = slice_k.get_inplane_resolution()
-        slice_thickness = slice_k.get_slice_thickness()
-        slice_spacing = np.array([in_plane_res, in_plane_res, slice_thickness])
+        if linear_operators is None:
+            linear_operators = self._linear_operators
+
+        # Get slice spacing and PSF covariance for Gaussian blurring estimate
+        slice_spacing, cov = self._get_slice_geometry(slice_k)
 
         # Compute A_k x
-        Ak_reconstruction_itk = self._linear_operators.A_itk(
-            reconstruction_itk, slice_k.itk, slice_spacing)
+        Ak_reconstruction_itk = linear_operators.A_itk(
+            reconstruction_itk, slice_k.itk, slice_spacing, cov=cov)
 
         if not self._use_masks:
             return Ak_reconstruction_itk
 
         # Compute M_k A_k x
-        Ak_reconstruction_itk = self._linear_operators.M_itk(
+        Ak_reconstruction_itk = linear_operators.M_itk(
             Ak_reconstruction_itk, slice_k.itk_mask)
 
         return Ak_reconstruction_itk
@@ -438,27 +1072,35 @@ class Solver(object):
     # \param      self       The object
     # \param      slice_itk  LR image as itk.Image object
     # \param      slice_k    Slice object which defines operator A_k^*
+    # \param      linear_operators  LinearOperators object to use; defaults to
+    #                              the ones of the solver
+    # \param      region     Optional region (index, size) of the
+    #                        reconstruction space the output is restricted
+    #                        to, see _get_adjoint_region
     #
-    # \return     image in reconstruction space as itk.Image object after
-    #             performed backward operation
+    # \return     image in reconstruction space (or its region) as itk.Image
+    #             object after performed backward operation
     #
-    def _Ak_adj_Mk(self, slice_itk, slice_k):
+    def _Ak_adj_Mk(self, slice_itk, slice_k, linear_operators=None,
+                   region=None):
+
+        if linear_operators is None:
+            linear_operators = self._linear_operators
 
         # Compute M_k y_k
         if self._use_masks:
-            Mk_slice_itk = self._linear_operators.M_itk(
+            Mk_slice_itk = linear_operators.M_itk(
                 slice_itk, slice_k.itk_mask)
         else:
             Mk_slice_itk = slice_itk
 
-        # Get slice spacing relevant for Gaussian blurring estimate
-        in_plane_res = slice_k.get_inplane_resolution()
-        slice_thickness = slice_k.get_slice_thickness()
-        slice_spacing = np.array([in_plane_res, in_plane_res, slice_thickness])
+        # Get slice spacing and PSF covariance for Gaussian blurring estimate
+        slice_spacing, cov = self._get_slice_geometry(slice_k)
 
         # Compute A_k^* M_k y_k
-        Mk_slice_itk = self._linear_operators.A_adj_itk(
-            Mk_slice_itk, self._reconstruction.itk, slice_spacing)
+        Mk_slice_itk = linear_operators.A_adj_itk(
+            Mk_slice_itk, self._reconstruction.itk, slice_spacing, cov=cov,
+            region=region)
 
         return Mk_slice_itk
 
@@ -479,38 +1121,21 @@ class Solver(object):
     #
     def _MA(self, reconstruction_nda_vec):
 
-        # Convert reconstruction data array back to itk.Image object
-        x_itk = self._get_itk_image_from_array_vec(
-            reconstruction_nda_vec, self._reconstruction.itk)
-
-        # Allocate memory
-        MA_x = np.zeros(self._N_total_slice_voxels)
-
-        # Define index for first voxel of first slice within array
-        i_min = 0
-
-        for i, stack in enumerate(self._stacks):
-            slices = stack.get_slices()
-
-            # Get number of voxels of each slice in current stack
-            N_slice_voxels = np.array(slices[0].sitk.GetSize()).prod()
-
-            for j, slice_j in enumerate(slices):
-
-                # Define index for last voxel to specify current slice
-                # (exclusive)
-                i_max = i_min + N_slice_voxels
+        system_matrix = self._get_system_matrix()
+        if system_matrix is not None:
+            return system_matrix.dot(reconstruction_nda_vec)
 
-                # Compute M_k A_k y_k
-                slice_itk = self._Mk_Ak(x_itk, slice_j)
-                slice_nda = self._itk2np.GetArrayFromImage(slice_itk)
+        with self._operator_lock:
 
-                # Fill corresponding elements
-                MA_x[i_min:i_max] = slice_nda.flatten()
+            # Allocate memory
+            MA_x = np.zeros(self._N_total_slice_voxels, dtype=self._dtype)
 
-                # Define index for first voxel to specify subsequent slice
-                # (inclusive)
-                i_min = i_max
+            # Each worker writes directly into its slice range of MA_x
+            chunks = self._get_operator_chunks()
+            self._map(
+                lambda i: self._MA_chunk(
+                    reconstruction_nda_vec, MA_x, chunks[i], i),
+                len(chunks))
 
         return MA_x
 
@@ -529,8 +1154,260 @@ class Solver(object):
     #
     def _A_adj_M(self, stacked_slices_nda_vec):
 
-        # Allocate memory
-        A_adj_M_y = np.zeros(self._N_voxels_recon)
+        system_matrix = self._get_system_matrix()
+        if system_matrix is not None:
+            return system_matrix.transpose().dot(stacked_slices_nda_vec)
+
+        with self._operator_lock:
+
+            # Each worker computes the partial sum over its slices
+            chunks = self._get_operator_chunks()
+            A_adj_M_y_partials = self._map(
+                lambda i: self._A_adj_M_chunk(
+                    stacked_slices_nda_vec, chunks[i], i),
+                len(chunks))
+
+            # Reduce partial sums held by the worker buffers
+            A_adj_M_y = A_adj_M_y_partials[0].astype(self._dtype)
+            for A_adj_M_y_partial in A_adj_M_y_partials[1:]:
+                A_adj_M_y += A_adj_M_y_partial
+
+        return A_adj_M_y
+
+    ##
+    # Evaluate M_k A_k x for a subset of slices and write the results into the
+    # associated index ranges of the output array.
+    # \date       2026-10-17 05:08:08+0000
+    #
+    # \param      self                    The object
+    # \param      reconstruction_nda_vec  reconstruction data as 1D array
+    # \param      MA_x                    output array holding all slices
+    # \param      chunk                   list of (stack_group, psf_group,
+    #                                     slice_ranges) tuples, see
+    #                                     _get_operator_chunks
+    # \param      i_worker                index of worker, integer
+    #
+    def _MA_chunk(self, reconstruction_nda_vec, MA_x, chunk, i_worker):
+
+        linear_operators = self._get_linear_operators(i_worker)
+
+        # Wrap reconstruction data array as itk.Image object. Each worker
+        # uses its own image (sharing the same memory) to avoid sharing
+        # pipeline inputs
+        x_itk = self._get_itk_image_view_from_array_vec(
+            reconstruction_nda_vec, self._reconstruction.itk)
+
+        for stack_group, psf_group, slice_ranges in chunk:
+
+            # Compute M_k A_k y_k for all slices of the group at once
+            if psf_group is not None:
+                self._M_A_psf_group(
+                    reconstruction_nda_vec, psf_group, linear_operators,
+                    slice_ranges, MA_x)
+                continue
+
+            # Compute M_k A_k y_k for all slices of the stack at once
+            if stack_group is not None:
+                i_min = slice_ranges[0][1]
+                i_max = slice_ranges[-1][2]
+                self._M_A_stack(
+                    x_itk, stack_group, linear_operators, MA_x[i_min:i_max])
+                continue
+
+            for slice_k, i_min, i_max in slice_ranges:
+
+                # Compute M_k A_k y_k
+                slice_itk = self._Mk_Ak(x_itk, slice_k, linear_operators)
+                slice_nda = self._itk2np.GetArrayViewFromImage(slice_itk)
+
+                # Fill corresponding elements
+                MA_x[i_min:i_max] = slice_nda.ravel()
+
+    ##
+    # Evaluate sum_k A_k^* M_k y_k over a subset of slices.
+    # \date       2026-10-17 05:08:31+0000
+    #
+    # \param      self                    The object
+    # \param      stacked_slices_nda_vec  stacked slice data as 1D array
+    # \param      chunk                   list of (stack_group, psf_group,
+    #                                     slice_ranges) tuples, see
+    #                                     _get_operator_chunks
+    # \param      i_worker                index of worker, integer
+    #
+    # \return     partial sum as 1D array in reconstruction space
+    #
+    def _A_adj_M_chunk(self, stacked_slices_nda_vec, chunk, i_worker):
+
+        linear_operators = self._get_linear_operators(i_worker)
+
+        # Reuse the memory of the worker
+        A_adj_M_y = self._get_buffer(i_worker, "A_adj_M", self._N_voxels_recon)
+        A_adj_M_y.fill(0)
+
+        for stack_group, psf_group, slice_ranges in chunk:
+
+            # Apply A_k' M_k on all slices of the group at once
+            if psf_group is not None:
+                self._A_adj_M_psf_group(
+                    stacked_slices_nda_vec, psf_group, linear_operators,
+                    slice_ranges, A_adj_M_y)
+                continue
+
+            # Apply A_k' M_k on all slices of the stack at once
+            if stack_group is not None:
+                i_min = slice_ranges[0][1]
+                i_max = slice_ranges[-1][2]
+                self._A_adj_M_stack(
+                    stacked_slices_nda_vec[i_min:i_max],
+                    stack_group,
+                    linear_operators,
+                    i_worker,
+                    A_adj_M_y)
+                continue
+
+            for slice_k, i_min, i_max in slice_ranges:
+
+                # Only evaluate the region affected by the slice
+                region = self._get_adjoint_region(slice_k, slice_k.itk)
+                if region is None:
+                    continue
+
+                # Wrap 1D array corresponding to current slice as
+                # itk.Object
+                slice_itk = self._get_itk_image_view_from_array_vec(
+                    stacked_slices_nda_vec[i_min:i_max], slice_k.itk)
+
+                # Apply A_k' M_k on current slice
+                Ak_adj_Mk_slice_itk = self._Ak_adj_Mk(
+                    slice_itk, slice_k, linear_operators, region=region)
+
+                # Add contribution
+                self._add_to_region(A_adj_M_y, Ak_adj_Mk_slice_itk, region)
+
+        return A_adj_M_y
+
+    ##
+    # Evaluate M_k A_k x for all slices of a stack using a single filter
+    # execution on the entire stack grid.
+    # \date       2026-10-17 05:15:41+0000
+    #
+    # \param      self                The object
+    # \param      reconstruction_itk  reconstruction image as itk.Image object
+    # \param      stack_group         stack group, see _get_stack_group
+    # \param      linear_operators    LinearOperators object to use
+    # \param      out                 output array the masked simulated
+    #                                 slices are written to as 1D array
+    #
+    def _M_A_stack(self,
+                   reconstruction_itk,
+                   stack_group,
+                   linear_operators,
+                   out):
+
+        stack, slice_0, indices, masks_nda = stack_group
+        slice_spacing, cov = self._get_slice_geometry(slice_0)
+
+        stack_itk = linear_operators.A_itk(
+            reconstruction_itk, stack.itk, slice_spacing, cov=cov)
+        stack_nda = self._itk2np.GetArrayViewFromImage(stack_itk)
+
+        slices_nda = out.reshape(masks_nda.shape)
+        np.take(stack_nda, indices, axis=0, out=slices_nda)
+        if self._use_masks:
+            slices_nda *= masks_nda
+
+    ##
+    # Evaluate sum_k A_k^* M_k y_k for all slices of a stack using a single
+    # filter execution on the entire stack grid.
+    # \date       2026-10-17 05:16:04+0000
+    #
+    # \param      self              The object
+    # \param      slices_nda_vec    stacked slice data of the stack as 1D
+    #                               array
+    # \param      stack_group       stack group, see _get_stack_group
+    # \param      linear_operators  LinearOperators object to use
+    # \param      i_worker          index of worker, integer
+    # \param      out               1D array in reconstruction space the
+    #                               contribution is added to
+    #
+    def _A_adj_M_stack(self,
+                       slices_nda_vec,
+                       stack_group,
+                       linear_operators,
+                       i_worker,
+                       out):
+
+        stack, slice_0, indices, masks_nda = stack_group
+        slice_spacing, cov = self._get_slice_geometry(slice_0)
+
+        # Only evaluate the region affected by the stack
+        region = self._get_adjoint_region(slice_0, stack.itk)
+        if region is None:
+            return
+
+        # Deleted slices do not contribute
+        stack_nda = self._get_buffer(
+            i_worker, stack, tuple(stack.sitk.GetSize())[::-1])
+        stack_nda.fill(0)
+        stack_nda[indices] = slices_nda_vec.reshape(masks_nda.shape)
+        if self._use_masks:
+            stack_nda[indices] *= masks_nda
+        stack_itk = self._get_itk_image_view_from_array_vec(
+            stack_nda, stack.itk)
+
+        A_adj_M_itk = linear_operators.A_adj_itk(
+            stack_itk, self._reconstruction.itk, slice_spacing, cov=cov,
+            region=region)
+
+        self._add_to_region(out, A_adj_M_itk, region)
+
+    ##
+    # Gets the region of the reconstruction space affected by the backward
+    # operation of a slice or the stack grid it is aligned with.
+    # \date       2026-10-17 05:27:04+0000
+    #
+    # \param      self       The object
+    # \param      slice_k    Slice object which defines the PSF covariance
+    # \param      image_itk  Image grid of slice or stack as itk.Image object
+    #
+    # \return     Region as tuple (index, size), see
+    #             LinearOperators.get_adjoint_region; None if not affected
+    #
+    def _get_adjoint_region(self, slice_k, image_itk):
+        slice_spacing, cov = self._get_slice_geometry(slice_k)
+        return self._linear_operators.get_adjoint_region(
+            image_itk, self._reconstruction.itk, cov)
+
+    ##
+    # Add an image defined on a region of the reconstruction space to the
+    # associated voxels of a 1D array in reconstruction space.
+    # \date       2026-10-17 05:27:27+0000
+    #
+    # \param      self       The object
+    # \param      out        1D array in reconstruction space
+    # \param      image_itk  Image on region as itk.Image object
+    # \param      region     Region as tuple (index, size) in (x, y, z) order
+    #
+    def _add_to_region(self, out, image_itk, region):
+        index, size = region
+        end = index + size
+        out.reshape(self._reconstruction_shape)[
+            index[2]:end[2], index[1]:end[1], index[0]:end[0]] += \
+            self._itk2np.GetArrayViewFromImage(image_itk)
+
+    ##
+    # Gets the index ranges of all slices within the stacked slice vector.
+    # \date       2026-10-17 05:16:27+0000
+    #
+    # \param      self  The object
+    #
+    # \return     List holding for each stack a list of (slice, i_min, i_max)
+    #             tuples where [i_min, i_max) defines the index range of the
+    #             slice within the stacked slice vector.
+    #
+    def _get_slice_ranges(self):
+
+        stacks_slice_ranges = []
 
         # Define index for first voxel of first slice within array
         i_min = 0
@@ -541,30 +1418,411 @@ class Solver(object):
             # Get number of voxels of each slice in current stack
             N_slice_voxels = np.array(slices[0].sitk.GetSize()).prod()
 
+            slice_ranges = []
             for j, slice_j in enumerate(slices):
 
                 # Define index for last voxel to specify current slice
-                # (exlusive)
+                # (exclusive)
                 i_max = i_min + N_slice_voxels
 
-                # Extract 1D corresponding to current slice and convert it to
-                # itk.Object
-                slice_itk = self._get_itk_image_from_array_vec(
-                    stacked_slices_nda_vec[i_min:i_max], slice_j.itk)
-
-                # Apply A_k' M_k on current slice
-                Ak_adj_Mk_slice_itk = self._Ak_adj_Mk(slice_itk, slice_j)
-                Ak_adj_Mk_slice_nda_vec = self._itk2np.GetArrayFromImage(
-                    Ak_adj_Mk_slice_itk).flatten()
-
-                # Add contribution
-                A_adj_M_y += Ak_adj_Mk_slice_nda_vec
+                slice_ranges.append((slice_j, i_min, i_max))
 
                 # Define index for first voxel to specify subsequent slice
                 # (inclusive)
                 i_min = i_max
 
-        return A_adj_M_y
+            stacks_slice_ranges.append(slice_ranges)
+
+        return stacks_slice_ranges
+
+    ##
+    # Split all slices of all stacks into chunks of operator evaluations, one
+    # per worker. Slices of stacks which are still aligned with the stack
+    # geometry are grouped so that the operators can be evaluated for the
+    # entire stack at once. If the separable PSF is used, slices sharing the
+    # same orientation are grouped instead.
+    # \date       2026-10-17 05:16:50+0000
+    #
+    # \param      self  The object
+    #
+    # \return     List of chunks; each chunk is a list of (stack_group,
+    #             psf_group, slice_ranges) tuples where stack_group is either
+    #             None or the stack group as returned by _get_stack_group,
+    #             psf_group is either None or one of the groups returned by
+    #             _get_psf_groups (both None means slice-wise evaluation) and
+    #             slice_ranges the list of (slice, i_min, i_max) tuples.
+    #
+    def _get_operator_chunks(self):
+
+        groups = []
+        for stack, slice_ranges in zip(
+                self._stacks, self._get_slice_ranges()):
+            psf_groups = self._get_psf_groups(stack) \
+                if self._use_separable_psf else None
+            if psf_groups is not None:
+                groups.extend([
+                    (None, psf_group, [slice_ranges[j] for j in psf_group[0]])
+                    for psf_group in psf_groups])
+                continue
+
+            stack_group = self._get_stack_group(stack)
+            if stack_group is not None:
+                groups.append((stack_group, None, slice_ranges))
+            else:
+                groups.extend([(None, None, [r]) for r in slice_ranges])
+
+        # Distribute groups to workers with similar number of slices each
+        N_chunks = max(1, min(self._n_threads, len(groups)))
+        N_slices = sum(len(g[2]) for g in groups)
+        chunks = [[] for i in range(N_chunks)]
+        N_assigned = 0
+        for group in groups:
+            chunks[N_assigned * N_chunks // N_slices].append(group)
+            N_assigned += len(group[2])
+
+        return [chunk for chunk in chunks if len(chunk) > 0]
+
+    ##
+    # Gets the stack group of a stack, i.e. the information to evaluate the
+    # operators for all its slices at once. This is only possible as long as
+    # all slices are still aligned with the stack geometry, e.g. prior to
+    # slice-to-volume registration.
+    #
+    # Results are cached and recomputed only if slices were moved or removed
+    # or if their masks were replaced. Masks are compared by identity.
+    # \date       2026-10-17 05:17:13+0000
+    #
+    # \param      self   The object
+    # \param      stack  Stack object
+    #
+    # \return     None if slices are not aligned with stack; otherwise tuple
+    #             (stack, slice_0, indices, masks_nda) with slice_0 the first
+    #             slice defining the PSF, indices the slice indices within
+    #             the stack grid and masks_nda the (N_slices, ny, nx) slice
+    #             masks.
+    #
+    def _get_stack_group(self, stack):
+
+        slices = stack.get_slices()
+        signature = tuple(
+            (s, s.get_motion_correction_version()) for s in slices)
+        masks = [s.sitk_mask for s in slices]
+        cached = self._stack_groups.get(stack)
+        if cached is not None and cached[0] == signature and \
+                all(m is m_c for m, m_c in zip(masks, cached[1])):
+            return cached[2]
+
+        stack_group = self._create_stack_group(stack, slices)
+        self._stack_groups[stack] = (signature, masks, stack_group)
+
+        return stack_group
+
+    def _create_stack_group(self, stack, slices, tolerance=1e-6):
+
+        stack_sitk = stack.sitk
+        direction = np.array(stack_sitk.GetDirection())
+        spacing = np.array(stack_sitk.GetSpacing())
+        size = np.array(stack_sitk.GetSize())
+        slice_spacing_0 = self._get_slice_geometry(slices[0])[0]
+
+        indices = []
+        for slice_k in slices:
+            slice_sitk = slice_k.sitk
+
+            # Slice must coincide with one slice of the stack grid and PSF
+            # must be identical
+            cindex = np.array(
+                stack_sitk.TransformPhysicalPointToContinuousIndex(
+                    slice_sitk.GetOrigin()))
+            index = int(np.round(cindex[2]))
+            if not np.allclose(cindex, [0, 0, index], atol=tolerance) or \
+                    not 0 <= index < size[2] or \
+                    not np.allclose(slice_sitk.GetDirection(), direction,
+                                    atol=tolerance) or \
+                    not np.allclose(slice_sitk.GetSpacing(), spacing,
+                                    atol=tolerance) or \
+                    not np.all(slice_sitk.GetSize()[0:2] == size[0:2]) or \
+                    not np.allclose(self._get_slice_geometry(slice_k)[0],
+                                    slice_spacing_0):
+                return None
+            indices.append(index)
+
+        if len(set(indices)) != len(indices):
+            return None
+
+        masks_nda = np.concatenate([
+            sitk.GetArrayFromImage(s.sitk_mask) for s in slices
+        ]).astype(np.float64)
+
+        return (stack, slices[0], np.array(indices), masks_nda)
+
+    ##
+    # Gets the groups of slices of a stack which share the same orientation
+    # and PSF so that the PSF can be applied once per group as separable
+    # filter, see set_use_separable_psf.
+    #
+    # Results are cached and recomputed only if slices were moved or
+    # removed.
+    # \date       2026-10-17 05:44:59+0000
+    #
+    # \param      self   The object
+    # \param      stack  Stack object
+    #
+    # \return     None if the PSF of a group is not separable; otherwise list
+    #             of tuples (indices, grid_shape, sigma, S, T) with indices
+    #             the indices of the slices within the stack, grid_shape the
+    #             shape of the grid aligned with the slices, sigma the PSF
+    #             standard deviations in grid voxels, T the sparse
+    #             interpolation of the reconstruction on the grid and S the
+    #             (masked) sparse interpolation of the grid at the slice
+    #             voxels.
+    #
+    def _get_psf_groups(self, stack):
+
+        slices = stack.get_slices()
+        signature = tuple(
+            (s, s.get_motion_correction_version()) for s in slices) + \
+            (self._use_masks,)
+        cached = self._psf_groups.get(stack)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        psf_groups = self._create_psf_groups(slices)
+        self._psf_groups[stack] = (signature, psf_groups)
+
+        return psf_groups
+
+    def _create_psf_groups(self, slices, tolerance=1e-3):
+
+        # Partition slices according to orientation and PSF
+        partition = []
+        for j, slice_k in enumerate(slices):
+            direction = np.array(slice_k.sitk.GetDirection())
+            slice_spacing = self._get_slice_geometry(slice_k)[0]
+            for direction_0, slice_spacing_0, indices in partition:
+                if np.allclose(direction, direction_0, atol=tolerance) and \
+                        np.allclose(slice_spacing, slice_spacing_0):
+                    indices.append(j)
+                    break
+            else:
+                partition.append((direction, slice_spacing, [j]))
+
+        psf_groups = []
+        for direction, slice_spacing, indices in partition:
+            slices_group = [slices[j] for j in indices]
+            cov = self._get_slice_geometry(slices_group[0])[1]
+            grid = self._linear_operators.get_separable_psf_grid(
+                self._reconstruction.itk, [s.itk for s in slices_group], cov)
+            if grid is None:
+                return None
+            grid_itk, sigma = grid
+
+            T = self._linear_operators.get_interpolation_sparse(
+                self._reconstruction.itk, grid_itk)
+            S = scipy.sparse.vstack([
+                self._linear_operators.get_interpolation_sparse(
+                    grid_itk, s.itk,
+                    weights_nda=sitk.GetArrayFromImage(s.sitk_mask)
+                    if self._use_masks else None)
+                for s in slices_group], format="csr")
+
+            grid_shape = tuple(
+                grid_itk.GetLargestPossibleRegion().GetSize())[::-1]
+            psf_groups.append((
+                indices, grid_shape, sigma,
+                S.astype(self._dtype), T.astype(self._dtype)))
+
+        return psf_groups
+
+    ##
+    # Evaluate M_k A_k x for all slices of a PSF group and write the results
+    # into the associated index ranges of the output array.
+    # \date       2026-10-17 05:45:22+0000
+    #
+    # \param      self                    The object
+    # \param      reconstruction_nda_vec  reconstruction data as 1D array
+    # \param      psf_group               PSF group, see _get_psf_groups
+    # \param      linear_operators        LinearOperators object to use
+    # \param      slice_ranges            list of (slice, i_min, i_max) tuples
+    #                                     of the slices of the group
+    # \param      MA_x                    output array holding all slices
+    #
+    def _M_A_psf_group(self,
+                       reconstruction_nda_vec,
+                       psf_group,
+                       linear_operators,
+                       slice_ranges,
+                       MA_x):
+
+        indices, grid_shape, sigma, S, T = psf_group
+
+        grid_nda = linear_operators.B_separable_nda(
+            T.dot(reconstruction_nda_vec).reshape(grid_shape), sigma)
+        slices_nda_vec = S.dot(grid_nda.ravel())
+
+        i = 0
+        for slice_k, i_min, i_max in slice_ranges:
+            MA_x[i_min:i_max] = slices_nda_vec[i:i + i_max - i_min]
+            i += i_max - i_min
+
+    ##
+    # Evaluate sum_k A_k^* M_k y_k over all slices of a PSF group.
+    # \date       2026-10-17 05:45:45+0000
+    #
+    # \param      self                    The object
+    # \param      stacked_slices_nda_vec  stacked slice data as 1D array
+    # \param      psf_group               PSF group, see _get_psf_groups
+    # \param      linear_operators        LinearOperators object to use
+    # \param      slice_ranges            list of (slice, i_min, i_max) tuples
+    #                                     of the slices of the group
+    # \param      out                     1D array in reconstruction space
+    #                                     the contribution is added to
+    #
+    def _A_adj_M_psf_group(self,
+                           stacked_slices_nda_vec,
+                           psf_group,
+                           linear_operators,
+                           slice_ranges,
+                           out):
+
+        indices, grid_shape, sigma, S, T = psf_group
+
+        slices_nda_vec = np.concatenate([
+            stacked_slices_nda_vec[i_min:i_max]
+            for slice_k, i_min, i_max in slice_ranges])
+        grid_nda = linear_operators.B_separable_nda(
+            S.transpose().dot(slices_nda_vec).reshape(grid_shape), sigma)
+        out += T.transpose().dot(grid_nda.ravel())
+
+    ##
+    # Evaluate func(i) for i = 0, ..., N-1, either serially or using the
+    # worker pool.
+    # \date       2026-10-17 05:08:54+0000
+    #
+    # \param      self  The object
+    # \param      func  function mapping worker index to result
+    # \param      N     number of calls, integer
+    #
+    # \return     list of results ordered by worker index
+    #
+    def _map(self, func, N):
+        if N == 1:
+            return [func(0)]
+
+        if self._pool is None:
+            self._pool = ThreadPool(self._n_threads)
+
+        return self._pool.map(func, range(N))
+
+    ##
+    # Gets the slice spacing and the PSF covariance in reconstruction space of
+    # a slice as cached by the acquisition model.
+    # \date       2026-10-17 05:09:47+0000
+    #
+    # \param      self     The object
+    # \param      slice_k  Slice object
+    #
+    # \return     slice spacing as 1D numpy array and covariance as 3x3 numpy
+    #             array
+    #
+    def _get_slice_geometry(self, slice_k):
+        return self._acquisition_model.get_slice_geometry(
+            slice_k, self._reconstruction.itk, self._reconstruction_grid)
+
+    ##
+    # Update the slice geometry cache for all slices of all stacks. Entries of
+    # slices which are no longer used are dropped.
+    # \date       2026-10-17 05:10:10+0000
+    #
+    # \param      self  The object
+    #
+    def _update_slice_geometry(self):
+        slices = [s for stack in self._stacks for s in stack.get_slices()]
+        self._acquisition_model.update_slice_geometry(
+            slices, self._reconstruction.itk, self._reconstruction_grid)
+
+    ##
+    # Gets the sparse system matrix M A for the current slice geometry.
+    #
+    # The matrix is assembled by the acquisition model on first use and
+    # reassembled only once slices were moved, removed or the masking setting
+    # changed.
+    # \date       2026-10-17 05:15:02+0000
+    #
+    # \param      self  The object
+    #
+    # \return     System matrix as scipy.sparse.csr_matrix; None if system
+    #             matrix is not used or exceeds the memory limit
+    #
+    def _get_system_matrix(self):
+
+        if not self._use_system_matrix:
+            return None
+
+        slices = [s for stack in self._stacks for s in stack.get_slices()]
+        system_matrix = self._acquisition_model.get_system_matrix(
+            slices,
+            self._N_total_slice_voxels,
+            self._reconstruction.itk,
+            self._reconstruction_grid,
+            use_masks=self._use_masks,
+            dtype=self._dtype,
+            memory_limit=self._system_matrix_memory_limit,
+            map_func=self._map,
+            n_threads=self._n_threads,
+            verbose=self._verbose,
+        )
+
+        # No fallback to the double precision filters in single precision
+        if system_matrix is None and self._dtype != np.float64:
+            raise ValueError(
+                "System matrix exceeds the memory limit. Precision '%s' "
+                "requires the system matrix" % self._precision)
+
+        return system_matrix
+
+    ##
+    # Gets a preallocated array owned by the given worker. The array is
+    # reused across operator evaluations and its content is undefined.
+    # \date       2026-10-17 05:18:08+0000
+    #
+    # \param      self      The object
+    # \param      i_worker  index of worker, integer
+    # \param      key       key identifying the buffer
+    # \param      shape     shape of the array
+    #
+    # \return     numpy array of given shape
+    #
+    def _get_buffer(self, i_worker, key, shape):
+        shape = tuple(np.atleast_1d(shape))
+        buffer = self._buffers.get((i_worker, key))
+        if buffer is None or buffer.shape != shape:
+            buffer = np.empty(shape)
+            self._buffers[(i_worker, key)] = buffer
+        return buffer
+
+    def _create_linear_operators(self):
+        return lin_op.LinearOperators(
+            deconvolution_mode=self._deconvolution_mode,
+            predefined_covariance=self._predefined_covariance,
+            alpha_cut=self._alpha_cut,
+            image_type=self._image_type
+        )
+
+    ##
+    # Gets the linear operators owned by the given worker.
+    # \date       2026-10-17 05:09:17+0000
+    #
+    # \param      self      The object
+    # \param      i_worker  index of worker, integer
+    #
+    # \return     LinearOperators object
+    #
+    def _get_linear_operators(self, i_worker):
+        while len(self._linear_operators_workers) <= i_worker:
+            self._linear_operators_workers.append(
+                self._create_linear_operators())
+        return self._linear_operators_workers[i_worker]
 
     #
     # Convert numpy data array (vector format) back to itk.Image object
@@ -582,7 +1840,37 @@ class Solver(object):
         shape_nda = np.array(
             image_itk_ref.GetLargestPossibleRegion().GetSize())[::-1]
 
-        image_itk = self._itk2np.GetImageFromArray(nda_vec.reshape(shape_nda))
+        image_itk = self._itk2np.GetImageFromArray(
+            nda_vec.reshape(shape_nda).astype(np.float64, copy=False))
+        image_itk.SetOrigin(image_itk_ref.GetOrigin())
+        image_itk.SetSpacing(image_itk_ref.GetSpacing())
+        image_itk.SetDirection(image_itk_ref.GetDirection())
+
+        return image_itk
+
+    ##
+    # Wrap numpy data array (vector format) as itk.Image object without
+    # copying the data. The returned image shares the memory of nda_vec which
+    # must be kept alive and contiguous as long as the image is used.
+    # \date       2026-10-17 05:18:31+0000
+    #
+    # \param      self           The object
+    # \param      nda_vec        data as 1D array
+    # \param      image_itk_ref  The image itk reference
+    #
+    # \return     itk.Image object sharing its memory with nda_vec
+    #
+    def _get_itk_image_view_from_array_vec(self, nda_vec, image_itk_ref):
+
+        # Views require contiguous data of matching type; copy otherwise
+        if not nda_vec.flags.c_contiguous or nda_vec.dtype != np.float64:
+            return self._get_itk_image_from_array_vec(nda_vec, image_itk_ref)
+
+        shape_nda = np.array(
+            image_itk_ref.GetLargestPossibleRegion().GetSize())[::-1]
+
+        image_itk = self._itk2np.GetImageViewFromArray(
+            nda_vec.reshape(shape_nda))
         image_itk.SetOrigin(image_itk_ref.GetOrigin())
         image_itk.SetSpacing(image_itk_ref.GetSpacing())
         image_itk.SetDirection(image_itk_ref.GetDirection())
@@ -10,6 +10,7 @@
 import scipy
 import numpy as np
 import SimpleITK as sitk
+from multiprocessing.pool import ThreadPool
 
 from nsol.definitions import EPS
 import nsol.linear_operators as linop
@@ -20,6 +21,9 @@ import pysitk.simple_itk_helper as sitkh
 from niftymic.reconstruction.solver import Solver
 import niftymic.base.stack as st
 
+# Allowed preconditioners
+PRECONDITIONERS = [None, "jacobi"]
+
 
 # This class implements the framework to iteratively solve
 #  \f$ \vec{y}_k = A_k \vec{x} \f$ for every slice \f$ \vec{y}_k,\,k=1,\dots,K \f$
@@ -89,6 +93,27 @@ class TikhonovSolver(Solver):
     # \param         huber_gamma            The huber gamma
     # \param         predefined_covariance  The predefined covariance
     # \param         verbose                The verbose
+    # \param         n_threads              Number of worker threads used to
+    #                                       evaluate the slice acquisition
+    #                                       operators
+    # \param         use_system_matrix      Use sparse system matrix for
+    #                                       operator evaluations if it fits
+    #                                       the memory limit
+    # \param         use_separable_psf      Apply the PSF once per group of
+    #                                       equally oriented slices as
+    #                                       separable filter
+    # \param         compress_unknowns      Only optimize for the voxels
+    #                                       within the reconstruction mask
+    # \param         precision              Floating point precision of the
+    #                                       solver vectors, 'float64' or
+    #                                       'float32'
+    # \param         preconditioner         Either None or 'jacobi' to solve
+    #                                       for the unknowns scaled by the
+    #                                       inverse square root of the
+    #                                       diagonal of the normal equations
+    # \param         acquisition_model      AcquisitionModel object shared
+    #                                       with other solvers; None to create
+    #                                       a new one
     #
     def __init__(self,
                  stacks,
@@ -106,6 +131,13 @@ class TikhonovSolver(Solver):
                  predefined_covariance=None,
                  use_masks=True,
                  verbose=1,
+                 n_threads=1,
+                 use_system_matrix=False,
+                 use_separable_psf=False,
+                 compress_unknowns=False,
+                 precision="float64",
+                 preconditioner=None,
+                 acquisition_model=None,
                  ):
 
         # Run constructor of superclass
@@ -124,10 +156,23 @@ class TikhonovSolver(Solver):
                         predefined_covariance=predefined_covariance,
                         verbose=verbose,
                         use_masks=use_masks,
+                        n_threads=n_threads,
+                        use_system_matrix=use_system_matrix,
+                        use_separable_psf=use_separable_psf,
+                        compress_unknowns=compress_unknowns,
+                        precision=precision,
+                        acquisition_model=acquisition_model,
                         )
 
         # Settings for optimizer
         self._reg_type = reg_type
+        self.set_preconditioner(preconditioner)
+
+        # Diagonal variable change x = P z applied by the last solver set up
+        self._x_preconditioner = None
+
+        # Initial value the last (lsmr) solver set up solves the correction for
+        self._x_offset = None
 
     #
     # Set type of regularization. It can be either 'TK0' or 'TK1'
@@ -146,6 +191,24 @@ class TikhonovSolver(Solver):
     def get_regularization_type(self):
         return self._reg_type
 
+    ##
+    # Sets the preconditioner. With 'jacobi', the problem is solved for
+    # z = P^{-1} x with the diagonal matrix P = diag(A^* A + alpha B^* B)^{-1/2}
+    # so that all columns of the augmented system have similar norms.
+    # \date       2026-10-17 05:40:00+0000
+    #
+    # \param      self            The object
+    # \param      preconditioner  Either None or 'jacobi'
+    #
+    def set_preconditioner(self, preconditioner):
+        if preconditioner not in PRECONDITIONERS:
+            raise ValueError(
+                "Preconditioner must be in " + str(PRECONDITIONERS))
+        self._preconditioner = preconditioner
+
+    def get_preconditioner(self):
+        return self._preconditioner
+
     ##
     #       Gets the setting specific filename indicating the information
     #             used for the reconstruction step
@@ -194,15 +257,34 @@ class TikhonovSolver(Solver):
             B_adj = lambda x: x.flatten()
 
         elif self._reg_type == "TK1":
-            spacing = np.array(self._reconstruction.sitk.GetSpacing())
-            linear_operators = linop.LinearOperators3D(spacing=spacing)
-            grad, grad_adj = linear_operators.get_gradient_operators()
-
-            X_shape = self._reconstruction_shape
-            Z_shape = grad(x0.reshape(*X_shape)).shape
-
-            B = lambda x: grad(x.reshape(*X_shape)).flatten()
-            B_adj = lambda x: grad_adj(x.reshape(*Z_shape)).flatten()
+            B, B_adj = self.get_gradient_operators()
+
+        # Solve for z = P^{-1} x, i.e. replace A, B by A P, B P
+        self._x_preconditioner = None
+        if self._preconditioner == "jacobi":
+            p = self._get_jacobi_preconditioner()
+            A_, A_adj_, B_, B_adj_ = A, A_adj, B, B_adj
+            A = lambda z: A_(p * z)
+            A_adj = lambda y: p * A_adj_(y)
+            B = lambda z: B_(p * z)
+            B_adj = lambda y: p * B_adj_(y)
+            x0 = x0 / p
+            x_scale = x_scale / np.median(p)
+            self._x_preconditioner = p
+
+        # lsmr always starts from zero. In order to benefit from an upsampled
+        # coarse level estimate or a warm start, solve for the correction
+        # z - z0 instead
+        b_reg = 0
+        bounds = (0, np.inf)
+        self._x_offset = None
+        if (self._initial_value_from_coarse_level or self._warm_start) and \
+                self._minimizer == "lsmr":
+            b = b - A(x0)
+            b_reg = -B(x0)
+            bounds = None
+            self._x_offset = x0
+            x0 = np.zeros_like(x0)
 
         # Set up solver
         solver = tk.TikhonovLinearSolver(
@@ -211,6 +293,7 @@ class TikhonovSolver(Solver):
             B=B,
             B_adj=B_adj,
             b=b,
+            b_reg=b_reg,
             x0=x0,
             x_scale=x_scale,
             alpha=self._alpha,
@@ -219,7 +302,7 @@ class TikhonovSolver(Solver):
             verbose=self._verbose,
             minimizer=self._minimizer,
             iter_max=self._iter_max,
-            bounds=(0, np.inf),
+            bounds=bounds,
         )
         return solver
 
@@ -246,12 +329,46 @@ class TikhonovSolver(Solver):
         # Get computational time
         self._computational_time = solver.get_computational_time()
 
+        # Add correction to initial value and clip to bounds
+        x = solver.get_x()
+        if self._x_offset is not None:
+            x = np.clip(self._x_offset + x, 0, np.inf)
+
+        # Undo variable change of preconditioner
+        if self._x_preconditioner is not None:
+            x = self._x_preconditioner * x
+
         # After reconstruction: Update member attribute
         self._reconstruction.itk = self._get_itk_image_from_array_vec(
-            solver.get_x(), self._reconstruction.itk)
+            self._get_x_full(x), self._reconstruction.itk)
         self._reconstruction.sitk = sitkh.get_sitk_from_itk_image(
             self._reconstruction.itk)
 
+    ##
+    # Gets the Jacobi preconditioner P = diag(A^* A + alpha B^* B)^{-1/2}.
+    # Unknowns without any contribution are not scaled.
+    # \date       2026-10-17 05:40:23+0000
+    #
+    # \param      self  The object
+    #
+    # \return     Diagonal of P as 1D numpy array
+    #
+    def _get_jacobi_preconditioner(self):
+
+        diagonal = self.get_A_adj_A_diagonal()
+        if self._alpha > 0:
+            if self._reg_type == "TK0":
+                diagonal = diagonal + self._alpha
+            else:
+                diagonal = diagonal + \
+                    self._alpha * self.get_gradient_operators_diagonal()
+
+        p = np.ones_like(diagonal)
+        is_positive = diagonal > 0
+        p[is_positive] = 1. / np.sqrt(diagonal[is_positive])
+
+        return p
+
     def _print_info_text(self):
 
         ph.print_subtitle("Tikhonov Solver:")
@@ -280,13 +397,47 @@ class TikhonovSolver(Solver):
 
         ph.print_info("Regularization parameter: " + str(self._alpha))
         ph.print_info("Minimizer: " + self._minimizer)
+        if self._preconditioner is not None:
+            ph.print_info("Preconditioner: " + self._preconditioner)
         ph.print_info(
             "Maximum number of iterations: " + str(self._iter_max))
         # ph.print_info("Tolerance: %.0e" %(self._tolerance))
 
 
+##
+# Tikhonov solver with temporal regularization, i.e. it solves
+# \f$ \min_{x^t} \sum_t \Vert M^t (y^t - A^t x^t) \Vert_{\ell^2}^2 + \alpha
+# \sum_t \Vert B x^t \Vert_{\ell^2}^2 + \beta \sum_t \Vert x^{t+1} - x^t
+# \Vert_{\ell^2}^2 \f$ jointly for all timepoints t.
+#
+# The data and spatial regularization blocks are independent per timepoint
+# and, together with the temporal differences, are evaluated block-wise by
+# concurrent workers writing directly into the stacked vectors.
+# \date       2026-10-17 05:54:20+0000
+#
 class TemporalTikhonovSolver(object):
 
+    ##
+    # Store information for the temporal reconstruction
+    # \date       2026-10-17 05:54:43+0000
+    #
+    # \param      self                   The object
+    # \param      stacks                 List of Stack objects, one for each
+    #                                    timepoint
+    # \param      reconstruction         Stack object defining the
+    #                                    reconstruction space and initial
+    #                                    value
+    # \param      beta                   Temporal regularization parameter
+    # \param      n_threads              Number of worker threads evaluating
+    #                                    the timepoint blocks concurrently
+    # \param      precision              Floating point precision of the
+    #                                    solvers of the timepoints and of the
+    #                                    stacked operator outputs, 'float64'
+    #                                    or 'float32'. lsmr keeps its work
+    #                                    vectors in double precision
+    #
+    # Other parameters are passed to the TikhonovSolver of each timepoint.
+    #
     def __init__(self,
                  stacks,
                  reconstruction,
@@ -304,8 +455,16 @@ class TemporalTikhonovSolver(object):
                  predefined_covariance=None,
                  use_masks=True,
                  verbose=1,
+                 n_threads=1,
+                 use_system_matrix=False,
+                 use_separable_psf=False,
+                 precision="float64",
                  ):
 
+        # Threads not needed to evaluate the timepoint blocks concurrently
+        # are used by the solvers of the individual timepoints
+        n_threads_solver = max(1, int(n_threads) // max(1, len(stacks)))
+
         self._solvers = [
             TikhonovSolver(
                 stacks=[s],
@@ -323,6 +482,10 @@ class TemporalTikhonovSolver(object):
                 predefined_covariance=predefined_covariance,
                 use_masks=use_masks,
                 verbose=verbose,
+                n_threads=n_threads_solver,
+                use_system_matrix=use_system_matrix,
+                use_separable_psf=use_separable_psf,
+                precision=precision,
             )
             for s in stacks
         ]
@@ -333,6 +496,8 @@ class TemporalTikhonovSolver(object):
         self._beta = beta
         self._iter_max = iter_max
         self._verbose = verbose
+        self._n_threads = int(n_threads)
+        self._dtype = np.dtype(precision)
 
         self._stacks = stacks
         self._reconstruction = reconstruction
@@ -354,6 +519,7 @@ class TemporalTikhonovSolver(object):
         shape_x = self._solvers[0]._reconstruction_shape
         self._n_x = np.array(shape_x).prod()
         self._n_x_total = len(self._solvers) * self._n_x
+        N_t = len(self._solvers)
 
         x0 = self._solvers[0].get_x0()
         if self._reg_type == "TK0":
@@ -368,32 +534,40 @@ class TemporalTikhonovSolver(object):
             X_shape = shape_x
             Z_shape = grad(x0.reshape(*X_shape)).shape
 
-            self._B = lambda x: grad(x.reshape(*X_shape)).flatten()
-            self._B_adj = lambda x: grad_adj(x.reshape(*Z_shape)).flatten()
+            self._B = lambda x: grad(x.reshape(*X_shape)).ravel()
+            self._B_adj = lambda x: grad_adj(x.reshape(*Z_shape)).ravel()
 
         self._B_shape = (self._B(x0).size, x0.size)
 
-        n_rhs = 0
         self._rhs = []
         self._A = []
         self._A_adj = []
-        self._D = []
-        self._D_adj = []
         for solver in self._solvers:
-            b = solver.get_b()
-            n_rhs += len(b)
-            self._rhs.append(b)
+            self._rhs.append(solver.get_b())
             self._A.append(solver.get_A())
             self._A_adj.append(solver.get_A_adj())
 
+        # Offsets of the data blocks of all timepoints followed by the
+        # spatial and temporal regularization blocks within the stacked
+        # right hand-side
+        self._i_data = np.cumsum([0] + [len(b) for b in self._rhs])
+        self._i_reg = self._i_data[-1]
+        self._i_temporal = self._i_reg
         if self._alpha > EPS:
-            n_rhs += len(self._solvers) * self._B_shape[0]
-
+            self._i_temporal += N_t * self._B_shape[0]
+        n_rhs = self._i_temporal
         if self._beta > EPS:
-            n_rhs += (len(self._solvers) - 1) * self._n_x
+            n_rhs += (N_t - 1) * self._n_x
 
-        self._x_1D = np.zeros(self._n_x_total)
-        self._rhs_1D = np.zeros(n_rhs)
+        # Timepoints are evaluated in contiguous chunks, one per worker
+        N_workers = max(1, min(self._n_threads, N_t))
+        self._chunks = np.array_split(np.arange(N_t), N_workers)
+        self._pool = ThreadPool(N_workers) if N_workers > 1 else None
+
+        self._x_1D = np.zeros(self._n_x_total, dtype=self._dtype)
+        self._rhs_1D = np.zeros(n_rhs, dtype=self._dtype)
+        self._buffers = [
+            np.zeros(self._n_x, dtype=self._dtype) for k in self._chunks]
 
         A_fw = lambda x: self._A_fw(
             x, np.sqrt(self._alpha), np.sqrt(self._beta))
@@ -404,17 +578,25 @@ class TemporalTikhonovSolver(object):
         A = scipy.sparse.linalg.LinearOperator(
             shape=(self._rhs_1D.size, self._x_1D.size),
             matvec=A_fw,
-            rmatvec=A_bw)
-        b = np.zeros_like(A(self._x_1D))
-        b_upper = np.concatenate(self._rhs)
-        b[:b_upper.size] = b_upper
-
-        x = scipy.sparse.linalg.lsmr(
-            A, b,
-            maxiter=self._iter_max,
-            show=self._verbose,
-            atol=0,
-            btol=0)[0]
+            rmatvec=A_bw,
+            dtype=self._dtype)
+        b = np.zeros(n_rhs, dtype=self._dtype)
+        for i, rhs in enumerate(self._rhs):
+            b[self._i_data[i]:self._i_data[i + 1]] = rhs
+
+        try:
+            x = scipy.sparse.linalg.lsmr(
+                A, b,
+                maxiter=self._iter_max,
+                show=self._verbose,
+                atol=0,
+                btol=0)[0]
+        finally:
+            if self._pool is not None:
+                self._pool.close()
+                self._pool.join()
+            for solver in self._solvers:
+                solver.close()
 
         if self._bounds is not None:
             # Clip to bounds
@@ -422,84 +604,118 @@ class TemporalTikhonovSolver(object):
 
         self._reconstructions = self._get_reconstructions(x)
 
+        # Release stacked vectors
+        del A, b
+        self._x_1D = None
+        self._rhs_1D = None
+        self._buffers = None
+
         # y_vec = s.get_b()
 
         self._computational_time = ph.stop_timing(time_start)
 
+    ##
+    # Evaluate func(k) for all chunks k of timepoints
+    # \date       2026-10-17 05:55:06+0000
+    #
+    # \param      self  The object
+    # \param      func  function of chunk index
+    #
+    def _map(self, func):
+        if self._pool is None:
+            for k in range(len(self._chunks)):
+                func(k)
+        else:
+            self._pool.map(func, range(len(self._chunks)))
+
     def _A_fw(self, x, sqrt_alpha, sqrt_beta):
 
-        i0 = 0
+        # View (T, Z*Y*X) of the timepoint volumes
+        X = x.reshape(len(self._solvers), self._n_x)
+
+        self._map(lambda k: [
+            self._A_fw_timepoint(X, i, sqrt_alpha, sqrt_beta)
+            for i in self._chunks[k]])
+
+        return self._rhs_1D
+
+    ##
+    # Evaluate all rows of the stacked operator associated with timepoint i,
+    # i.e. data term, spatial and forward temporal regularization, and write
+    # them into the stacked right hand-side
+    # \date       2026-10-17 05:55:29+0000
+    #
+    # \param      self        The object
+    # \param      X           Timepoint volumes as (T, Z*Y*X) numpy array
+    # \param      i           Timepoint index
+    # \param      sqrt_alpha  Square root of alpha
+    # \param      sqrt_beta   Square root of beta
+    #
+    def _A_fw_timepoint(self, X, i, sqrt_alpha, sqrt_beta):
 
         # cost
-        for i, solver in enumerate(self._solvers):
-            i1 = i0 + len(self._rhs[i])
-            self._rhs_1D[i0:i1] = self._A[i](
-                x[i * self._n_x:(i + 1) * self._n_x]
-            )
-            i0 = i1
+        self._rhs_1D[self._i_data[i]:self._i_data[i + 1]] = self._A[i](X[i])
 
         # tikhonov
         if sqrt_alpha > EPS:
-            for i, solver in enumerate(self._solvers):
-                self._rhs_1D[
-                    i0 + self._B_shape[0] * i:
-                    i0 + self._B_shape[0] * (i + 1)
-                ] = sqrt_alpha * self._B(x[i * self._n_x:(i + 1) * self._n_x])
-                i1 = i0 + self._B_shape[0] * (i + 1)
+            i0 = self._i_reg + self._B_shape[0] * i
+            np.multiply(
+                self._B(X[i]), sqrt_alpha,
+                out=self._rhs_1D[i0:i0 + self._B_shape[0]])
 
         # temporal
-        if sqrt_beta > EPS:
-            for i in range(len(self._solvers) - 1):
-                self._rhs_1D[
-                    i1 + self._n_x * i:
-                    i1 + self._n_x * (i + 1)
-                ] = sqrt_beta * (
-                    x[(i + 1) * self._n_x:(i + 2) * self._n_x]
-                    - x[i * self._n_x:(i + 1) * self._n_x]
-                )
-
-        return self._rhs_1D
+        if sqrt_beta > EPS and i < len(self._solvers) - 1:
+            i0 = self._i_temporal + self._n_x * i
+            D_x = self._rhs_1D[i0:i0 + self._n_x]
+            np.subtract(X[i + 1], X[i], out=D_x)
+            D_x *= sqrt_beta
 
     def _A_bw(self, b, sqrt_alpha, sqrt_beta):
-        i0 = 0
-        self._x_1D[:] = 0
+
+        self._map(lambda k: [
+            self._A_bw_timepoint(b, i, sqrt_alpha, sqrt_beta, self._buffers[k])
+            for i in self._chunks[k]])
+
+        return self._x_1D
+
+    ##
+    # Evaluate the column block of the adjoint stacked operator associated
+    # with timepoint i and write it into the stacked unknowns
+    # \date       2026-10-17 05:55:52+0000
+    #
+    # \param      self        The object
+    # \param      b           Stacked right hand-side as 1D numpy array
+    # \param      i           Timepoint index
+    # \param      sqrt_alpha  Square root of alpha
+    # \param      sqrt_beta   Square root of beta
+    # \param      buffer      Array of volume size owned by the worker
+    #
+    def _A_bw_timepoint(self, b, i, sqrt_alpha, sqrt_beta, buffer):
+
+        x_i = self._x_1D[i * self._n_x:(i + 1) * self._n_x]
 
         # cost
-        for i, solver in enumerate(self._solvers):
-            i1 = i0 + len(self._rhs[i])
-            self._x_1D[i * self._n_x:(i + 1) * self._n_x] = \
-                self._A_adj[i](b[i0:i1])
-            i0 = i1
+        x_i[:] = self._A_adj[i](b[self._i_data[i]:self._i_data[i + 1]])
 
         # tikhonov
         if sqrt_alpha > EPS:
-            for i, solver in enumerate(self._solvers):
-                self._x_1D[i * self._n_x:(i + 1) * self._n_x] += \
-                    sqrt_alpha * self._B_adj(
-                        b[i0:i0 + self._B_shape[0]]
-                )
-                i0 += self._B_shape[0]
+            i0 = self._i_reg + self._B_shape[0] * i
+            np.multiply(
+                self._B_adj(b[i0:i0 + self._B_shape[0]]), sqrt_alpha,
+                out=buffer)
+            x_i += buffer
 
         # temporal
         if sqrt_beta > EPS:
-            i = 0
-            self._x_1D[i * self._n_x:(i + 1) * self._n_x] += \
-                - sqrt_beta * b[i0 + self._n_x * i: i0 + self._n_x * (i + 1)]
-
-            for i in range(1, len(self._solvers) - 1):
-                self._x_1D[i * self._n_x:(i + 1) * self._n_x] += \
-                    sqrt_beta * (
-                        b[i0 + self._n_x * (i - 1): i0 + self._n_x * i]
-                        - b[i0 + self._n_x * i: i0 + self._n_x * (i + 1)]
-                )
-
-            i = len(self._solvers) - 1
-            self._x_1D[i * self._n_x:(i + 1) * self._n_x] += \
-                sqrt_beta * (
-                    b[i0 + self._n_x * (i - 1): i0 + self._n_x * i]
-            )
-
-        return self._x_1D
+            i0 = self._i_temporal + self._n_x * i
+            if i > 0:
+                np.multiply(
+                    b[i0 - self._n_x:i0], sqrt_beta, out=buffer)
+                x_i += buffer
+            if i < len(self._solvers) - 1:
+                np.multiply(
+                    b[i0:i0 + self._n_x], sqrt_beta, out=buffer)
+                x_i -= buffer
 
     def _get_reconstructions(self, x):
 
@@ -14,6 +14,7 @@
 import SimpleITK as sitk
 import itk
 import numpy as np
+import scipy.sparse
 
 import niftymic.base.slice as sl
 import niftymic.base.stack as st
@@ -792,11 +793,11 @@ class IntraStackRegistration(StackRegistrationBase):
         if alpha_parameter > self._ZERO:
             if self._transform_type in ["similarity"]:
                 self._get_jacobian_residual_parameters = \
-                    lambda x: np.concatenate((
+                    lambda x: scipy.sparse.vstack((
                         self._get_jacobian_residual_scale(x),
                         self._get_jacobian_residual_intensity_coefficients[
                             self._intensity_correction_type_slice_neighbour_fit](x)
-                    ))
+                    ), format="csr")
             else:
                 self._get_jacobian_residual_parameters = \
                     lambda x: self._get_jacobian_residual_intensity_coefficients[
@@ -817,11 +818,11 @@ class IntraStackRegistration(StackRegistrationBase):
                         x)
 
             else:
-                jacobian = lambda x: np.concatenate((
+                jacobian = lambda x: scipy.sparse.vstack((
                     self._get_jacobian_residual_slice_neighbours_fit(x),
                     alpha_parameter / alpha_neighbour *
                     self._get_jacobian_residual_parameters(x)
-                ))
+                ), format="csr")
 
         else:
 
@@ -837,12 +838,12 @@ class IntraStackRegistration(StackRegistrationBase):
 
             elif self._image_transform_reference_fit_term in ["partial_derivative"]:
                 self._get_jacobian_residual_reference_fit_total = \
-                    lambda x: np.concatenate((
+                    lambda x: scipy.sparse.vstack((
                         self._get_jacobian_residual_reference_fit(
                             self._slices_2D, "dx", x),
                         self._get_jacobian_residual_reference_fit(
                             self._slices_2D, "dy", x)
-                    ))
+                    ), format="csr")
 
             if alpha_reference < self._ZERO:
                 raise ValueError(
@@ -854,27 +855,27 @@ class IntraStackRegistration(StackRegistrationBase):
                         x)
 
             elif alpha_neighbour > self._ZERO and alpha_parameter < self._ZERO:
-                jacobian = lambda x: np.concatenate((
+                jacobian = lambda x: scipy.sparse.vstack((
                     self._get_jacobian_residual_reference_fit_total(x),
                     alpha_neighbour / alpha_reference *
                     self._get_jacobian_residual_slice_neighbours_fit(x)
-                ))
+                ), format="csr")
 
             elif alpha_neighbour < self._ZERO and alpha_parameter > self._ZERO:
-                jacobian = lambda x: np.concatenate((
+                jacobian = lambda x: scipy.sparse.vstack((
                     self._get_jacobian_residual_reference_fit_total(x),
                     alpha_parameter / alpha_reference *
                     self._get_jacobian_residual_parameters(x)
-                ))
+                ), format="csr")
 
             elif alpha_neighbour > self._ZERO and alpha_parameter > self._ZERO:
-                jacobian = lambda x: np.concatenate((
+                jacobian = lambda x: scipy.sparse.vstack((
                     self._get_jacobian_residual_reference_fit_total(x),
                     alpha_neighbour / alpha_reference *
                     self._get_jacobian_residual_slice_neighbours_fit(x),
                     alpha_parameter / alpha_reference *
                     self._get_jacobian_residual_parameters(x)
-                ))
+                ), format="csr")
 
         return jacobian
 
@@ -964,21 +965,16 @@ class IntraStackRegistration(StackRegistrationBase):
     # \param      parameters_vec  The parameters vector
     #
     # \return     The jacobian residual reference fit as [N_slices *
-    #             N_slice_voxels] x [transform_type_dofs * N_slices] numpy
-    #             array
+    #             N_slice_voxels] x [transform_type_dofs * N_slices] block
+    #             diagonal scipy.sparse.csr_matrix
     #
     def _get_jacobian_residual_reference_fit(self,
                                              slices_2D,
                                              trafo,
                                              parameters_vec):
 
-        # Allocate memory for Jacobian of residual
-        jacobian = np.zeros(
-            (self._N_slices * self._N_slice_voxels,
-                self._optimization_dofs * self._N_slices))
-
-        jacobian_slice_i = np.zeros(
-            (self._N_slice_voxels, self._optimization_dofs))
+        # Jacobian blocks of residual, one per slice
+        jacobian_blocks = [None] * self._N_slices
 
         # Reshape parameters for easier access
         parameters = parameters_vec.reshape(-1, self._optimization_dofs)
@@ -1053,17 +1049,15 @@ class IntraStackRegistration(StackRegistrationBase):
             # Second dimension is decided by intensity_correction_type_slice_neighbour_fit
             # as being of "higher order"
             # (e.g. affine for slice fit term and linear for reference fit term)
+            jacobian_slice_i = np.zeros(
+                (self._N_slice_voxels, self._optimization_dofs))
             jacobian_slice_i[:, 0:jacobian_slice_i_tmp.shape[
                 1]] = jacobian_slice_i_tmp
 
-            # Set elements in Jacobian for entire stack
-            jacobian[
-                i * self._N_slice_voxels:
-                (i + 1) * self._N_slice_voxels,
-                i * self._optimization_dofs:
-                (i + 1) * self._optimization_dofs] = jacobian_slice_i
+            # Residual of slice i only depends on its own parameters
+            jacobian_blocks[i] = jacobian_slice_i
 
-        return jacobian
+        return scipy.sparse.block_diag(jacobian_blocks, format="csr")
 
     ##
     # Gets the residual indicating the alignment between neighbouring slices.
@@ -1169,15 +1163,15 @@ class IntraStackRegistration(StackRegistrationBase):
     # \param      parameters_vec  The parameters vector
     #
     # \return     The Jacobian residual slice neighbours fit as [(N_slices-1) *
-    #             N_slice_voxels] x [transform_type_dofs * N_slices] numpy
-    #             array
+    #             N_slice_voxels] x [transform_type_dofs * N_slices] block
+    #             bidiagonal scipy.sparse.csr_matrix
     #
     def _get_jacobian_residual_slice_neighbours_fit(self, parameters_vec):
 
-        # Allocate memory for Jacobian of residual
-        jacobian = np.zeros((
-            (self._N_slices - 1) * self._N_slice_voxels,
-            self._optimization_dofs * self._N_slices))
+        # Jacobian blocks of residual; residual of neighbour pair (i, i+1)
+        # only depends on parameters of slices i and i+1
+        jacobian_blocks = [[None] * self._N_slices
+                           for i in range(0, self._N_slices - 1)]
 
         # Reshape parameters for easier access
         parameters = parameters_vec.reshape(-1, self._optimization_dofs)
@@ -1212,20 +1206,14 @@ class IntraStackRegistration(StackRegistrationBase):
                     self._transforms_2D_sitk[i + 1],
                     self._transforms_2D_itk[i + 1])
 
-            # Set elements in Jacobian for entire stack
-            jacobian[i * self._N_slice_voxels:
-                     (i + 1) * self._N_slice_voxels,
-                     i * self._optimization_dofs:
-                     (i + 1) * self._optimization_dofs] = jacobian_slice_i
-            jacobian[i * self._N_slice_voxels:
-                     (i + 1) * self._N_slice_voxels,
-                     (i + 1) * self._optimization_dofs:
-                     (i + 2) * self._optimization_dofs] = -jacobian_slice_ip1
+            # Set blocks in Jacobian for entire stack
+            jacobian_blocks[i][i] = jacobian_slice_i
+            jacobian_blocks[i][i + 1] = -jacobian_slice_ip1
 
             # Prepare for next iteration
             jacobian_slice_i = jacobian_slice_ip1
 
-        return jacobian
+        return scipy.sparse.bmat(jacobian_blocks, format="csr")
 
     ##
     # Gets the Jacobian of a slice based on the spatial transformation.
@@ -1389,13 +1377,12 @@ class IntraStackRegistration(StackRegistrationBase):
 
     def _get_jacobian_residual_scale(self, parameters_vec):
 
-        jacobian = np.zeros(
-            (self._N_slices, self._N_slices * self._optimization_dofs))
+        rows = np.arange(self._N_slices)
+        cols = rows * self._optimization_dofs
 
-        for i in range(0, self._N_slices):
-            jacobian[i, i * self._optimization_dofs] = 1
-
-        return jacobian
+        return scipy.sparse.csr_matrix(
+            (np.ones(self._N_slices), (rows, cols)),
+            shape=(self._N_slices, self._N_slices * self._optimization_dofs))
 
     ##
     # Gets the residual intensity coefficients for different intensity
@@ -1412,7 +1399,8 @@ class IntraStackRegistration(StackRegistrationBase):
 
     def _get_jacobian_residual_intensity_coefficients_None(self,
                                                            parameters_vec):
-        return np.zeros((1, self._N_slices * self._optimization_dofs))
+        return scipy.sparse.csr_matrix(
+            (1, self._N_slices * self._optimization_dofs))
 
     def _get_residual_intensity_coefficients_linear(self, parameters_vec):
 
@@ -1427,14 +1415,12 @@ class IntraStackRegistration(StackRegistrationBase):
     def _get_jacobian_residual_intensity_coefficients_linear(self,
                                                              parameters_vec):
 
-        jacobian = np.zeros(
-            (self._N_slices, self._N_slices * self._optimization_dofs))
-
-        for i in range(0, self._N_slices):
-            jacobian[i, self._transform_type_dofs +
-                     i * self._optimization_dofs] = 1
+        rows = np.arange(self._N_slices)
+        cols = self._transform_type_dofs + rows * self._optimization_dofs
 
-        return jacobian
+        return scipy.sparse.csr_matrix(
+            (np.ones(self._N_slices), (rows, cols)),
+            shape=(self._N_slices, self._N_slices * self._optimization_dofs))
 
     def _get_residual_intensity_coefficients_affine(self, parameters_vec):
 
@@ -1449,16 +1435,15 @@ class IntraStackRegistration(StackRegistrationBase):
     def _get_jacobian_residual_intensity_coefficients_affine(self,
                                                              parameters_vec):
 
-        jacobian = np.zeros(
-            (2 * self._N_slices, self._N_slices * self._optimization_dofs))
+        rows = np.arange(2 * self._N_slices)
+        cols = self._transform_type_dofs + \
+            np.repeat(np.arange(self._N_slices), 2) * \
+            self._optimization_dofs + np.tile([0, 1], self._N_slices)
 
-        for i in range(0, self._N_slices):
-            jacobian[2 * i, self._transform_type_dofs +
-                     i * self._optimization_dofs] = 1
-            jacobian[2 * i + 1, self._transform_type_dofs +
-                     i * self._optimization_dofs + 1] = 1
-
-        return jacobian
+        return scipy.sparse.csr_matrix(
+            (np.ones(2 * self._N_slices), (rows, cols)),
+            shape=(2 * self._N_slices,
+                   self._N_slices * self._optimization_dofs))
 
     ##
     # Compute several transforms on image like identity, \f$ \partial_x \f$,
@@ -17,6 +17,7 @@ import pysitk.python_helper as ph
 import simplereg.niftyreg
 
 import niftymic.base.stack as st
+import niftymic.utilities.scratch_directory as scratch
 from niftymic.registration.registration_method \
     import RegistrationMethod
 from niftymic.registration.registration_method \
@@ -33,6 +34,7 @@ class RegAladin(AffineRegistrationMethod):
                  use_verbose=False,
                  options="-voff",
                  registration_type="Rigid",
+                 subfolder="RegAladin",
                  ):
 
         AffineRegistrationMethod.__init__(self,
@@ -48,6 +50,38 @@ class RegAladin(AffineRegistrationMethod):
         self._REGISTRATION_TYPES = ["Rigid", "Affine"]
 
         self._options = options
+        self._subfolder = subfolder
+
+    ##
+    # Sets the subfolder where intermediate results are stored temporarily.
+    # Relative paths refer to the scratch directory of the run (see
+    # niftymic.utilities.scratch_directory).
+    # \date       2026-10-17 05:19:37+0000
+    #
+    # \param      self       The object
+    # \param      subfolder  The subfolder as string
+    #
+    def set_subfolder(self, subfolder):
+        self._subfolder = subfolder
+
+    def get_subfolder(self):
+        return self._subfolder
+
+    ##
+    # Gets a copy of the registration method with identical settings. Each
+    # copy uses its own (unique) scratch directory for intermediate results
+    # so that copies can run concurrently.
+    # \date       2026-10-17 05:20:00+0000
+    #
+    # \param      self  The object
+    #
+    # \return     RegAladin object.
+    #
+    def get_copy(self):
+        registration_method = AffineRegistrationMethod.get_copy(self)
+        registration_method.set_subfolder(
+            scratch.get_unique_directory(self._subfolder))
+        return registration_method
 
     ##
     # Sets the options used for FLIRT
@@ -92,6 +126,8 @@ class RegAladin(AffineRegistrationMethod):
             fixed_sitk_mask=fixed_sitk_mask,
             moving_sitk_mask=moving_sitk_mask,
             options=options,
+            subfolder=os.path.join(
+                scratch.get_directory(), self._subfolder),
             verbose=self._use_verbose,
         )
         try:
@@ -174,6 +210,7 @@ class RegF3D(RegistrationMethod):
             fixed_sitk_mask=fixed_sitk_mask,
             moving_sitk_mask=moving_sitk_mask,
             options=options,
+            subfolder=os.path.join(scratch.get_directory(), "RegF3D"),
             verbose=self._use_verbose,
         )
         self._registration_method.run()
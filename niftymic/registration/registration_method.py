@@ -7,6 +7,7 @@
 #
 
 # Import libraries
+import copy
 import numpy as np
 import SimpleITK as sitk
 from abc import ABCMeta, abstractmethod
@@ -136,6 +137,18 @@ class RegistrationMethod(object):
     def get_computational_time(self):
         return self._computational_time
 
+    ##
+    # Gets a copy of the registration method with identical settings. Copies
+    # can be run independently of each other, e.g. by concurrent workers.
+    # \date       2026-10-17 05:20:23+0000
+    #
+    # \param      self  The object
+    #
+    # \return     Registration method object of same type.
+    #
+    def get_copy(self):
+        return copy.copy(self)
+
     ##
     # Gets the obtained registration transform.
     # \date       2017-08-08 16:52:36+0100
@@ -16,6 +16,7 @@ import sys
 import SimpleITK as sitk
 import itk
 import numpy as np
+import scipy.sparse
 import time
 from datetime import timedelta
 from scipy.optimize import least_squares
@@ -535,17 +536,31 @@ class StackRegistrationBase(object):
     ##
     # Use scipy.opimize.least_squares solver
     #
+    # The Jacobian may be given as scipy.sparse matrix. For the trust region
+    # methods 'trf' and 'dogbox' the trust-region subproblems are solved via
+    # 'lsmr' which only requires matrix-vector products with the Jacobian.
+    # Method 'lm' does not support sparse Jacobians.
+    #
     def _run_optimizer_least_squares(self, fun, jac, x0, method, loss, iter_max, verbose, x_scale):
+
+        if method in ["lm"]:
+            jac_ = lambda x: scipy.sparse.csr_matrix(jac(x)).toarray()
+            tr_solver = None
+        else:
+            jac_ = jac
+            tr_solver = "lsmr"
+
         # Non-linear least-squares optimizer_method:
         res = least_squares(
             fun=fun,
-            jac=jac,
+            jac=jac_,
             x0=x0,
             method=method,
             loss=loss,
             max_nfev=iter_max,
             verbose=verbose,
-            x_scale=x_scale)
+            x_scale=x_scale,
+            tr_solver=tr_solver)
         return res.x
 
     ##
@@ -557,10 +572,12 @@ class StackRegistrationBase(object):
         fun_ = lambda x: lf.get_ell2_cost_from_residual(
             fun(x),
             loss=loss)
-        jac_ = lambda x: lf.get_gradient_ell2_cost_from_residual(
-            fun(x),
-            jac(x),
-            loss=loss)
+        # Gradient J^T (rho'(f^2) f) evaluated via matrix-vector product to
+        # support sparse Jacobians
+        def jac_(x):
+            f = fun(x)
+            return jac(x).transpose().dot(
+                lf.get_gradient_loss[loss](f2=f**2) * f)
 
         # Use scipy.optimize.minimize method
         res = minimize(
@@ -18,8 +18,7 @@ from nsol.similarity_measures import SimilarityMeasures
 import niftymic.base.stack as st
 import niftymic.validation.image_similarity_evaluator as ise
 import niftymic.utilities.template_stack_estimator as tse
-
-from niftymic.definitions import DIR_TMP
+import niftymic.utilities.scratch_directory as scratch
 
 
 ##
@@ -33,6 +32,7 @@ class TransformInitializer(object):
                  moving,
                  similarity_measure="NMI",
                  refine_pca_initializations=False,
+                 dir_tmp=None,
                  ):
         if not isinstance(fixed, st.Stack):
             raise TypeError("Fixed image must be of type 'Stack'.")
@@ -45,6 +45,11 @@ class TransformInitializer(object):
         self._similarity_measure = similarity_measure
         self._refine_pca_initializations = refine_pca_initializations
 
+        # Directory for intermediate files of the refining registrations
+        if dir_tmp is None:
+            dir_tmp = scratch.get_unique_directory("TransformInitializer")
+        self._dir_tmp = dir_tmp
+
         self._initial_transform_sitk = None
 
     def get_transform_sitk(self):
@@ -177,15 +182,17 @@ class TransformInitializer(object):
         return transform_init_sitk
 
     def _run_registrations(self, transformations):
-        path_to_fixed = os.path.join(DIR_TMP, "fixed.nii.gz")
-        path_to_moving = os.path.join(DIR_TMP, "moving.nii.gz")
-        path_to_fixed_mask = os.path.join(DIR_TMP, "fixed_mask.nii.gz")
-        path_to_moving_mask = os.path.join(DIR_TMP, "moving_mask.nii.gz")
-        path_to_tmp_output = os.path.join(DIR_TMP, "foo.nii.gz")
+        dir_tmp = self._dir_tmp
+        ph.create_directory(dir_tmp)
+        path_to_fixed = os.path.join(dir_tmp, "fixed.nii.gz")
+        path_to_moving = os.path.join(dir_tmp, "moving.nii.gz")
+        path_to_fixed_mask = os.path.join(dir_tmp, "fixed_mask.nii.gz")
+        path_to_moving_mask = os.path.join(dir_tmp, "moving_mask.nii.gz")
+        path_to_tmp_output = os.path.join(dir_tmp, "foo.nii.gz")
         path_to_transform_regaladin = os.path.join(
-            DIR_TMP, "transform_regaladin.txt")
+            dir_tmp, "transform_regaladin.txt")
         path_to_transform_sitk = os.path.join(
-            DIR_TMP, "transform_sitk.txt")
+            dir_tmp, "transform_sitk.txt")
 
         sitkh.write_nifti_image_sitk(self._fixed.sitk, path_to_fixed)
         sitkh.write_nifti_image_sitk(self._moving.sitk, path_to_moving)
@@ -19,7 +19,7 @@ import pysitk.simple_itk_helper as sitkh
 import pysitk.python_helper as ph
 
 import niftymic.base.stack as st
-from niftymic.definitions import DIR_TMP
+import niftymic.utilities.scratch_directory as scratch
 
 
 ##
@@ -38,19 +38,22 @@ class BrainStripping(object):
     #                                  mask
     # \param      compute_skull_image  Boolean flag for computing skull mask
     # \param      dir_tmp              Directory where temporary results are
-    #                                  written to, string
+    #                                  written to, string; None to use a
+    #                                  unique scratch directory of the run
     # \param      bet_options          The bet options
     #
     def __init__(self,
                  compute_brain_image=False,
                  compute_brain_mask=True,
                  compute_skull_image=False,
-                 dir_tmp=os.path.join(DIR_TMP, "BrainExtractionTool"),
+                 dir_tmp=None,
                  bet_options=""):
 
         self._compute_brain_image = compute_brain_image
         self._compute_brain_mask = compute_brain_mask
         self._compute_skull_image = compute_skull_image
+        if dir_tmp is None:
+            dir_tmp = scratch.get_unique_directory("BrainExtractionTool")
         self._dir_tmp = dir_tmp
         self._bet_options = bet_options
 
@@ -73,7 +76,8 @@ class BrainStripping(object):
     #                                  mask
     # \param      compute_skull_image  Boolean flag for computing skull mask
     # \param      dir_tmp              Directory where temporary results are
-    #                                  written to, string
+    #                                  written to, string; None to use a
+    #                                  unique scratch directory of the run
     #
     # \return     object
     #
@@ -84,7 +88,7 @@ class BrainStripping(object):
                       compute_brain_image=False,
                       compute_brain_mask=True,
                       compute_skull_image=False,
-                      dir_tmp=os.path.join(DIR_TMP, "BrainExtractionTool")):
+                      dir_tmp=None):
 
         self = cls(compute_brain_image=compute_brain_image,
                    compute_brain_mask=compute_brain_mask,
@@ -107,7 +111,8 @@ class BrainStripping(object):
     #                                  mask
     # \param      compute_skull_image  Boolean flag for computing skull mask
     # \param      dir_tmp              Directory where temporary results are
-    #                                  written to, string
+    #                                  written to, string; None to use a
+    #                                  unique scratch directory of the run
     #
     # \return     object
     #
@@ -117,7 +122,7 @@ class BrainStripping(object):
                         compute_brain_image=False,
                         compute_brain_mask=True,
                         compute_skull_image=False,
-                        dir_tmp=os.path.join(DIR_TMP, "BrainExtractionTool")):
+                        dir_tmp=None):
 
         self = cls(compute_brain_image=compute_brain_image,
                    compute_brain_mask=compute_brain_mask,
@@ -138,7 +143,8 @@ class BrainStripping(object):
     #                                  mask
     # \param      compute_skull_image  Boolean flag for computing skull mask
     # \param      dir_tmp              Directory where temporary results are
-    #                                  written to, string
+    #                                  written to, string; None to use a
+    #                                  unique scratch directory of the run
     #
     # \return     object
     #
@@ -148,7 +154,7 @@ class BrainStripping(object):
                    compute_brain_image=False,
                    compute_brain_mask=True,
                    compute_skull_image=False,
-                   dir_tmp=os.path.join(DIR_TMP, "BrainExtractionTool")):
+                   dir_tmp=None):
 
         self = cls(compute_brain_image=compute_brain_image,
                    compute_brain_mask=compute_brain_mask,
@@ -24,6 +24,7 @@ import niftymic
 from niftymic.definitions import ALLOWED_EXTENSIONS
 from niftymic.definitions import ALLOWED_INTERPOLATORS
 from niftymic.definitions import VIEWER_OPTIONS, V2V_METHOD_OPTIONS
+from niftymic.definitions import PRECISION_OPTIONS
 
 # Allowed image types
 IMAGE_TYPES = "(" + (", or ").join(ALLOWED_EXTENSIONS) + ")"
@@ -558,6 +559,19 @@ class InputArgparser(object):
     ):
         self._add_argument(dict(locals()))
 
+    def add_warm_start(
+        self,
+        option_string="--warm-start",
+        type=int,
+        help="Turn on/off adaptive number of SRR solver iterations in the "
+        "two-step cycles. Each cycle continues from the previous "
+        "reconstruction and its iterations are reduced proportionally to the "
+        "relative change of the reconstruction in the previous cycle once it "
+        "falls below 5%% (heuristic).",
+        default=0,
+    ):
+        self._add_argument(dict(locals()))
+
     def add_sigma(
         self,
         option_string="--sigma",
@@ -775,6 +789,99 @@ class InputArgparser(object):
     ):
         self._add_argument(dict(locals()))
 
+    def add_threads(
+        self,
+        option_string="--threads",
+        type=int,
+        help="Number of worker threads used for parallel computations.",
+        default=1,
+    ):
+        self._add_argument(dict(locals()))
+
+    def add_tmp_dir(
+        self,
+        option_string="--tmp-dir",
+        type=str,
+        help="Root directory for intermediate files. Each run writes into "
+        "its own subdirectory which is deleted at exit so that multiple "
+        "runs can be executed concurrently. A tmpfs mount, e.g. /dev/shm, "
+        "keeps intermediate files in memory. If not given, the temporary "
+        "directory of NiftyMIC is used.",
+        default=None,
+    ):
+        self._add_argument(dict(locals()))
+
+    def add_use_system_matrix(
+        self,
+        option_string="--use-system-matrix",
+        type=int,
+        help="Turn on/off assembly of the slice acquisition model as sparse "
+        "matrix. It is used by the SRR solvers if it fits the memory limit "
+        "to speed up the operator evaluations.",
+        default=0,
+    ):
+        self._add_argument(dict(locals()))
+
+    def add_use_separable_psf(
+        self,
+        option_string="--use-separable-psf",
+        type=int,
+        help="Turn on/off the separable PSF approximation of the slice "
+        "acquisition model. The PSF is applied once per group of equally "
+        "oriented slices of a stack on a grid aligned with the slices which "
+        "speeds up the operator evaluations.",
+        default=0,
+    ):
+        self._add_argument(dict(locals()))
+
+    def add_precision(
+        self,
+        option_string="--precision",
+        type=str,
+        help="Floating point precision of the SRR solver vectors, the sparse "
+        "system matrix and the accumulated scattered data approximation "
+        "(%s). Images are kept in double precision. Single precision "
+        "requires the system matrix for SRR, see --use-system-matrix." % (
+            ", ".join(PRECISION_OPTIONS)),
+        default="float64",
+    ):
+        self._add_argument(dict(locals()))
+
+    def add_preconditioner(
+        self,
+        option_string="--preconditioner",
+        type=str,
+        help="Preconditioner used by the Tikhonov SRR solver. If 'jacobi', "
+        "the unknowns are rescaled by the inverse square root of the "
+        "diagonal of the normal equations which accelerates the convergence "
+        "for varying slice coverage.",
+        default=None,
+    ):
+        self._add_argument(dict(locals()))
+
+    def add_multigrid_levels(
+        self,
+        option_string="--multigrid-levels",
+        type=int,
+        help="Number of grid levels for a coarse-to-fine SRR. The "
+        "reconstruction is first solved on a grid with 2^(levels-1) times the "
+        "isotropic resolution and the upsampled result is used as initial "
+        "value for the next finer grid. 1 solves on the final grid only.",
+        default=1,
+    ):
+        self._add_argument(dict(locals()))
+
+    def add_compress_unknowns(
+        self,
+        option_string="--compress-unknowns",
+        type=int,
+        help="Turn on/off restriction of the SRR unknowns to the voxels "
+        "within the reconstruction space mask. Voxels outside the mask are "
+        "set to zero which reduces the problem size for tight masks.",
+        default=0,
+    ):
+        self._add_argument(dict(locals()))
+
     def add_log_config(
         self,
         option_string="--log-config",
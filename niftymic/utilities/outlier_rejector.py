@@ -31,6 +31,7 @@ class OutlierRejector(object):
                  use_reference_mask=True,
                  measure="NCC",
                  verbose=True,
+                 n_threads=1,
                  ):
 
         self._stacks = stacks
@@ -40,6 +41,7 @@ class OutlierRejector(object):
         self._use_slice_masks = use_slice_masks
         self._use_reference_mask = use_reference_mask
         self._verbose = verbose
+        self._n_threads = n_threads
 
     def get_stacks(self):
         return self._stacks
@@ -52,9 +54,9 @@ class OutlierRejector(object):
             use_reference_mask=self._use_reference_mask,
             verbose=False,
             measures=[self._measure],
+            n_threads=self._n_threads,
         )
-        residual_evaluator.compute_slice_projections()
-        residual_evaluator.evaluate_slice_similarities()
+        residual_evaluator.compute_slice_similarities()
         slice_sim = residual_evaluator.get_slice_similarities()
         # residual_evaluator.show_slice_similarities(
         #     threshold=self._threshold,
@@ -0,0 +1,91 @@
+##
+# \file scratch_directory.py
+# \brief      Scratch space for intermediate files of a NiftyMIC run.
+#
+# Each process writes its intermediate files into its own, uniquely named run
+# directory below a root directory (DIR_TMP by default). Hence, multiple
+# pipelines can run concurrently on the same host without overwriting each
+# other's intermediate results. Workers within a run obtain unique
+# subdirectories via get_unique_directory. The run directory is deleted at
+# exit of the process.
+#
+# The root directory can be set via set_root, e.g. to a tmpfs mount such as
+# /dev/shm to keep intermediate files in memory.
+#
+# \author     agent (agent@local)
+# \date       October 2026
+#
+
+import os
+import atexit
+import shutil
+import tempfile
+import threading
+import itertools
+
+import pysitk.python_helper as ph
+
+from niftymic.definitions import DIR_TMP
+
+_dir_root = DIR_TMP
+_dir_run = None
+_delete_at_exit = True
+_lock = threading.Lock()
+
+# Counter to assign unique subdirectories to workers
+_IDS = itertools.count(1)
+
+
+##
+# Sets the root directory below which the run directory is created.
+# A previously created run directory is kept until exit and subsequent
+# requests refer to a new run directory within the given root.
+# \date       2026-10-17 06:00:05+0000
+#
+# \param      dir_root        Root directory as string; None to use DIR_TMP
+# \param      delete_at_exit  Delete run directory at exit of the process,
+#                             bool
+#
+def set_root(dir_root=None, delete_at_exit=True):
+    global _dir_root, _dir_run, _delete_at_exit
+
+    with _lock:
+        _dir_root = DIR_TMP if dir_root is None else dir_root
+        _dir_run = None
+        _delete_at_exit = delete_at_exit
+
+
+def get_root():
+    return _dir_root
+
+
+##
+# Gets the run directory of the process. It is created on first request.
+# \date       2026-10-17 06:00:28+0000
+#
+# \return     Path to run directory as string
+#
+def get_directory():
+    global _dir_run
+
+    with _lock:
+        if _dir_run is None:
+            ph.create_directory(_dir_root)
+            _dir_run = tempfile.mkdtemp(
+                prefix="niftymic_%d_" % os.getpid(), dir=_dir_root)
+            if _delete_at_exit:
+                atexit.register(shutil.rmtree, _dir_run, True)
+        return _dir_run
+
+
+##
+# Gets a new, unique subdirectory of the run directory, e.g. to be used by a
+# worker. The subdirectory itself is not created.
+# \date       2026-10-17 06:00:51+0000
+#
+# \param      name  Prefix of the subdirectory as string
+#
+# \return     Path to subdirectory as string
+#
+def get_unique_directory(name):
+    return os.path.join(get_directory(), "%s_%d" % (name, next(_IDS)))
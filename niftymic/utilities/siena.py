@@ -20,7 +20,7 @@ import pysitk.simple_itk_helper as sitkh
 import pysitk.python_helper as ph
 
 import niftymic.base.stack as st
-from niftymic.definitions import DIR_TMP
+import niftymic.utilities.scratch_directory as scratch
 
 
 class Siena(object):
@@ -30,16 +30,18 @@ class Siena(object):
                  stack2,
                  dir_output="./siena/",
                  options='-B "-B -f 0.1" -2',
-                 dir_tmp=os.path.join(DIR_TMP, "siena/")):
+                 dir_tmp=None):
 
         self._stack1 = st.Stack.from_stack(stack1)
         self._stack2 = st.Stack.from_stack(stack2)
         self._dir_output = dir_output
+        if dir_tmp is None:
+            dir_tmp = os.path.join(scratch.get_unique_directory("siena"), "")
         self._dir_tmp = dir_tmp
         self._options = options
 
     def run(self):
-        ph.create_directory(dir_tmp, delete_files=True)
+        ph.create_directory(self._dir_tmp, delete_files=True)
 
         # Write images
         sitkh.write_nifti_image_sitk(self._stack1.sitk, self._dir_tmp +
@@ -11,9 +11,12 @@
 #
 
 import six
+import collections
+import multiprocessing
 import numpy as np
 import SimpleITK as sitk
 from abc import ABCMeta, abstractmethod
+from multiprocessing.pool import ThreadPool
 
 import pysitk.python_helper as ph
 import pysitk.simple_itk_helper as sitkh
@@ -24,10 +27,52 @@ import niftymic.utilities.outlier_rejector as outre
 import niftymic.registration.transform_initializer as tinit
 import niftymic.reconstruction.scattered_data_approximation as sda
 import niftymic.utilities.binary_mask_from_mask_srr_estimator as bm
+import niftymic.utilities.scratch_directory as scratch
 
 from niftymic.definitions import VIEWER
 
 
+##
+# Evaluate a function on contiguous chunks of items concurrently, one chunk
+# per worker thread. The first worker uses the given method object, each
+# further worker its own copy as obtained by method.get_copy(). Objects
+# without get_copy are evaluated serially.
+# \date       2026-10-17 06:11:04+0000
+#
+# \param      func       Function func(method, chunk) evaluated for each chunk
+#                        of items with the method object of the worker
+# \param      items      List of items to be split into chunks
+# \param      method     Method object, e.g. registration or reconstruction
+#                        method
+# \param      n_threads  Maximum number of worker threads, integer
+#
+# \return     Tuple (chunks, results) of the list of chunks (lists of items)
+#             and the list of associated results of func
+#
+def _map_chunks(func, items, method, n_threads):
+    N_workers = max(1, min(n_threads, len(items)))
+    if not hasattr(method, "get_copy"):
+        N_workers = 1
+    chunks = [
+        [items[k] for k in indices]
+        for indices in np.array_split(np.arange(len(items)), N_workers)
+    ]
+    methods = [method] + [method.get_copy() for k in range(1, N_workers)]
+
+    if N_workers == 1:
+        return chunks, [func(methods[0], chunks[0])]
+
+    pool = ThreadPool(N_workers)
+    try:
+        results = pool.map(
+            lambda k: func(methods[k], chunks[k]), range(N_workers))
+    finally:
+        pool.close()
+        pool.join()
+
+    return chunks, results
+
+
 ##
 # Class which holds basic interface for all modules
 # \date       2017-08-08 02:20:40+0100
@@ -121,6 +166,10 @@ class VolumeToVolumeRegistration(RegistrationPipeline):
     # \param      reference            The reference
     # \param      registration_method  The registration method
     # \param      verbose              The verbose
+    # \param      n_threads            Number of worker threads registering
+    #                                  stacks concurrently, each using its own
+    #                                  copy of the registration method and
+    #                                  its own temporary directory
     #
     def __init__(self,
                  stacks,
@@ -130,6 +179,7 @@ class VolumeToVolumeRegistration(RegistrationPipeline):
                  print_prefix="",                 
                  viewer=VIEWER,
                  robust=False,
+                 n_threads=1,
                  ):
         RegistrationPipeline.__init__(
             self,
@@ -141,15 +191,57 @@ class VolumeToVolumeRegistration(RegistrationPipeline):
         )
         self._robust = robust
         self._print_prefix = print_prefix
+        self._n_threads = n_threads
         
     def set_print_prefix(self, print_prefix):
         self._print_prefix = print_prefix
 
+    def set_n_threads(self, n_threads):
+        self._n_threads = n_threads
+
+    def get_n_threads(self):
+        return self._n_threads
+
     def _run(self):
 
         ph.print_title("Volume-to-Volume Registration")
 
-        for i in range(0, len(self._stacks)):
+        # Stack registrations are independent given the reference. Each
+        # worker registers a contiguous set of stacks using its own copy of
+        # the registration method (with own scratch directory for
+        # intermediate results) and temporary directory
+        chunks, transforms_chunks = _map_chunks(
+            lambda registration_method, indices: self._register_stacks(
+                registration_method,
+                scratch.get_unique_directory("VolumeToVolumeRegistration"),
+                indices),
+            list(range(len(self._stacks))),
+            self._registration_method,
+            self._n_threads)
+
+        for chunk, transforms_chunk in zip(chunks, transforms_chunks):
+            for i, transform_sitk in zip(chunk, transforms_chunk):
+
+                # Update position of stack
+                self._stacks[i].update_motion_correction(transform_sitk)
+
+    ##
+    # Register a set of stacks to the reference
+    # \date       2026-10-17 05:57:09+0000
+    #
+    # \param      self                 The object
+    # \param      registration_method  Registration method used by worker
+    # \param      dir_tmp              Temporary directory used by worker
+    # \param      indices              List of stack indices
+    #
+    # \return     List of registration transforms as sitk objects in order of
+    #             indices
+    #
+    def _register_stacks(self, registration_method, dir_tmp, indices):
+
+        transforms_sitk = []
+
+        for i in indices:
             txt = "%sVolume-to-Volume Registration -- " \
                 "Stack %d/%d" % (self._print_prefix, i + 1, len(self._stacks))
             if self._verbose:
@@ -163,6 +255,7 @@ class VolumeToVolumeRegistration(RegistrationPipeline):
                     moving=self._stacks[i],
                     similarity_measure="NCC",
                     refine_pca_initializations=True,
+                    dir_tmp=dir_tmp,
                 )
                 transform_initializer.run()
                 transform_sitk = transform_initializer.get_transform_sitk()
@@ -170,13 +263,15 @@ class VolumeToVolumeRegistration(RegistrationPipeline):
                     transform_sitk.GetInverse())
 
             else:
-                self._registration_method.set_moving(self._reference)
-                self._registration_method.set_fixed(self._stacks[i])
-                self._registration_method.run()
-                transform_sitk = self._registration_method.get_registration_transform_sitk()
+                registration_method.set_moving(self._reference)
+                registration_method.set_fixed(self._stacks[i])
+                registration_method.run()
+                transform_sitk = \
+                    registration_method.get_registration_transform_sitk()
+
+            transforms_sitk.append(transform_sitk)
 
-            # Update position of stack
-            self._stacks[i].update_motion_correction(transform_sitk)
+        return transforms_sitk
 
 
 ##
@@ -197,6 +292,9 @@ class SliceToVolumeRegistration(RegistrationPipeline):
     # \param      verbose              The verbose
     # \param      print_prefix         Print at each iteration at the
     #                                  beginning, string
+    # \param      n_threads            Number of worker threads registering
+    #                                  slices concurrently, each using its own
+    #                                  copy of the registration method
     #
     def __init__(self,
                  stacks,
@@ -206,6 +304,7 @@ class SliceToVolumeRegistration(RegistrationPipeline):
                  print_prefix="",
                  interleave=2,
                  viewer=VIEWER,
+                 n_threads=1,
                  ):
         RegistrationPipeline.__init__(
             self,
@@ -217,45 +316,91 @@ class SliceToVolumeRegistration(RegistrationPipeline):
         )
         self._print_prefix = print_prefix
         self._interleave = interleave
+        self._n_threads = n_threads
 
     def set_print_prefix(self, print_prefix):
         self._print_prefix = print_prefix
 
+    def set_n_threads(self, n_threads):
+        self._n_threads = n_threads
+
+    def get_n_threads(self):
+        return self._n_threads
+
     def _run(self):
 
         ph.print_title("Slice-to-Volume Registration")
 
         self._registration_method.set_moving(self._reference)
 
+        # Slice registrations are independent given the fixed reference
+        tasks = []
         for i, stack in enumerate(self._stacks):
             slices = stack.get_slices()
+            for j, slice_j in enumerate(slices):
+                tasks.append((i, j, len(slices), slice_j))
+
+        # Each worker registers a contiguous set of slices using its own
+        # copy of the registration method
+        chunks, transforms_chunks = _map_chunks(
+            self._register_slices,
+            tasks,
+            self._registration_method,
+            self._n_threads)
+
+        # Store information on registration transforms in original order
+        transforms_sitk = [{} for stack in self._stacks]
+        for chunk, transforms_chunk in zip(chunks, transforms_chunks):
+            for (i, j, N_slices, slice_j), transform_sitk in zip(
+                    chunk, transforms_chunk):
+                transforms_sitk[i][slice_j.get_slice_number()] = \
+                    transform_sitk
 
-            transforms_sitk = {}
+        for i, stack in enumerate(self._stacks):
 
-            for j, slice_j in enumerate(slices):
+            # Update position of slice
+            for slice in stack.get_slices():
+                slice_number = slice.get_slice_number()
+                slice.update_motion_correction(
+                    transforms_sitk[i][slice_number])
 
-                txt = "%sSlice-to-Volume Registration -- " \
-                    "Stack %d/%d (%s) -- Slice %d/%d" % (
-                        self._print_prefix,
-                        i + 1, len(self._stacks), stack.get_filename(),
-                        j + 1, len(slices))
-                if self._verbose:
-                    ph.print_subtitle(txt)
-                else:
-                    ph.print_info(txt)
+    ##
+    # Register a set of slices to the reference
+    # \date       2026-10-17 05:20:46+0000
+    #
+    # \param      self                 The object
+    # \param      registration_method  Registration method used by worker
+    # \param      tasks                List of (stack index, slice index,
+    #                                  number of slices, slice) tuples
+    #
+    # \return     List of registration transforms as sitk objects in order of
+    #             tasks
+    #
+    def _register_slices(self, registration_method, tasks):
 
-                self._registration_method.set_fixed(slice_j)
-                self._registration_method.run()
+        transforms_sitk = []
 
-                # Store information on registration transform
-                transform_sitk = \
-                    self._registration_method.get_registration_transform_sitk()
-                transforms_sitk[slice_j.get_slice_number()] = transform_sitk
+        for i, j, N_slices, slice_j in tasks:
+            stack = self._stacks[i]
 
-            # Update position of slice
-            for slice in slices:
-                slice_number = slice.get_slice_number()
-                slice.update_motion_correction(transforms_sitk[slice_number])
+            txt = "%sSlice-to-Volume Registration -- " \
+                "Stack %d/%d (%s) -- Slice %d/%d" % (
+                    self._print_prefix,
+                    i + 1, len(self._stacks), stack.get_filename(),
+                    j + 1, N_slices)
+            if self._verbose:
+                ph.print_subtitle(txt)
+            else:
+                ph.print_info(txt)
+
+            registration_method.set_fixed(slice_j)
+            registration_method.run()
+
+            # Store information on registration transform
+            transforms_sitk.append(
+                registration_method.get_registration_transform_sitk())
+
+        return transforms_sitk
 
 
 ##
@@ -500,6 +645,19 @@ class TwoStepSliceToVolumeRegistrationReconstruction(
     # \param      interleave                     The interleave
     # \param      viewer                         The viewer
     # \param      sigma_sda_mask                 The sigma sda mask
+    # \param      n_threads                      Number of worker threads
+    #                                            for slice-to-volume
+    #                                            registrations
+    # \param      warm_start                     Start the solver of each
+    #                                            cycle from the previous
+    #                                            reconstruction and reduce its
+    #                                            iterations according to the
+    #                                            relative change of the
+    #                                            reconstruction in the
+    #                                            previous cycle (heuristic)
+    # \param      warm_start_tolerance           Relative change below which
+    #                                            the solver iterations are
+    #                                            reduced proportionally
     #
     def __init__(self,
                  stacks,
@@ -516,6 +674,9 @@ class TwoStepSliceToVolumeRegistrationReconstruction(
                  interleave=3,
                  viewer=VIEWER,
                  sigma_sda_mask=1.,
+                 n_threads=1,
+                 warm_start=False,
+                 warm_start_tolerance=0.05,
                  ):
 
         # Last volumetric reconstruction step is performed outside
@@ -547,21 +708,39 @@ class TwoStepSliceToVolumeRegistrationReconstruction(
         self._thresholds = thresholds
         self._use_hierarchical_registration = use_hierarchical_registration
         self._interleave = interleave
+        self._n_threads = n_threads
+        self._warm_start = warm_start
+        self._warm_start_tolerance = warm_start_tolerance
 
     def _run(self):
 
         ph.print_title("Two-step S2V-Registration and SRR Reconstruction")
 
+        # With warm start, each cycle continues from the reconstruction of
+        # the previous one and the iterations are adapted to the relative
+        # change of the reconstruction observed in the previous cycle
+        use_warm_start = self._warm_start and not isinstance(
+            self._reconstruction_method, sda.ScatteredDataApproximation)
+        if use_warm_start:
+            iter_max = self._reconstruction_method.get_iter_max()
+            warm_start = self._reconstruction_method.get_warm_start()
+            self._reconstruction_method.set_warm_start(True)
+        relative_change = None
+
         s2vreg = SliceToVolumeRegistration(
             stacks=self._stacks,
             reference=self._reference,
             registration_method=self._registration_method,
             verbose=False,
             interleave=self._interleave,
+            n_threads=self._n_threads,
         )
 
         reference = self._reference
 
+        # Mask SDA kept across cycles for incremental updates
+        SDA = None
+
         for cycle in range(0, self._cycles):
 
             if cycle == 0 and self._use_hierarchical_registration:
@@ -597,6 +776,7 @@ class TwoStepSliceToVolumeRegistrationReconstruction(
                     threshold=self._thresholds[cycle],
                     measure=self._threshold_measure,
                     verbose=True,
+                    n_threads=self._n_threads,
                 )
                 outlier_rejector.run()
                 self._reconstruction_method.set_stacks(
@@ -619,6 +799,15 @@ class TwoStepSliceToVolumeRegistrationReconstruction(
                     self._reconstruction_method.set_sigma(self._alphas[cycle])
                 else:
                     self._reconstruction_method.set_alpha(self._alphas[cycle])
+
+                if use_warm_start:
+                    iter_max_cycle = self._get_warm_start_iter_max(
+                        iter_max, relative_change, self._warm_start_tolerance)
+                    self._reconstruction_method.set_iter_max(iter_max_cycle)
+                    ph.print_info("Solver iterations: %d" % iter_max_cycle)
+                    nda_previous = sitk.GetArrayFromImage(
+                        self._reconstruction_method.get_reconstruction().sitk)
+
                 self._reconstruction_method.run()
 
                 self._computational_time_reconstruction += \
@@ -626,15 +815,36 @@ class TwoStepSliceToVolumeRegistrationReconstruction(
 
                 reference = self._reconstruction_method.get_reconstruction()
 
+                if use_warm_start:
+                    nda = sitk.GetArrayFromImage(reference.sitk)
+                    relative_change = np.linalg.norm(nda - nda_previous) / \
+                        max(np.linalg.norm(nda), 1e-12)
+
                 # ------------------ Perform Image Mask SDA -------------------
                 ph.print_subtitle("Volumetric Image Mask Reconstruction")
-                SDA = sda.ScatteredDataApproximation(
-                    self._stacks,
-                    reference,
-                    sigma=self._sigma_sda_mask,
-                    sda_mask=True,
-                )
-                SDA.run()
+                if SDA is None:
+                    SDA = sda.ScatteredDataApproximation(
+                        self._stacks,
+                        reference,
+                        sigma=self._sigma_sda_mask,
+                        sda_mask=True,
+                        n_threads=self._n_threads,
+                    )
+                    SDA.run()
+                else:
+                    # Only update contributions of rejected and moved slices
+                    slices = [
+                        slice for stack in self._stacks
+                        for slice in stack.get_slices()
+                    ]
+                    slices_set = set(slices)
+                    SDA.set_stacks(self._stacks)
+                    SDA.set_reconstruction(reference)
+                    SDA.remove_slices([
+                        slice for slice in SDA.get_accumulated_slices()
+                        if slice not in slices_set
+                    ])
+                    SDA.update_slices(slices)
 
                 # reference contains updated mask based on SDA
                 reference = SDA.get_reconstruction()
@@ -652,6 +862,38 @@ class TwoStepSliceToVolumeRegistrationReconstruction(
                                       segmentation=self._reference,
                                       viewer=self._viewer)
 
+        # Subsequent reconstructions use the original solver settings
+        if use_warm_start:
+            self._reconstruction_method.set_iter_max(iter_max)
+            self._reconstruction_method.set_warm_start(warm_start)
+
+    ##
+    # Gets the number of solver iterations for a warm-started cycle. The
+    # iterations are reduced proportionally to the relative change of the
+    # reconstruction in the previous cycle once it falls below the warm start
+    # tolerance.
+    #
+    # This is an iteration-budget heuristic without convergence guarantee:
+    # it assumes that a small change in the previous cycle indicates a warm
+    # start close to the solution of the current cycle, i.e. that slices
+    # moved only little in between.
+    # \date       2026-10-17 05:39:26+0000
+    #
+    # \param      iter_max         maximum number of iterations, integer
+    # \param      relative_change  relative change of the reconstruction in
+    #                              the previous cycle; None for first cycle
+    # \param      tolerance        relative change below which the
+    #                              iterations are reduced proportionally
+    #
+    # \return     number of iterations, integer
+    #
+    @staticmethod
+    def _get_warm_start_iter_max(iter_max, relative_change, tolerance):
+        if relative_change is None:
+            return iter_max
+        ratio = relative_change / float(tolerance)
+        return int(np.clip(np.ceil(iter_max * ratio), 1, iter_max))
+
 
 ##
 # Class to perform the two-step Slice-to-Volume registration and volumetric
@@ -683,6 +925,9 @@ class TwoStepVolumeToVolumeRegistrationReconstruction(
     # \param      interleave                     The interleave
     # \param      viewer                         The viewer
     # \param      sigma_sda_mask                 The sigma sda mask
+    # \param      n_threads                      Number of worker threads
+    #                                            registering stacks
+    #                                            concurrently
     #
     def __init__(self,
                  stacks,
@@ -699,6 +944,7 @@ class TwoStepVolumeToVolumeRegistrationReconstruction(
                  interleave=3,
                  viewer=VIEWER,
                  sigma_sda_mask=1.,
+                 n_threads=1,
                  ):
 
         # Last volumetric reconstruction step is performed outside
@@ -730,6 +976,7 @@ class TwoStepVolumeToVolumeRegistrationReconstruction(
         self._thresholds = thresholds
         self._use_hierarchical_registration = use_hierarchical_registration
         self._interleave = interleave
+        self._n_threads = n_threads
 
     def _run(self):
 
@@ -739,7 +986,8 @@ class TwoStepVolumeToVolumeRegistrationReconstruction(
             stacks=self._stacks,
             reference=self._reference,
             registration_method=self._registration_method,
-            verbose=False
+            verbose=False,
+            n_threads=self._n_threads,
         )
 
         reference = self._reference
@@ -930,7 +1178,10 @@ class HieararchicalSliceSetRegistration(RegistrationPipeline):
 ##
 # Class to perform multi-component reconstruction
 #
-# Each stack is individually reconstructed at a given reconstruction space
+# Each stack is individually reconstructed at a given reconstruction space.
+# All components start from the initial value given by the reconstruction
+# of the reconstruction method, i.e. the result of a component does not
+# depend on the ones reconstructed before.
 # \date       2017-08-08 02:34:40+0100
 #
 class MultiComponentReconstruction(Pipeline):
@@ -945,6 +1196,17 @@ class MultiComponentReconstruction(Pipeline):
     # \param      suffix                 Suffix added to filenames of each
     #                                    individual stack, string
     # \param      verbose                The verbose
+    # \param      n_processes            Number of worker processes
+    #                                    reconstructing components
+    #                                    concurrently, each building its own
+    #                                    copy of the reconstruction method.
+    #                                    Requires the fork start method of
+    #                                    multiprocessing
+    # \param      data_writer            MultiComponentImageWriter object
+    #                                    the reconstructions are added to in
+    #                                    order of the components as soon as
+    #                                    they are available. If given,
+    #                                    reconstructions are not kept
     #
     def __init__(self,
                  stacks,
@@ -952,6 +1214,8 @@ class MultiComponentReconstruction(Pipeline):
                  suffix="_recon",
                  verbose=0,
                  viewer=VIEWER,
+                 n_processes=1,
+                 data_writer=None,
                  ):
 
         Pipeline.__init__(self, stacks=stacks, verbose=verbose, viewer=viewer)
@@ -959,6 +1223,11 @@ class MultiComponentReconstruction(Pipeline):
         self._reconstruction_method = reconstruction_method
         self._reconstructions = None
         self._suffix = suffix
+        self._n_processes = n_processes
+        self._data_writer = data_writer
+
+        # Initial value of the components
+        self._reconstruction = None
 
     def set_reconstruction_method(self, reconstruction_method):
         self._reconstruction_method = reconstruction_method
@@ -972,6 +1241,18 @@ class MultiComponentReconstruction(Pipeline):
     def get_suffix(self):
         return self._suffix
 
+    def set_n_processes(self, n_processes):
+        self._n_processes = n_processes
+
+    def get_n_processes(self):
+        return self._n_processes
+
+    def set_data_writer(self, data_writer):
+        self._data_writer = data_writer
+
+    def get_data_writer(self):
+        return self._data_writer
+
     def get_reconstructions(self):
         return [st.Stack.from_stack(stack) for stack in self._reconstructions]
 
@@ -979,15 +1260,143 @@ class MultiComponentReconstruction(Pipeline):
 
         ph.print_title("Multi-Component Reconstruction")
 
-        self._reconstructions = [None] * len(self._stacks)
+        self._reconstructions = []
+
+        # Initial value of all components
+        reconstruction = st.Stack.from_stack(
+            self._reconstruction_method.get_reconstruction())
+        self._reconstruction = reconstruction
+
+        # Reconstruction methods without get_copy, e.g.
+        # ScatteredDataApproximation, are run serially
+        N_processes = max(1, min(self._n_processes, len(self._stacks)))
+        if not hasattr(self._reconstruction_method, "get_copy"):
+            N_processes = 1
+
+        if N_processes == 1:
+            for i, stack in enumerate(self._stacks):
+                self._print_component(i)
+                self._add_reconstruction(i, _reconstruct_component(
+                    self._reconstruction_method, stack, reconstruction))
+            return
+
+        # Worker processes inherit the reconstruction method and stacks via
+        # fork. At most two components per worker are in flight, i.e.
+        # submitted or finished but waiting for preceding components, so
+        # that memory is bounded
+        pool = _get_fork_context().Pool(
+            N_processes,
+            initializer=_init_component_worker,
+            initargs=(self._reconstruction_method, self._stacks,
+                      reconstruction))
+        try:
+            results = collections.deque()
+            for i in range(len(self._stacks)):
+                if len(results) == 2 * N_processes:
+                    self._add_reconstruction(*results.popleft().get())
+                self._print_component(i)
+                results.append(pool.apply_async(
+                    _reconstruct_component_worker, (i,)))
+            while len(results) > 0:
+                self._add_reconstruction(*results.popleft().get())
+            pool.close()
+        except BaseException:
+            pool.terminate()
+            raise
+        finally:
+            pool.join()
+
+    def _print_component(self, i):
+        ph.print_subtitle("Multi-Component Reconstruction -- "
+                          "Stack %d/%d" % (i + 1, len(self._stacks)))
 
-        for i in range(0, len(self._stacks)):
-            ph.print_subtitle("Multi-Component Reconstruction -- "
-                              "Stack %d/%d" % (i + 1, len(self._stacks)))
-            stack = self._stacks[i]
-            self._reconstruction_method.set_stacks([stack])
-            self._reconstruction_method.run()
-            self._reconstructions[i] = st.Stack.from_stack(
-                self._reconstruction_method.get_reconstruction())
-            self._reconstructions[i].set_filename(
-                stack.get_filename() + self._suffix)
+    ##
+    # Adds the reconstruction of a component, either to the data writer or
+    # to the reconstructions. Components must be added in order.
+    # \date       2026-10-17 06:24:15+0000
+    #
+    # \param      self                The object
+    # \param      i                   Index of component
+    # \param      reconstruction_nda  Tuple of numpy data arrays of
+    #                                  reconstruction image and mask, see
+    #                                  _reconstruct_component
+    #
+    def _add_reconstruction(self, i, reconstruction_nda):
+        reference = self._reconstruction
+        nda, nda_mask = reconstruction_nda
+
+        image_sitk = sitk.GetImageFromArray(nda)
+        image_sitk.CopyInformation(reference.sitk)
+        image_sitk_mask = sitk.GetImageFromArray(nda_mask)
+        image_sitk_mask.CopyInformation(reference.sitk_mask)
+
+        reconstruction = st.Stack.from_sitk_image(
+            image_sitk=image_sitk,
+            slice_thickness=reference.get_slice_thickness(),
+            filename=self._stacks[i].get_filename() + self._suffix,
+            image_sitk_mask=image_sitk_mask,
+            extract_slices=False,
+        )
+
+        if self._data_writer is None:
+            self._reconstructions.append(reconstruction)
+        else:
+            self._data_writer.add_stack(reconstruction)
+
+
+# Reconstruction method, stacks and initial value of a worker process of
+# MultiComponentReconstruction, see _init_component_worker
+_component_worker = {}
+
+
+def _get_fork_context():
+    if hasattr(multiprocessing, "get_context"):
+        return multiprocessing.get_context("fork")
+    return multiprocessing
+
+
+##
+# Initialize a worker process of MultiComponentReconstruction. The worker
+# builds its own copy of the reconstruction method, i.e. with its own
+# filters and acquisition model.
+# \date       2026-10-17 06:24:38+0000
+#
+# \param      reconstruction_method  Reconstruction method providing
+#                                    get_copy
+# \param      stacks                 List of all components as Stack objects
+# \param      reconstruction         Initial value as Stack object
+#
+def _init_component_worker(reconstruction_method, stacks, reconstruction):
+    _component_worker["reconstruction_method"] = \
+        reconstruction_method.get_copy()
+    _component_worker["stacks"] = stacks
+    _component_worker["reconstruction"] = reconstruction
+
+
+def _reconstruct_component_worker(i):
+    return i, _reconstruct_component(
+        _component_worker["reconstruction_method"],
+        _component_worker["stacks"][i],
+        _component_worker["reconstruction"])
+
+
+##
+# Reconstruct a single component starting from the given initial value.
+# \date       2026-10-17 06:25:01+0000
+#
+# \param      reconstruction_method  Reconstruction method
+# \param      stack                  Component as Stack object
+# \param      reconstruction         Initial value as Stack object
+#
+# \return     Tuple of numpy data arrays of reconstruction image and mask,
+#             i.e. data which can be passed between processes
+#
+def _reconstruct_component(reconstruction_method, stack, reconstruction):
+    reconstruction_method.set_stacks([stack])
+    reconstruction_method.set_reconstruction(
+        st.Stack.from_stack(reconstruction))
+    reconstruction_method.run()
+
+    reconstruction = reconstruction_method.get_reconstruction()
+    return (sitk.GetArrayFromImage(reconstruction.sitk),
+            sitk.GetArrayFromImage(reconstruction.sitk_mask))
@@ -0,0 +1,134 @@
+##
+# \file benchmark_system_matrix.py
+# \brief      Benchmark the operator evaluations of the SRR solver using the
+#             sparse system matrix against the filter-based evaluation.
+#
+# Example call:
+# python benchmark_system_matrix.py \
+# --filenames stack1.nii.gz stack2.nii.gz \
+# --reconstruction-space srr.nii.gz \
+# --iterations 10 \
+# --threads 4
+#
+# If no data is given, the fetal brain stacks of the test data are used.
+#
+# \author     agent (agent@local)
+# \date       October 2026
+#
+
+# Import libraries
+import os
+import time
+import numpy as np
+
+import pysitk.python_helper as ph
+
+import niftymic.base.stack as st
+import niftymic.base.data_reader as dr
+import niftymic.reconstruction.tikhonov_solver as tk
+from niftymic.utilities.input_arparser import InputArgparser
+from niftymic.definitions import DIR_TEST
+
+
+def main():
+
+    input_parser = InputArgparser(
+        description="Benchmark the evaluation of the slice acquisition model "
+        "M A and its adjoint A^* M using the sparse system matrix against "
+        "the ITK filter-based evaluation. Reported are the one-off assembly "
+        "time of the system matrix, the average time per operator "
+        "evaluation and the relative difference of both results.",
+    )
+    input_parser.add_filenames()
+    input_parser.add_filenames_masks()
+    input_parser.add_reconstruction_space()
+    input_parser.add_suffix_mask(default="_mask")
+    input_parser.add_iterations(default=5)
+    input_parser.add_use_masks_srr(default=1)
+    input_parser.add_threads(default=1)
+    input_parser.add_slice_thicknesses(default=None)
+    input_parser.add_verbose(default=0)
+
+    args = input_parser.parse_args()
+    input_parser.print_arguments(args)
+
+    if args.filenames is None:
+        args.filenames = [
+            os.path.join(DIR_TEST, "fetal_brain_%d.nii.gz" % d)
+            for d in range(0, 3)
+        ]
+        if args.reconstruction_space is None:
+            args.reconstruction_space = os.path.join(
+                DIR_TEST, "FetalBrain_reconstruction_3stacks_myAlg.nii.gz")
+
+    if args.reconstruction_space is None:
+        raise IOError("Reconstruction space must be provided")
+
+    data_reader = dr.MultipleImagesReader(
+        file_paths=args.filenames,
+        file_paths_masks=args.filenames_masks,
+        suffix_mask=args.suffix_mask,
+        stacks_slice_thicknesses=args.slice_thicknesses,
+    )
+    data_reader.read_data()
+    stacks = data_reader.get_data()
+
+    reconstruction = st.Stack.from_filename(
+        args.reconstruction_space, extract_slices=False)
+
+    solvers = {}
+    for use_system_matrix in [False, True]:
+        solvers[use_system_matrix] = tk.TikhonovSolver(
+            stacks=stacks,
+            reconstruction=reconstruction,
+            use_masks=args.use_masks_srr,
+            verbose=args.verbose,
+            n_threads=args.threads,
+            use_system_matrix=use_system_matrix,
+        )
+    solvers[True].set_system_matrix_memory_limit(np.inf)
+
+    x = solvers[False].get_x0()
+    y = solvers[False].get_b()
+
+    # One-off assembly of system matrix
+    time_start = time.time()
+    solvers[True].get_A()(x)
+    time_assembly = time.time() - time_start
+
+    results = {}
+    times = {}
+    for use_system_matrix, solver in solvers.items():
+        A = solver.get_A()
+        A_adj = solver.get_A_adj()
+
+        time_start = time.time()
+        for i in range(args.iterations):
+            A_x = A(x)
+            A_adj_y = A_adj(y)
+        times[use_system_matrix] = \
+            (time.time() - time_start) / float(args.iterations)
+        results[use_system_matrix] = (A_x, A_adj_y)
+        solver.close()
+
+    error_A = np.linalg.norm(results[True][0] - results[False][0]) / \
+        np.linalg.norm(results[False][0])
+    error_A_adj = np.linalg.norm(results[True][1] - results[False][1]) / \
+        np.linalg.norm(results[False][1])
+
+    ph.print_title("Summary")
+    ph.print_info("System matrix assembly: %.2fs (%d non-zero elements)" % (
+        time_assembly, solvers[True].get_system_matrix().nnz))
+    ph.print_info("Time per evaluation of A and A^* (filters): %.3fs" %
+                  times[False])
+    ph.print_info("Time per evaluation of A and A^* (system matrix): %.3fs"
+                  % times[True])
+    ph.print_info("Speed-up: %.1f" % (times[False] / times[True]))
+    ph.print_info("Relative difference of A x: %.2e" % error_A)
+    ph.print_info("Relative difference of A^* y: %.2e" % error_A_adj)
+
+    return 0
+
+
+if __name__ == '__main__':
+    main()
@@ -20,8 +20,8 @@ from nsol.similarity_measures import SimilarityMeasures as \
     SimilarityMeasures
 
 import niftymic.base.data_reader as dr
+import niftymic.utilities.scratch_directory as scratch
 from niftymic.utilities.input_arparser import InputArgparser
-from niftymic.definitions import DIR_TMP
 
 
 ##
@@ -40,7 +40,7 @@ def export_comparison_to_file(nda_original,
                               path_to_file,
                               resize,
                               extension="png"):
-    dir_tmp = os.path.join(DIR_TMP, "ImageMagick")
+    dir_tmp = os.path.join(scratch.get_directory(), "ImageMagick")
     ph.clear_directory(dir_tmp, verbose=False)
     for k in range(nda_original.shape[0]):
         ctr = k + 1
@@ -87,7 +87,8 @@ def _export_image_side_by_side(
         pointsize=12,
 ):
 
-    dir_output = os.path.join(DIR_TMP, "ImageMagick", "side-by-side")
+    dir_output = os.path.join(
+        scratch.get_directory(), "ImageMagick", "side-by-side")
     ph.clear_directory(dir_output, verbose=False)
 
     path_to_left = os.path.join(dir_output, "left.%s" % extension)
@@ -183,10 +184,13 @@ def main():
         help="Factor to resize images (otherwise they might be very small "
         "depending on the FOV)",
         default=3)
+    input_parser.add_tmp_dir()
 
     args = input_parser.parse_args()
     input_parser.print_arguments(args)
 
+    scratch.set_root(args.tmp_dir)
+
     # --------------------------------Read Data--------------------------------
     ph.print_title("Read Data")
 
@@ -12,9 +12,11 @@
 # Import libraries
 import os
 import re
+import itk
 import numpy as np
 import SimpleITK as sitk
 import matplotlib.pyplot as plt
+from multiprocessing.pool import ThreadPool
 
 from nsol.similarity_measures import SimilarityMeasures as \
     SimilarityMeasures
@@ -45,6 +47,8 @@ class ResidualEvaluator(object):
     #                        evaluation
     # \param      measures   Similarity measures as given in
     #                        nsol.similarity_measures, list of strings
+    # \param      n_threads  Number of threads used to compute the slice
+    #                        projections in compute_slice_similarities
     #
     def __init__(
             self,
@@ -54,6 +58,7 @@ class ResidualEvaluator(object):
             use_reference_mask=True,
             measures=["NCC", "NMI", "PSNR", "SSIM", "RMSE"],
             verbose=True,
+            n_threads=1,
     ):
         self._stacks = stacks
         self._reference = reference
@@ -61,6 +66,13 @@ class ResidualEvaluator(object):
         self._use_slice_masks = use_slice_masks
         self._use_reference_mask = use_reference_mask
         self._verbose = verbose
+        self._n_threads = n_threads
+
+        # Similarity measures evaluated for all slices of a stack at once
+        self._similarity_measures_vectorized = {
+            "NCC": self._get_normalized_cross_correlation,
+            "NMI": self._get_normalized_mutual_information,
+        }
 
         self._slice_projections = None
         self._similarities = None
@@ -104,6 +116,20 @@ class ResidualEvaluator(object):
     def get_measures(self):
         return self._measures
 
+    ##
+    # Sets the number of threads used to compute the slice projections in
+    # compute_slice_similarities.
+    # \date       2026-10-17 05:20:05+0000
+    #
+    # \param      self       The object
+    # \param      n_threads  Number of threads, integer
+    #
+    def set_n_threads(self, n_threads):
+        self._n_threads = n_threads
+
+    def get_n_threads(self):
+        return self._n_threads
+
     ##
     # Gets the slice similarities computed between simulated/projected and
     # original/acquired slices.
@@ -245,6 +271,308 @@ class ResidualEvaluator(object):
             if self._verbose:
                 print("done")
 
+    ##
+    # Compute slice similarities for all slices of all stacks and all
+    # similarity measures without creating Slice objects for the slice
+    # projections.
+    #
+    # Fast path for similarity-only use (e.g. outlier rejection) with the same
+    # result as compute_slice_projections followed by
+    # evaluate_slice_similarities. Slice projections are computed as arrays
+    # distributed over n_threads workers. NCC and NMI are evaluated for all
+    # slices of a stack at once; all remaining measures are evaluated
+    # slice-wise on the masked arrays.
+    # \date       2026-10-17 05:20:28+0000
+    #
+    # \param      self  The object
+    # \post       self._slice_similarities updated
+    #
+    def compute_slice_similarities(self):
+
+        if self._verbose:
+            ph.print_info(
+                "Compute slice projections (%d threads) ... " %
+                self._n_threads, newline=False)
+        slice_projections_nda = self._compute_slice_projections_nda()
+        if self._verbose:
+            print("done")
+
+        self._slice_similarities = {
+            stack.get_filename(): {} for stack in self._stacks
+        }
+
+        for i_stack, stack in enumerate(self._stacks):
+            slices = stack.get_slices()
+            N_slices = self._get_original_number_of_slices(stack)
+            stack_name = stack.get_filename()
+            self._slice_similarities[stack_name] = {
+                m: np.ones(N_slices) * self._init_value for m in self._measures
+            }
+            if self._verbose:
+                ph.print_info(
+                    "Stack %d/%d: Compute similarity measures ... " % (
+                        i_stack + 1, len(self._stacks)),
+                    newline=False)
+
+            # Slice data, projections and masks as (N_slices x N_voxels)
+            # arrays
+            slice_numbers = np.array([s.get_slice_number() for s in slices])
+            slices_nda = np.array([
+                sitk.GetArrayFromImage(s.sitk).flatten() for s in slices
+            ])
+            projections_nda = np.array([
+                nda.flatten() for nda, _ in slice_projections_nda[i_stack]
+            ])
+            masks_nda = np.ones(slices_nda.shape, dtype=bool)
+            if self._use_slice_masks:
+                masks_nda &= np.array([
+                    sitk.GetArrayFromImage(s.sitk_mask).flatten() > 0
+                    for s in slices
+                ])
+            if self._use_reference_mask and \
+                    not self._reference.is_unity_mask():
+                masks_nda &= np.array([
+                    nda_mask.flatten() > 0
+                    for _, nda_mask in slice_projections_nda[i_stack]
+                ])
+            is_empty = masks_nda.sum(axis=1) == 0
+
+            for m in self._measures:
+                if m in self._similarity_measures_vectorized:
+                    with np.errstate(divide="ignore", invalid="ignore"):
+                        similarities = self._similarity_measures_vectorized[m](
+                            slices_nda, projections_nda, masks_nda)
+                else:
+                    similarities = self._get_similarities_slice_wise(
+                        m, slices_nda, projections_nda, masks_nda, is_empty)
+                similarities[is_empty] = SimilarityMeasures.UNDEF[m]
+                self._slice_similarities[stack_name][m][slice_numbers] = \
+                    similarities
+
+            if self._verbose:
+                print("done")
+
+    ##
+    # Calculates the slice projections as arrays for all slices of all stacks
+    # using a pool of n_threads workers.
+    # \date       2026-10-17 05:20:51+0000
+    #
+    # \param      self  The object
+    #
+    # \return     Slice projections as list of lists with the same slice
+    #             ordering as stack.get_slices(). Each entry is a tuple
+    #             (projection_nda, reference_mask_nda) whereby
+    #             reference_mask_nda is None if the reference mask is not
+    #             used.
+    #
+    def _compute_slice_projections_nda(self):
+        slices = [
+            (i_stack, slice)
+            for i_stack, stack in enumerate(self._stacks)
+            for slice in stack.get_slices()
+        ]
+
+        # Split slices into contiguous chunks, one per worker
+        N_workers = max(1, min(self._n_threads, len(slices)))
+        chunks = np.array_split(np.arange(len(slices)), N_workers)
+        get_chunk_projections = lambda chunk: \
+            self._get_slice_projections_nda([slices[j][1] for j in chunk])
+
+        if N_workers > 1:
+            pool = ThreadPool(N_workers)
+            try:
+                results = pool.map(get_chunk_projections, chunks)
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            results = [get_chunk_projections(chunk) for chunk in chunks]
+
+        slice_projections_nda = [[] for stack in self._stacks]
+        for chunk, projections_nda in zip(chunks, results):
+            for j, projection_nda in zip(chunk, projections_nda):
+                slice_projections_nda[slices[j][0]].append(projection_nda)
+
+        return slice_projections_nda
+
+    ##
+    # Calculates the slice projections for a chunk of slices. Each call uses
+    # its own LinearOperators instance so that chunks can be processed
+    # concurrently.
+    # \date       2026-10-17 05:21:14+0000
+    #
+    # \param      self    The object
+    # \param      slices  List of Slice objects
+    #
+    # \return     List of tuples (projection_nda, reference_mask_nda)
+    #
+    def _get_slice_projections_nda(self, slices):
+        linear_operators = lin_op.LinearOperators()
+        itk2np = itk.PyBuffer[itk.Image.D3]
+        reference_mask_sitk = None
+        if self._use_reference_mask and not self._reference.is_unity_mask():
+            reference_mask_sitk = self._reference.sitk_mask
+
+        slice_projections_nda = []
+        for slice in slices:
+            in_plane_res = slice.get_inplane_resolution()
+            slice_spacing = np.array([
+                in_plane_res, in_plane_res, slice.get_slice_thickness()])
+            projection_itk = linear_operators.A_itk(
+                reconstruction_itk=self._reference.itk,
+                slice_itk=slice.itk,
+                slice_spacing=slice_spacing,
+            )
+            projection_nda = itk2np.GetArrayFromImage(projection_itk)
+
+            # Same mask resampling as in Stack.get_resampled_stack
+            if reference_mask_sitk is not None:
+                projection_mask_nda = sitk.GetArrayFromImage(sitk.Resample(
+                    reference_mask_sitk,
+                    slice.sitk,
+                    sitk.Euler3DTransform(),
+                    sitk.sitkNearestNeighbor,
+                    0,
+                    reference_mask_sitk.GetPixelIDValue()))
+            else:
+                projection_mask_nda = None
+            slice_projections_nda.append((projection_nda, projection_mask_nda))
+
+        return slice_projections_nda
+
+    ##
+    # Evaluate a similarity measure slice-wise on the masked voxels.
+    # \date       2026-10-17 05:21:37+0000
+    #
+    # \param      measure          Similarity measure as given in
+    #                              nsol.similarity_measures, string
+    # \param      slices_nda       Slice data as (N_slices x N_voxels) array
+    # \param      projections_nda  Slice projections as
+    #                              (N_slices x N_voxels) array
+    # \param      masks_nda        Boolean masks as (N_slices x N_voxels)
+    #                              array
+    # \param      is_empty         Boolean array indicating empty masks
+    #
+    # \return     Similarities as 1D-array of length N_slices
+    #
+    @staticmethod
+    def _get_similarities_slice_wise(
+            measure, slices_nda, projections_nda, masks_nda, is_empty):
+        similarity_measure = SimilarityMeasures.similarity_measures[measure]
+        similarities = np.ones(slices_nda.shape[0]) * \
+            SimilarityMeasures.UNDEF[measure]
+        for k in np.where(~is_empty)[0]:
+            try:
+                similarities[k] = similarity_measure(
+                    slices_nda[k, masks_nda[k]],
+                    projections_nda[k, masks_nda[k]])
+            except ValueError as e:
+                # Error in case only a few/to less non-zero entries exist
+                if measure != "SSIM":
+                    raise ValueError(e.message)
+        return similarities
+
+    ##
+    # Compute the normalized cross correlation for all slices at once. Matches
+    # nsol.similarity_measures.SimilarityMeasures.normalized_cross_correlation
+    # evaluated on the masked voxels of each slice.
+    # \date       2026-10-17 05:22:00+0000
+    #
+    # \param      x          Data as (N_slices x N_voxels) array
+    # \param      x_ref      Reference data as (N_slices x N_voxels) array
+    # \param      masks_nda  Boolean masks as (N_slices x N_voxels) array
+    #
+    # \return     NCC as 1D-array of length N_slices
+    #
+    @staticmethod
+    def _get_normalized_cross_correlation(x, x_ref, masks_nda):
+        N = masks_nda.sum(axis=1).astype(np.float64)
+
+        x = np.where(masks_nda, x, 0)
+        x_ref = np.where(masks_nda, x_ref, 0)
+
+        dx = np.where(masks_nda, x - (x.sum(axis=1) / N)[:, np.newaxis], 0)
+        dx_ref = np.where(
+            masks_nda, x_ref - (x_ref.sum(axis=1) / N)[:, np.newaxis], 0)
+
+        # Standard deviations with ddof=1
+        std = np.sqrt(np.sum(dx * dx, axis=1) / (N - 1))
+        std_ref = np.sqrt(np.sum(dx_ref * dx_ref, axis=1) / (N - 1))
+
+        return np.sum(dx * dx_ref, axis=1) / (N * std * std_ref)
+
+    ##
+    # Compute the normalized mutual information for all slices at once.
+    # Matches
+    # nsol.similarity_measures.SimilarityMeasures.normalized_mutual_information
+    # evaluated on the masked voxels of each slice, i.e. with histograms of
+    # equally sized bins spanning the masked intensity range of each slice.
+    # \date       2026-10-17 05:22:23+0000
+    #
+    # \param      x          Data as (N_slices x N_voxels) array
+    # \param      x_ref      Reference data as (N_slices x N_voxels) array
+    # \param      masks_nda  Boolean masks as (N_slices x N_voxels) array
+    # \param      bins       Number of bins per dimension, integer
+    #
+    # \return     NMI as 1D-array of length N_slices
+    #
+    @staticmethod
+    def _get_normalized_mutual_information(x, x_ref, masks_nda, bins=100):
+        N_slices = masks_nda.shape[0]
+        N = masks_nda.sum(axis=1).astype(np.float64)
+
+        # Slice index of each masked voxel (same ordering as x[masks_nda])
+        rows = np.nonzero(masks_nda)[0]
+        bins_x = ResidualEvaluator._get_bin_indices(x, masks_nda, rows, bins)
+        bins_x_ref = ResidualEvaluator._get_bin_indices(
+            x_ref, masks_nda, rows, bins)
+
+        hist = np.bincount(
+            rows * bins + bins_x,
+            minlength=N_slices * bins).reshape(N_slices, -1)
+        hist_ref = np.bincount(
+            rows * bins + bins_x_ref,
+            minlength=N_slices * bins).reshape(N_slices, -1)
+        hist_joint = np.bincount(
+            (rows * bins + bins_x) * bins + bins_x_ref,
+            minlength=N_slices * bins * bins).reshape(N_slices, -1)
+
+        entropy = ResidualEvaluator._get_entropy(hist, N)
+        entropy_ref = ResidualEvaluator._get_entropy(hist_ref, N)
+        entropy_joint = ResidualEvaluator._get_entropy(hist_joint, N)
+
+        return (entropy + entropy_ref) / entropy_joint
+
+    ##
+    # Get the histogram bin index of each masked voxel given equally sized
+    # bins spanning the masked intensity range of each slice (cf.
+    # numpy.histogram).
+    # \date       2026-10-17 05:22:46+0000
+    #
+    @staticmethod
+    def _get_bin_indices(x, masks_nda, rows, bins):
+        x_min = np.where(masks_nda, x, np.inf).min(axis=1)[rows]
+        x_max = np.where(masks_nda, x, -np.inf).max(axis=1)[rows]
+        x_range = x_max - x_min
+
+        # All values fall into a single bin for constant intensities
+        x_range[x_range == 0] = 1
+        indices = np.floor((x[masks_nda] - x_min) / x_range * bins)
+
+        # Rightmost bin edge is included in last bin
+        return np.clip(indices, 0, bins - 1).astype(np.int64)
+
+    ##
+    # Get the entropy for each row of histograms.
+    # \date       2026-10-17 05:23:09+0000
+    #
+    @staticmethod
+    def _get_entropy(hist, N):
+        p = hist / N[:, np.newaxis]
+        p_log_p = np.zeros_like(p)
+        p_log_p[p > 0] = p[p > 0] * np.log(p[p > 0])
+        return -np.sum(p_log_p, axis=1)
+
     ##
     # Writes the computed slice similarities for all stacks to output directory
     # \date       2018-01-19 17:42:27+0000
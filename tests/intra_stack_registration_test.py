@@ -10,6 +10,7 @@
 import SimpleITK as sitk
 import itk
 import numpy as np
+import scipy.sparse
 import unittest
 import sys
 import os
@@ -1172,3 +1173,60 @@ class IntraStackRegistrationTest(unittest.TestCase):
 
         self.assertEqual(np.round(
             np.linalg.norm(stack_diff_nda), decimals=8), 0)
+
+    ##
+    # Test that the Jacobian of the residual is block sparse, i.e. the
+    # residual of each slice (pair) only depends on its own (and its
+    # neighbour's) parameters.
+    # \date       2026-10-17 05:36:32+0000
+    #
+    def test_jacobian_block_sparsity(self):
+
+        filename_stack = "fetal_brain_0"
+
+        stack = st.Stack.from_filename(
+            os.path.join(self.dir_test_data, filename_stack + ".nii.gz"),
+            os.path.join(self.dir_test_data, filename_stack + "_mask.nii.gz")
+        )
+        stack_corrupted, motion_sitk, motion_2_sitk = \
+            get_inplane_corrupted_stack(stack, 0.1, (0, 0), np.array([1, -2]))
+
+        inplane_registration = inplanereg.IntraStackRegistration(
+            stack_corrupted, stack)
+        inplane_registration.set_transform_initializer_type("moments")
+        inplane_registration.set_intensity_correction_initializer_type(
+            "linear")
+        inplane_registration.set_intensity_correction_type_slice_neighbour_fit(
+            "linear")
+        inplane_registration.set_alpha_reference(1)
+        inplane_registration.set_alpha_neighbour(1)
+        inplane_registration.set_alpha_parameter(1)
+        inplane_registration.set_optimizer_iter_max(2)
+        inplane_registration.run()
+
+        x = inplane_registration.get_parameters().flatten()
+        residual = inplane_registration._get_residual_call()(x)
+        jacobian = inplane_registration._get_jacobian_residual_call()(x)
+
+        self.assertTrue(scipy.sparse.issparse(jacobian))
+        self.assertEqual(jacobian.shape, (residual.size, x.size))
+
+        N_slices = stack_corrupted.get_number_of_slices()
+        N_slice_voxels = stack_corrupted.sitk.GetWidth() * \
+            stack_corrupted.sitk.GetHeight()
+        dofs = x.size // N_slices
+
+        # Reference fit: residual of slice i depends on parameters of slice i
+        for i in range(0, N_slices):
+            rows = jacobian[i * N_slice_voxels:(i + 1) * N_slice_voxels]
+            cols = np.unique(rows.nonzero()[1])
+            self.assertTrue(np.all(cols // dofs == i))
+
+        # Neighbour fit: residual of pair (i, i+1) depends on parameters of
+        # slices i and i+1
+        offset = N_slices * N_slice_voxels
+        for i in range(0, N_slices - 1):
+            rows = jacobian[offset + i * N_slice_voxels:
+                            offset + (i + 1) * N_slice_voxels]
+            cols = np.unique(rows.nonzero()[1])
+            self.assertTrue(np.all(np.in1d(cols // dofs, [i, i + 1])))
@@ -87,6 +87,45 @@ class LinearOperatorsTest(unittest.TestCase):
             sitk.GetArrayFromImage(difference_sitk))
         self.assertAlmostEqual(error, 0, places=self.precision)
 
+    ##
+    # Test the separable PSF components, i.e. that the interpolation of a
+    # constant image is exact within the image space and that the separable
+    # blurring is self-adjoint
+    # \date       2026-10-17 05:46:08+0000
+    #
+    def test_separable_psf(self):
+
+        stack = st.Stack.from_filename(self.path_to_file)
+        reconstruction = st.Stack.from_filename(
+            self.path_to_recon, self.path_to_recon_mask)
+
+        linear_operators = lin_op.LinearOperators()
+        slice_spacing = np.array([
+            stack.get_inplane_resolution(),
+            stack.get_inplane_resolution(),
+            stack.get_slice_thickness(),
+        ])
+        cov = linear_operators.get_covariance(
+            reconstruction.itk, stack.itk, slice_spacing)
+        grid_itk, sigma = linear_operators.get_separable_psf_grid(
+            reconstruction.itk, [stack.itk], cov)
+
+        T = linear_operators.get_interpolation_sparse(
+            reconstruction.itk, grid_itk)
+        T_ones = T.dot(np.ones(T.shape[1]))
+        inside = T.getnnz(axis=1) == 8
+        self.assertAlmostEqual(
+            np.linalg.norm(T_ones[inside] - 1), 0, places=self.precision)
+
+        grid_shape = tuple(
+            grid_itk.GetLargestPossibleRegion().GetSize())[::-1]
+        x = np.random.rand(*grid_shape)
+        y = np.random.rand(*grid_shape)
+        self.assertAlmostEqual(
+            (np.sum(linear_operators.B_separable_nda(x, sigma) * y) -
+             np.sum(x * linear_operators.B_separable_nda(y, sigma))) /
+            np.sum(x * y), 0, places=12)
+
     ##
     # Test script to simulate stacks from slices
     # \date       2017-11-28 23:13:02+0000
@@ -17,8 +17,9 @@ import pysitk.simple_itk_helper as sitkh
 
 import niftymic.registration.niftyreg as nreg
 import niftymic.base.stack as st
+import niftymic.utilities.scratch_directory as scratch
 
-from niftymic.definitions import DIR_TEST
+from niftymic.definitions import DIR_TEST, DIR_TMP
 
 
 class NiftyRegTest(unittest.TestCase):
@@ -73,3 +74,67 @@ class NiftyRegTest(unittest.TestCase):
 
         self.assertAlmostEqual(
             np.linalg.norm(res_diff_nda), 0, places=self.accuracy)
+
+    def test_copy_reg_aladin(self):
+
+        filename_fixed = "stack1_rotated_angle_z_is_pi_over_10.nii.gz"
+        filename_moving = "FetalBrain_reconstruction_3stacks_myAlg.nii.gz"
+
+        moving = st.Stack.from_filename(
+            os.path.join(self.dir_test_data, filename_moving),
+        )
+        fixed = st.Stack.from_filename(
+            os.path.join(self.dir_test_data, filename_fixed)
+        )
+
+        nifty_reg = nreg.RegAladin(fixed=fixed, moving=moving)
+        nifty_reg.set_registration_type("Rigid")
+
+        # Copy shares settings but uses own directory for temporary results
+        nifty_reg_copy = nifty_reg.get_copy()
+        self.assertEqual(
+            nifty_reg_copy.get_registration_type(),
+            nifty_reg.get_registration_type())
+        self.assertEqual(nifty_reg_copy.get_options(), nifty_reg.get_options())
+        self.assertNotEqual(
+            nifty_reg_copy.get_subfolder(), nifty_reg.get_subfolder())
+
+        nifty_reg.run()
+        nifty_reg_copy.run()
+
+        parameters = np.array(
+            nifty_reg.get_registration_transform_sitk().GetParameters())
+        parameters_copy = np.array(
+            nifty_reg_copy.get_registration_transform_sitk().GetParameters())
+        self.assertAlmostEqual(
+            np.linalg.norm(parameters - parameters_copy), 0,
+            places=self.accuracy)
+
+    def test_scratch_directory_reg_aladin(self):
+
+        filename_fixed = "stack1_rotated_angle_z_is_pi_over_10.nii.gz"
+        filename_moving = "FetalBrain_reconstruction_3stacks_myAlg.nii.gz"
+
+        moving = st.Stack.from_filename(
+            os.path.join(self.dir_test_data, filename_moving),
+        )
+        fixed = st.Stack.from_filename(
+            os.path.join(self.dir_test_data, filename_fixed)
+        )
+
+        # Intermediate results are written to the run directory below root
+        dir_root = os.path.join(DIR_TMP, "scratch_directory_test")
+        scratch.set_root(dir_root)
+        dir_run = scratch.get_directory()
+        self.assertEqual(os.path.dirname(dir_run), dir_root)
+        self.assertEqual(scratch.get_directory(), dir_run)
+        self.assertNotEqual(
+            scratch.get_unique_directory("RegAladin"),
+            scratch.get_unique_directory("RegAladin"))
+
+        nifty_reg = nreg.RegAladin(fixed=fixed, moving=moving)
+        nifty_reg.run()
+        self.assertTrue(ph.file_exists(
+            os.path.join(dir_run, nifty_reg.get_subfolder(), "fixed.nii.gz")))
+
+        scratch.set_root()
@@ -0,0 +1,131 @@
+##
+# \file parallel_solver_parameter_study_test.py
+#  \brief  Unit tests of the parallel solver parameter study
+#
+#  \author agent (agent@local)
+#  \date October 2026
+
+
+import os
+import unittest
+import numpy as np
+
+import nsol.observer as Observer
+import nsol.tikhonov_linear_solver as tk
+import nsol.tikhonov_linear_solver_parameter_study as tkparam
+from nsol.reader_parameter_study import ReaderParameterStudy
+
+import niftymic.reconstruction.parallel_solver_parameter_study as \
+    parallel_study
+from niftymic.definitions import DIR_TMP
+
+
+class ParallelSolverParameterStudyTest(unittest.TestCase):
+
+    def setUp(self):
+        self.precision = 7
+        self.dir_output = os.path.join(
+            DIR_TMP, "parallel_solver_parameter_study")
+
+        np.random.seed(1)
+        self.A_nda = np.random.rand(60, 20)
+        self.x_ref = np.random.rand(20)
+        self.b = self.A_nda.dot(self.x_ref) + 0.01 * np.random.rand(60)
+        self.alphas = [0.01, 0.1, 0.5, 1.]
+
+    def _get_solver(self, **kwargs):
+        return tk.TikhonovLinearSolver(
+            A=lambda x: self.A_nda.dot(x),
+            A_adj=lambda y: self.A_nda.transpose().dot(y),
+            B=lambda x: x.flatten(),
+            B_adj=lambda x: x.flatten(),
+            b=self.b,
+            x0=np.zeros_like(self.x_ref),
+            alpha=self.alphas[0],
+            iter_max=100,
+            **kwargs
+        )
+
+    ##
+    # Test that a warm-started configuration matches the cold solve of the
+    # same problem, including regularization data and bounds
+    # \date       2026-10-17 06:22:50+0000
+    #
+    def test_warm_started_configuration(self):
+
+        kwargs = {"b_reg": 0.5 * self.x_ref, "bounds": (0, 0.5)}
+        measures = {"RMSE": lambda x: np.sqrt(np.mean((x - self.x_ref)**2))}
+        parallel_parameter_study = \
+            parallel_study.ParallelSolverParameterStudy(
+                parameter_study=None,
+                get_solver=lambda: self._get_solver(**kwargs),
+                measures=measures,
+                warm_start=True,
+            )
+
+        # Warm start from the solution for a larger alpha
+        solver = self._get_solver(**kwargs)
+        solver.set_alpha(self.alphas[-1])
+        solver.run()
+        x0 = solver.get_x()
+        x_warm = parallel_parameter_study._run_configuration(
+            ["alpha"], (self.alphas[1],), x0)[-1]
+
+        solver = self._get_solver(**kwargs)
+        solver.set_alpha(self.alphas[1])
+        solver.run()
+        x_cold = solver.get_x()
+
+        self.assertTrue(np.all(x_warm <= 0.5))
+        self.assertAlmostEqual(
+            np.linalg.norm(x_warm - x_cold) / np.linalg.norm(x_cold), 0,
+            places=6)
+
+    ##
+    # Test that concurrently solved and warm-started parameter
+    # configurations match the individually obtained solutions
+    # \date       2026-10-17 05:49:46+0000
+    #
+    def test_warm_started_alpha_sweep(self):
+
+        name = "TK0L2"
+        measures = {
+            "RMSE": lambda x: np.sqrt(np.mean((x - self.x_ref)**2)),
+        }
+        observer = Observer.Observer()
+        observer.set_measures(measures)
+        parameter_study = tkparam.TikhonovLinearSolverParameterStudy(
+            self._get_solver(), observer,
+            dir_output=self.dir_output,
+            name=name,
+            parameters={"alpha": self.alphas},
+        )
+
+        parallel_parameter_study = \
+            parallel_study.ParallelSolverParameterStudy(
+                parameter_study=parameter_study,
+                get_solver=self._get_solver,
+                measures=measures,
+                n_threads=2,
+                warm_start=True,
+            )
+        parallel_parameter_study.run()
+
+        reader_parameter_study = ReaderParameterStudy(
+            directory=self.dir_output, name=name)
+        reader_parameter_study.read_study()
+        parameters_to_line = reader_parameter_study.get_parameters_to_line()
+        reconstructions = reader_parameter_study.get_reconstructions()
+        self.assertEqual(len(parameters_to_line), len(self.alphas))
+
+        for alpha in self.alphas:
+            solver = self._get_solver()
+            solver.set_alpha(alpha)
+            solver.run()
+            x = solver.get_x()
+
+            line = parameters_to_line[(str(float(alpha)),)]
+            x_study = reconstructions[str(line)].astype(np.float64)
+            self.assertAlmostEqual(
+                np.linalg.norm(x_study - x) / np.linalg.norm(x), 0,
+                places=2)
@@ -59,6 +59,41 @@ class ResidualEvaluatorTest(unittest.TestCase):
                 error = np.linalg.norm(rho_res - rho_res1)
                 self.assertAlmostEqual(error, 0, places=self.precision)
 
+    def test_compute_slice_similarities(self):
+
+        paths_to_stacks = [
+            os.path.join(
+                DIR_TEST, "fetal_brain_%d.nii.gz" % d) for d in range(0, 3)
+        ]
+        path_to_reference = os.path.join(
+            DIR_TEST, "FetalBrain_reconstruction_3stacks_myAlg.nii.gz")
+
+        stacks = [
+            st.Stack.from_filename(p, ph.append_to_filename(p, "_mask"))
+            for p in paths_to_stacks
+        ]
+        reference = st.Stack.from_filename(
+            path_to_reference, extract_slices=False)
+
+        measures = ["NCC", "NMI", "RMSE"]
+        residual_evaluator = res_ev.ResidualEvaluator(
+            stacks, reference, measures=measures)
+        residual_evaluator.compute_slice_projections()
+        residual_evaluator.evaluate_slice_similarities()
+        slice_similarities = residual_evaluator.get_slice_similarities()
+
+        residual_evaluator1 = res_ev.ResidualEvaluator(
+            stacks, reference, measures=measures, n_threads=4)
+        residual_evaluator1.compute_slice_similarities()
+        slice_similarities1 = residual_evaluator1.get_slice_similarities()
+
+        for stack_name in slice_similarities.keys():
+            for m in measures:
+                rho_res = np.nan_to_num(slice_similarities[stack_name][m])
+                rho_res1 = np.nan_to_num(slice_similarities1[stack_name][m])
+                error = np.linalg.norm(rho_res - rho_res1)
+                self.assertAlmostEqual(error, 0, places=5)
+
     def test_slice_projections_not_created(self):
         paths_to_stacks = [
             os.path.join(
@@ -19,8 +19,11 @@ from image_similarity_evaluator_test import *
 from intensity_correction_test import *
 from linear_operators_test import *
 from niftyreg_test import *
+from parallel_solver_parameter_study_test import *
 from residual_evaluator_test import *
+from scattered_data_approximation_test import *
 from segmentation_propagation_test import *
+from solver_test import *
 # from simulator_slice_acquisition_test import *  # only in dev branch
 from stack_test import *
 
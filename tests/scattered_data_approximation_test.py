@@ -0,0 +1,243 @@
+##
+# \file scattered_data_approximation_test.py
+#  \brief  Unit tests of ScatteredDataApproximation
+#
+#  \author agent (agent@local)
+#  \date October 2026
+
+
+import os
+import unittest
+import numpy as np
+import SimpleITK as sitk
+
+import pysitk.python_helper as ph
+
+import niftymic.base.stack as st
+import niftymic.reconstruction.scattered_data_approximation as sda
+import niftymic.utilities.volumetric_reconstruction_pipeline as pipeline
+from niftymic.definitions import DIR_TEST
+
+
+class ScatteredDataApproximationTest(unittest.TestCase):
+
+    def setUp(self):
+        self.precision = 7
+
+        paths_to_stacks = [
+            os.path.join(
+                DIR_TEST, "fetal_brain_%d.nii.gz" % d) for d in range(0, 3)
+        ]
+        path_to_reference = os.path.join(
+            DIR_TEST, "FetalBrain_reconstruction_3stacks_myAlg.nii.gz")
+
+        self.stacks = [
+            st.Stack.from_filename(p, ph.append_to_filename(p, "_mask"))
+            for p in paths_to_stacks
+        ]
+        self.reconstruction = st.Stack.from_filename(
+            path_to_reference, extract_slices=False)
+
+    ##
+    # Test that the slice contributions match the nearest neighbour
+    # resampling of the slices onto the HR volume grid
+    # \date       2026-10-17 05:24:13+0000
+    #
+    def test_slice_contributions(self):
+
+        SDA = sda.ScatteredDataApproximation(
+            self.stacks, self.reconstruction, verbose=False)
+        geometry_HR = SDA._get_geometry(self.reconstruction.sitk)
+
+        # Rotate slices to obtain oblique slice orientations
+        transform_sitk = sitk.Euler3DTransform()
+        transform_sitk.SetRotation(0.1, 0.05, -0.1)
+        for slice in self.stacks[0].get_slices():
+            slice.update_motion_correction(transform_sitk)
+
+        for stack in self.stacks:
+            for slice in stack.get_slices():
+
+                # Intensity offset to identify voxels struck by the slice
+                slice_resampled_sitk = sitk.Resample(
+                    slice.sitk + 1,
+                    self.reconstruction.sitk,
+                    sitk.Euler3DTransform(),
+                    sitk.sitkNearestNeighbor,
+                    0.,
+                    self.reconstruction.sitk.GetPixelIDValue())
+                nda_ref = sitk.GetArrayFromImage(slice_resampled_sitk)
+
+                nda = np.zeros_like(nda_ref)
+                indices, values = SDA._get_slice_contributions(
+                    slice.sitk, geometry_HR)
+                nda.ravel()[indices] = values + 1
+
+                self.assertAlmostEqual(
+                    np.linalg.norm(nda - nda_ref), 0, places=self.precision)
+
+    ##
+    # Test that the numerator and denominator accumulated by a pool of
+    # workers match the serial accumulation
+    # \date       2026-10-17 05:25:05+0000
+    #
+    def test_threaded_numerator_and_denominator(self):
+
+        helpers = {}
+        for n_threads in [1, 4]:
+            SDA = sda.ScatteredDataApproximation(
+                self.stacks,
+                st.Stack.from_stack(self.reconstruction),
+                verbose=False,
+                n_threads=n_threads,
+            )
+            SDA.run()
+            helpers[n_threads] = SDA.get_numerator_and_denominator()
+
+        for i in range(2):
+            self.assertAlmostEqual(
+                np.linalg.norm(helpers[1][i] - helpers[4][i]), 0,
+                places=self.precision)
+
+    ##
+    # Test that removing and updating slices incrementally matches the
+    # recomputation from scratch
+    # \date       2026-10-17 05:26:32+0000
+    #
+    def test_remove_and_update_slices(self):
+
+        SDA = sda.ScatteredDataApproximation(
+            self.stacks,
+            st.Stack.from_stack(self.reconstruction),
+            sda_mask=True,
+            verbose=False,
+        )
+        SDA.run()
+
+        # Reject some slices and move others
+        slices = self.stacks[0].get_slices()
+        slices_rejected = slices[0:3]
+        for slice in slices_rejected:
+            self.stacks[0].delete_slice(slice)
+
+        transform_sitk = sitk.Euler3DTransform()
+        transform_sitk.SetRotation(0.1, 0.05, -0.1)
+        for slice in self.stacks[1].get_slices()[0:5]:
+            slice.update_motion_correction(transform_sitk)
+
+        SDA.remove_slices(slices_rejected)
+        SDA.update_slices([
+            slice for stack in self.stacks for slice in stack.get_slices()])
+        helpers = SDA.get_numerator_and_denominator()
+        nda_mask = sitk.GetArrayFromImage(SDA.get_reconstruction().sitk_mask)
+
+        SDA_ref = sda.ScatteredDataApproximation(
+            self.stacks,
+            st.Stack.from_stack(self.reconstruction),
+            sda_mask=True,
+            verbose=False,
+        )
+        SDA_ref.run()
+        helpers_ref = SDA_ref.get_numerator_and_denominator()
+        nda_mask_ref = sitk.GetArrayFromImage(
+            SDA_ref.get_reconstruction().sitk_mask)
+
+        for i in range(2):
+            self.assertAlmostEqual(
+                np.linalg.norm(helpers[i] - helpers_ref[i]), 0,
+                places=self.precision)
+        self.assertEqual(np.sum(np.abs(nda_mask - nda_mask_ref)), 0)
+
+        # Move an already updated slice again; its previous contribution
+        # needs to be subtracted at the position it was accumulated at
+        slice_moved = self.stacks[1].get_slices()[0]
+        transform_sitk = sitk.Euler3DTransform()
+        transform_sitk.SetTranslation((2., -1., 3.))
+        slice_moved.update_motion_correction(transform_sitk)
+        self.assertFalse(SDA._is_accumulated(slice_moved))
+
+        SDA.update_slices([slice_moved])
+        self.assertTrue(SDA._is_accumulated(slice_moved))
+        helpers = SDA.get_numerator_and_denominator()
+        nda_mask = sitk.GetArrayFromImage(SDA.get_reconstruction().sitk_mask)
+
+        SDA_ref = sda.ScatteredDataApproximation(
+            self.stacks,
+            st.Stack.from_stack(self.reconstruction),
+            sda_mask=True,
+            verbose=False,
+        )
+        SDA_ref.run()
+        helpers_ref = SDA_ref.get_numerator_and_denominator()
+        nda_mask_ref = sitk.GetArrayFromImage(
+            SDA_ref.get_reconstruction().sitk_mask)
+
+        for i in range(2):
+            self.assertAlmostEqual(
+                np.linalg.norm(helpers[i] - helpers_ref[i]), 0,
+                places=self.precision)
+        self.assertEqual(np.sum(np.abs(nda_mask - nda_mask_ref)), 0)
+
+    ##
+    # Test that the accumulation in single precision matches the one in
+    # double precision
+    # \date       2026-10-17 05:38:01+0000
+    #
+    def test_single_precision(self):
+
+        helpers = {}
+        recons = {}
+        for precision in ["float64", "float32"]:
+            SDA = sda.ScatteredDataApproximation(
+                self.stacks,
+                st.Stack.from_stack(self.reconstruction),
+                verbose=False,
+                precision=precision,
+            )
+            SDA.run()
+            helpers[precision] = SDA.get_numerator_and_denominator()
+            recons[precision] = sitk.GetArrayFromImage(
+                SDA.get_reconstruction().sitk)
+
+        for i in range(2):
+            self.assertEqual(helpers["float32"][i].dtype, np.float32)
+            self.assertAlmostEqual(
+                np.linalg.norm(helpers["float64"][i] - helpers["float32"][i]) /
+                np.linalg.norm(helpers["float64"][i]), 0, places=5)
+
+        self.assertAlmostEqual(
+            np.linalg.norm(recons["float64"] - recons["float32"]) /
+            np.linalg.norm(recons["float64"]), 0, places=5)
+
+    ##
+    # Test that a multi-component reconstruction using SDA, which provides
+    # no copies for worker processes, falls back to serial execution
+    # \date       2026-10-17 06:11:27+0000
+    #
+    def test_multi_component_reconstruction_processes(self):
+
+        reconstructions = {}
+        for n_processes in [1, 2]:
+            multi_component_reconstruction = \
+                pipeline.MultiComponentReconstruction(
+                    stacks=self.stacks,
+                    reconstruction_method=sda.ScatteredDataApproximation(
+                        self.stacks,
+                        st.Stack.from_stack(self.reconstruction),
+                        verbose=False,
+                    ),
+                    n_processes=n_processes,
+                )
+            multi_component_reconstruction.run()
+            reconstructions[n_processes] = \
+                multi_component_reconstruction.get_reconstructions()
+
+        for recon, recon_processes in zip(
+                reconstructions[1], reconstructions[2]):
+            self.assertEqual(
+                recon.get_filename(), recon_processes.get_filename())
+            self.assertAlmostEqual(
+                np.linalg.norm(
+                    sitk.GetArrayFromImage(recon.sitk) -
+                    sitk.GetArrayFromImage(recon_processes.sitk)), 0,
+                places=self.precision)
@@ -0,0 +1,827 @@
+##
+# \file solver_test.py
+#  \brief  Unit tests of the operators provided by the reconstruction solvers
+#
+#  \author agent (agent@local)
+#  \date October 2026
+
+
+import os
+import unittest
+import numpy as np
+import SimpleITK as sitk
+
+import pysitk.python_helper as ph
+import pysitk.simple_itk_helper as sitkh
+
+import niftymic.base.stack as st
+import niftymic.base.data_writer as dw
+import niftymic.reconstruction.linear_operators as lin_op
+import niftymic.reconstruction.primal_dual_solver as pd
+import niftymic.reconstruction.tikhonov_solver as tk
+import niftymic.utilities.volumetric_reconstruction_pipeline as pipeline
+from niftymic.definitions import DIR_TEST, DIR_TMP
+
+
+class SolverTest(unittest.TestCase):
+
+    def setUp(self):
+        self.precision = 7
+
+        paths_to_stacks = [
+            os.path.join(
+                DIR_TEST, "fetal_brain_%d.nii.gz" % d) for d in range(0, 3)
+        ]
+        path_to_reference = os.path.join(
+            DIR_TEST, "FetalBrain_reconstruction_3stacks_myAlg.nii.gz")
+
+        self.stacks = [
+            st.Stack.from_filename(p, ph.append_to_filename(p, "_mask"))
+            for p in paths_to_stacks
+        ]
+        self.reconstruction = st.Stack.from_filename(
+            path_to_reference, extract_slices=False)
+
+    def _get_solver(self, **kwargs):
+        return tk.TikhonovSolver(
+            stacks=self.stacks,
+            reconstruction=st.Stack.from_stack(self.reconstruction),
+            **kwargs
+        )
+
+    ##
+    # Gets the TK1 Tikhonov cost of the current reconstruction of the solver
+    # \date       2026-10-17 06:20:27+0000
+    #
+    # \return     tuple (data cost, total cost)
+    #
+    def _get_cost(self, solver):
+        x = solver.get_x0()
+        B, B_adj = solver.get_gradient_operators()
+        cost_data = 0.5 * np.sum((solver.get_A()(x) - solver.get_b())**2)
+        cost_reg = 0.5 * solver.get_alpha() * np.sum(B(x)**2)
+        return cost_data, cost_data + cost_reg
+
+    ##
+    # Test that operator evaluations using a worker pool match the serial
+    # evaluation
+    # \date       2026-10-17 05:09:40+0000
+    #
+    def test_threaded_operators(self):
+
+        solver = self._get_solver(n_threads=1)
+        solver_threads = self._get_solver(n_threads=4)
+
+        x = solver.get_x0()
+        y = solver.get_b()
+
+        A_x = solver.get_A()(x)
+        A_x_threads = solver_threads.get_A()(x)
+        self.assertAlmostEqual(
+            np.linalg.norm(A_x - A_x_threads), 0, places=self.precision)
+
+        A_adj_y = solver.get_A_adj()(y)
+        A_adj_y_threads = solver_threads.get_A_adj()(y)
+        self.assertAlmostEqual(
+            np.linalg.norm(A_adj_y - A_adj_y_threads) /
+            np.linalg.norm(A_adj_y), 0, places=self.precision)
+
+        # Worker threads are released on close and after run
+        self.assertIsNotNone(solver_threads._pool)
+        solver_threads.close()
+        self.assertIsNone(solver_threads._pool)
+        solver_threads.set_iter_max(1)
+        solver_threads.run()
+        self.assertIsNone(solver_threads._pool)
+
+    ##
+    # Gets the slice-wise evaluation of the forward operator M A on the
+    # reconstruction
+    # \date       2026-10-17 06:17:37+0000
+    #
+    # \return     1D numpy array
+    #
+    def _get_A_x_slice_wise(self):
+        linear_operators = lin_op.LinearOperators()
+        A_x = []
+        for stack in self.stacks:
+            for slice in stack.get_slices():
+                slice_spacing = np.array([
+                    slice.get_inplane_resolution(),
+                    slice.get_inplane_resolution(),
+                    slice.get_slice_thickness(),
+                ])
+                slice_itk = linear_operators.M_itk(
+                    linear_operators.A_itk(
+                        self.reconstruction.itk, slice.itk, slice_spacing),
+                    slice.itk_mask)
+                A_x.append(sitk.GetArrayFromImage(
+                    sitkh.get_sitk_from_itk_image(slice_itk)).flatten())
+        return np.concatenate(A_x)
+
+    ##
+    # Test that stack-wise operator evaluations match the slice-wise ones
+    # \date       2026-10-17 06:18:00+0000
+    #
+    def test_stack_operators(self):
+
+        solver = self._get_solver()
+        x = solver.get_x0()
+
+        # Operators are evaluated for the unmoved stacks at once
+        for stack in self.stacks:
+            self.assertIsNotNone(solver._get_stack_group(stack))
+        A_x = solver.get_A()(x)
+        A_x_ref = self._get_A_x_slice_wise()
+        self.assertAlmostEqual(
+            np.linalg.norm(A_x - A_x_ref) / np.linalg.norm(A_x_ref), 0,
+            places=self.precision)
+
+        # Replaced slice masks are taken into account by the stack path
+        slice_masked = self.stacks[0].get_slices()[0]
+        slice_masked.sitk_mask = sitk.Image(slice_masked.sitk_mask) * 0
+        slice_masked.itk_mask = sitkh.get_itk_from_sitk_image(
+            slice_masked.sitk_mask)
+        self.assertIsNotNone(solver._get_stack_group(self.stacks[0]))
+        A_x = solver.get_A()(x)
+        A_x_ref = self._get_A_x_slice_wise()
+        self.assertAlmostEqual(
+            np.linalg.norm(A_x - A_x_ref) / np.linalg.norm(A_x_ref), 0,
+            places=self.precision)
+
+        # Stack-wise evaluation is no longer possible once a slice was moved
+        transform_sitk = sitk.Euler3DTransform()
+        transform_sitk.SetRotation(0.1, 0.05, -0.1)
+        self.stacks[0].get_slices()[1].update_motion_correction(transform_sitk)
+        self.assertIsNone(solver._get_stack_group(self.stacks[0]))
+        self.assertIsNotNone(solver._get_stack_group(self.stacks[1]))
+
+    ##
+    # Test that the adjoint operator restricted to the regions affected by
+    # the slices matches the evaluation on the entire reconstruction space
+    # \date       2026-10-17 05:27:50+0000
+    #
+    def test_adjoint_operator_regions(self):
+
+        solver = self._get_solver()
+        y = solver.get_b()
+        A_adj_y = solver.get_A_adj()(y)
+
+        # Slice-wise reference on entire reconstruction space
+        linear_operators = lin_op.LinearOperators()
+        A_adj_y_ref = np.zeros_like(A_adj_y)
+        i_min = 0
+        for stack in self.stacks:
+            for slice in stack.get_slices():
+                slice_nda = sitk.GetArrayFromImage(slice.sitk)
+                i_max = i_min + slice_nda.size
+                slice_sitk = sitk.GetImageFromArray(
+                    y[i_min:i_max].reshape(slice_nda.shape))
+                slice_sitk.CopyInformation(slice.sitk)
+                i_min = i_max
+
+                slice_spacing = np.array([
+                    slice.get_inplane_resolution(),
+                    slice.get_inplane_resolution(),
+                    slice.get_slice_thickness(),
+                ])
+                slice_itk = linear_operators.A_adj_itk(
+                    linear_operators.M_itk(
+                        sitkh.get_itk_from_sitk_image(slice_sitk),
+                        slice.itk_mask),
+                    self.reconstruction.itk,
+                    slice_spacing)
+                A_adj_y_ref += sitk.GetArrayFromImage(
+                    sitkh.get_sitk_from_itk_image(slice_itk)).flatten()
+
+        self.assertAlmostEqual(
+            np.linalg.norm(A_adj_y - A_adj_y_ref) / np.linalg.norm(A_adj_y_ref),
+            0, places=self.precision)
+
+    ##
+    # Test that cached slice geometries are invalidated once slices move
+    # \date       2026-10-17 05:10:33+0000
+    #
+    def test_slice_geometry_cache_invalidation(self):
+
+        solver = self._get_solver()
+        solver.run()
+        x = solver.get_x0()
+
+        # Rotate all slices of first stack
+        transform_sitk = sitk.Euler3DTransform()
+        transform_sitk.SetRotation(0.1, 0.05, -0.1)
+        for slice in self.stacks[0].get_slices():
+            slice.update_motion_correction(transform_sitk)
+
+        A_x = solver.get_A()(x)
+        A_x_ref = self._get_solver().get_A()(x)
+        self.assertAlmostEqual(
+            np.linalg.norm(A_x - A_x_ref), 0, places=self.precision)
+
+    ##
+    # Test that operator evaluations based on the sparse system matrix match
+    # the ITK filter-based ones
+    # \date       2026-10-17 05:15:25+0000
+    #
+    def test_system_matrix_operators(self):
+
+        solver = self._get_solver()
+        solver_matrix = self._get_solver(use_system_matrix=True)
+        solver_matrix.set_system_matrix_memory_limit(np.inf)
+
+        x = solver.get_x0()
+        y = solver.get_b()
+
+        A_x = solver.get_A()(x)
+        A_x_matrix = solver_matrix.get_A()(x)
+        self.assertAlmostEqual(
+            np.linalg.norm(A_x - A_x_matrix) / np.linalg.norm(A_x), 0,
+            places=self.precision)
+
+        A_adj_y = solver.get_A_adj()(y)
+        A_adj_y_matrix = solver_matrix.get_A_adj()(y)
+        self.assertAlmostEqual(
+            np.linalg.norm(A_adj_y - A_adj_y_matrix) /
+            np.linalg.norm(A_adj_y), 0, places=self.precision)
+
+        # Transpose of the system matrix is the adjoint of the filters
+        A_sparse = solver_matrix.get_system_matrix()
+        A_sparse_T_y = A_sparse.transpose().dot(y)
+        self.assertAlmostEqual(
+            np.linalg.norm(A_adj_y - A_sparse_T_y) /
+            np.linalg.norm(A_adj_y), 0, places=self.precision)
+        self.assertAlmostEqual(
+            np.dot(A_x, y) / np.dot(x, A_sparse_T_y), 1,
+            places=self.precision)
+
+        # Adjoint operator is given by the transpose
+        self.assertAlmostEqual(
+            np.dot(A_x_matrix, y) / np.dot(x, A_adj_y_matrix), 1,
+            places=self.precision)
+
+    ##
+    # Test that the system matrix keeps the shape of the stacked slice vector
+    # once slices were deleted, e.g. by outlier rejection
+    # \date       2026-10-17 06:09:35+0000
+    #
+    def test_system_matrix_deleted_slices(self):
+
+        slices = self.stacks[0].get_slices()
+        self.stacks[0].delete_slice(slices[len(slices) // 2])
+
+        solver = self._get_solver()
+        solver_matrix = self._get_solver(use_system_matrix=True)
+        solver_matrix.set_system_matrix_memory_limit(np.inf)
+
+        x = solver.get_x0()
+        b = solver_matrix.get_b()
+
+        A_x = solver.get_A()(x)
+        A_x_matrix = solver_matrix.get_A()(x)
+        self.assertEqual(A_x_matrix.size, b.size)
+        self.assertEqual(
+            solver_matrix.get_system_matrix().shape[0], b.size)
+        self.assertAlmostEqual(
+            np.linalg.norm(A_x - A_x_matrix) / np.linalg.norm(A_x), 0,
+            places=self.precision)
+
+        A_adj_b = solver.get_A_adj()(b)
+        A_adj_b_matrix = solver_matrix.get_A_adj()(b)
+        self.assertAlmostEqual(
+            np.linalg.norm(A_adj_b - A_adj_b_matrix) /
+            np.linalg.norm(A_adj_b), 0, places=self.precision)
+        self.assertAlmostEqual(
+            np.dot(A_x, b) / np.dot(x, A_adj_b_matrix), 1,
+            places=self.precision)
+
+    ##
+    # Test that the operators acting on unknowns compressed to the
+    # reconstruction mask are consistent with the ones acting on the entire
+    # reconstruction space
+    # \date       2026-10-17 05:35:15+0000
+    #
+    def test_compressed_unknowns(self):
+
+        mask_sitk = sitk.BinaryThreshold(
+            self.reconstruction.sitk, lowerThreshold=100, upperThreshold=1e10)
+        self.reconstruction = st.Stack.from_sitk_image(
+            image_sitk=self.reconstruction.sitk,
+            slice_thickness=self.reconstruction.get_slice_thickness(),
+            image_sitk_mask=mask_sitk,
+            extract_slices=False)
+        support = np.flatnonzero(sitk.GetArrayFromImage(mask_sitk))
+
+        solver = self._get_solver()
+        solver_compressed = self._get_solver(compress_unknowns=True)
+
+        x0 = solver.get_x0()
+        x0_compressed = solver_compressed.get_x0()
+        self.assertEqual(x0_compressed.size, support.size)
+        self.assertAlmostEqual(
+            np.linalg.norm(x0_compressed - x0[support]), 0,
+            places=self.precision)
+
+        x = np.zeros_like(x0)
+        x[support] = x0_compressed
+        A_x = solver.get_A()(x)
+        A_x_compressed = solver_compressed.get_A()(x0_compressed)
+        self.assertAlmostEqual(
+            np.linalg.norm(A_x - A_x_compressed), 0, places=self.precision)
+
+        y = solver.get_b()
+        A_adj_y = solver.get_A_adj()(y)
+        A_adj_y_compressed = solver_compressed.get_A_adj()(y)
+        self.assertAlmostEqual(
+            np.linalg.norm(A_adj_y[support] - A_adj_y_compressed), 0,
+            places=self.precision)
+
+        # Restricted gradient equals gradient of zero-filled reconstruction
+        # at the masked voxels
+        B, B_adj = solver.get_gradient_operators()
+        B_c, B_c_adj = solver_compressed.get_gradient_operators()
+        B_x = B(x).reshape(3, -1)[:, support]
+        B_c_x = B_c(x0_compressed).reshape(3, -1)
+        self.assertAlmostEqual(
+            np.linalg.norm(B_x - B_c_x), 0, places=self.precision)
+
+        z = np.random.rand(B_c_x.size)
+        self.assertAlmostEqual(
+            np.dot(B_c(x0_compressed), z) / np.dot(x0_compressed, B_c_adj(z)),
+            1, places=self.precision)
+
+    ##
+    # Test that operator evaluations and reconstructions in single precision
+    # match the ones obtained in double precision
+    # \date       2026-10-17 05:38:24+0000
+    #
+    def test_single_precision(self):
+
+        # Single precision is only available for the system matrix
+        with self.assertRaises(ValueError):
+            self._get_solver(precision="float32")
+        solver_single = self._get_solver(
+            use_system_matrix=True, precision="float32")
+        with self.assertRaises(ValueError):
+            solver_single.set_use_system_matrix(False)
+        solver_single.set_system_matrix_memory_limit(0)
+        with self.assertRaises(ValueError):
+            solver_single.get_A()(solver_single.get_x0())
+
+        solver = self._get_solver(use_system_matrix=True)
+        solver.set_system_matrix_memory_limit(np.inf)
+        solver_single.set_system_matrix_memory_limit(np.inf)
+
+        x = solver.get_x0()
+        y = solver.get_b()
+        x_single = solver_single.get_x0()
+        y_single = solver_single.get_b()
+        self.assertEqual(x_single.dtype, np.float32)
+        self.assertEqual(y_single.dtype, np.float32)
+
+        A_x = solver.get_A()(x)
+        A_x_single = solver_single.get_A()(x_single)
+        self.assertEqual(A_x_single.dtype, np.float32)
+        self.assertAlmostEqual(
+            np.linalg.norm(A_x - A_x_single) / np.linalg.norm(A_x), 0,
+            places=5)
+
+        A_adj_y = solver.get_A_adj()(y)
+        A_adj_y_single = solver_single.get_A_adj()(y_single)
+        self.assertEqual(A_adj_y_single.dtype, np.float32)
+        self.assertAlmostEqual(
+            np.linalg.norm(A_adj_y - A_adj_y_single) /
+            np.linalg.norm(A_adj_y), 0, places=5)
+
+        # Reconstruction
+        recons = []
+        for precision in ["float64", "float32"]:
+            solver = self._get_solver(
+                use_system_matrix=True, precision=precision)
+            solver.set_system_matrix_memory_limit(np.inf)
+            solver.set_iter_max(5)
+            solver.run()
+            recons.append(sitk.GetArrayFromImage(
+                solver.get_reconstruction().sitk))
+        self.assertAlmostEqual(
+            np.linalg.norm(recons[0] - recons[1]) / np.linalg.norm(recons[0]),
+            0, places=3)
+
+    ##
+    # Test that the cached masked slice data M y stay valid across slice
+    # motion and are recomputed once slice masks are replaced
+    # \date       2026-10-17 05:39:49+0000
+    #
+    def test_cached_masked_slice_data(self):
+
+        solver = self._get_solver()
+        b = solver.get_b()
+
+        # Slice motion does not affect M y
+        transform_sitk = sitk.Euler3DTransform()
+        transform_sitk.SetRotation(0.1, 0.05, -0.1)
+        for slice in self.stacks[0].get_slices():
+            slice.update_motion_correction(transform_sitk)
+        self.assertAlmostEqual(
+            np.linalg.norm(solver.get_b() - b), 0, places=self.precision)
+
+        # Replace masks of some slices
+        for slice in self.stacks[1].get_slices()[0:5]:
+            slice.sitk_mask = sitk.Image(slice.sitk_mask) * 0
+            slice.itk_mask = sitkh.get_itk_from_sitk_image(slice.sitk_mask)
+
+        b_ref = self._get_solver().get_b()
+        self.assertAlmostEqual(
+            np.linalg.norm(solver.get_b() - b_ref), 0, places=self.precision)
+        self.assertGreater(np.linalg.norm(b - b_ref), 0)
+
+    ##
+    # Test the diagonals of the normal equations used by the Jacobi
+    # preconditioner against evaluations on unit vectors
+    # \date       2026-10-17 05:40:46+0000
+    #
+    def test_jacobi_preconditioner_diagonals(self):
+
+        solver = self._get_solver()
+        solver_matrix = self._get_solver(use_system_matrix=True)
+        solver_matrix.set_system_matrix_memory_limit(np.inf)
+
+        A = solver_matrix.get_A()
+        B, B_adj = solver.get_gradient_operators()
+        diagonal_A = solver_matrix.get_A_adj_A_diagonal()
+        diagonal_A_bound = solver.get_A_adj_A_diagonal()
+        diagonal_B = solver.get_gradient_operators_diagonal()
+
+        x = solver.get_x0()
+        np.random.seed(0)
+        indices = np.concatenate([
+            [0, x.size - 1],
+            np.random.choice(np.flatnonzero(diagonal_A), 10)])
+        for i in indices:
+            e_i = np.zeros_like(x)
+            e_i[i] = 1
+            self.assertAlmostEqual(
+                diagonal_A[i], np.sum(A(e_i)**2), places=self.precision)
+            self.assertAlmostEqual(
+                diagonal_B[i], np.sum(B(e_i)**2), places=self.precision)
+
+        # Row sums of A^* A bound its diagonal from above
+        self.assertTrue(np.all(diagonal_A_bound >= diagonal_A - 1e-6))
+
+    ##
+    # Test that the preconditioned Tikhonov reconstruction approaches the
+    # one obtained without preconditioning and that it reaches a lower cost
+    # after few iterations
+    # \date       2026-10-17 05:41:09+0000
+    #
+    def test_jacobi_preconditioner(self):
+
+        recons = []
+        for preconditioner in [None, "jacobi"]:
+            solver = self._get_solver(
+                use_system_matrix=True, preconditioner=preconditioner)
+            solver.set_system_matrix_memory_limit(np.inf)
+            solver.set_iter_max(30)
+            solver.run()
+            recons.append(sitk.GetArrayFromImage(
+                solver.get_reconstruction().sitk))
+
+        self.assertAlmostEqual(
+            np.linalg.norm(recons[0] - recons[1]) / np.linalg.norm(recons[0]),
+            0, places=2)
+
+        costs = []
+        for preconditioner in [None, "jacobi"]:
+            solver = self._get_solver(
+                use_system_matrix=True, preconditioner=preconditioner)
+            solver.set_system_matrix_memory_limit(np.inf)
+            solver.set_iter_max(5)
+            solver.run()
+            costs.append(self._get_cost(solver))
+
+        # Data and total cost
+        self.assertLess(costs[1][0], costs[0][0])
+        self.assertLess(costs[1][1], costs[0][1])
+
+    ##
+    # Test that the coarse-to-fine reconstruction yields an estimate on the
+    # reconstruction grid which is close to the single-level one
+    # \date       2026-10-17 05:43:11+0000
+    #
+    def test_multigrid_levels(self):
+
+        solver = self._get_solver()
+        reconstruction_coarse = solver._get_coarse_reconstruction(
+            solver.get_reconstruction(), solver.get_reconstruction(), 2)
+        image_sitk = solver.get_reconstruction().sitk
+
+        self.assertEqual(
+            reconstruction_coarse.sitk.GetSize(),
+            tuple([int(np.ceil(s / 2.)) for s in image_sitk.GetSize()]))
+        self.assertAlmostEqual(
+            np.linalg.norm(
+                np.array(reconstruction_coarse.sitk.GetSpacing()) -
+                2 * np.array(image_sitk.GetSpacing())),
+            0, places=self.precision)
+
+        recons = []
+        for n_levels in [1, 2]:
+            solver = self._get_solver()
+            solver.set_iter_max(20)
+            solver.set_n_levels(n_levels)
+            solver.run()
+            reconstruction = solver.get_reconstruction()
+            self.assertEqual(
+                reconstruction.sitk.GetSize(), image_sitk.GetSize())
+            recons.append(sitk.GetArrayFromImage(reconstruction.sitk))
+
+        self.assertLess(
+            np.linalg.norm(recons[0] - recons[1]) / np.linalg.norm(recons[0]),
+            0.1)
+
+    ##
+    # Test that the reduced iteration budget of warm-started two-step cycles
+    # reaches the cost of a cold-started solve within 1%
+    # \date       2026-10-17 06:20:50+0000
+    #
+    def test_warm_start_iter_max(self):
+
+        iter_max = 20
+        tolerance = 0.05
+        get_iter_max = pipeline.TwoStepSliceToVolumeRegistrationReconstruction.\
+            _get_warm_start_iter_max
+
+        self.assertEqual(get_iter_max(iter_max, None, tolerance), iter_max)
+        self.assertEqual(get_iter_max(iter_max, 1., tolerance), iter_max)
+        self.assertEqual(get_iter_max(iter_max, 0.01, tolerance), 4)
+        self.assertEqual(get_iter_max(iter_max, 0, tolerance), 1)
+
+        # lsmr starts from zero
+        solver = self._get_solver(iter_max=iter_max)
+        solver.run()
+        cost_cold = self._get_cost(solver)[1]
+
+        # Cycles starting from the previous reconstruction
+        solver = self._get_solver(iter_max=iter_max)
+        solver.set_warm_start(True)
+        relative_change = None
+        iter_max_cycles = []
+        for cycle in range(3):
+            iter_max_cycles.append(
+                get_iter_max(iter_max, relative_change, tolerance))
+            solver.set_iter_max(iter_max_cycles[-1])
+            nda_previous = sitk.GetArrayFromImage(
+                solver.get_reconstruction().sitk)
+            solver.run()
+            nda = sitk.GetArrayFromImage(solver.get_reconstruction().sitk)
+            relative_change = \
+                np.linalg.norm(nda - nda_previous) / np.linalg.norm(nda)
+
+        self.assertLess(iter_max_cycles[-1], iter_max)
+        self.assertLess(self._get_cost(solver)[1], 1.01 * cost_cold)
+
+    ##
+    # Test that the separable PSF approximation yields adjoint operators
+    # (to machine precision) which are close to the oriented Gaussian
+    # interpolation
+    # \date       2026-10-17 05:46:31+0000
+    #
+    def test_separable_psf_operators(self):
+
+        solver = self._get_solver()
+        solver_separable = self._get_solver(use_separable_psf=True)
+
+        x = solver.get_x0()
+        y = solver.get_b()
+
+        A_x = solver.get_A()(x)
+        A_x_separable = solver_separable.get_A()(x)
+        A_adj_y_separable = solver_separable.get_A_adj()(y)
+
+        self.assertLess(
+            np.linalg.norm(A_x - A_x_separable) / np.linalg.norm(A_x), 0.1)
+        self.assertAlmostEqual(
+            (A_x_separable.dot(y) - x.dot(A_adj_y_separable)) /
+            A_x_separable.dot(y), 0, places=12)
+
+    ##
+    # Test that the separable PSF matches the oriented Gaussian interpolation
+    # for slices aligned with the reconstruction grid. Slice voxel centers
+    # fall onto the grid and the cut-off boxes of both filters coincide, i.e.
+    # alpha_cut * sigma has a fractional part below 0.5 (3.06 and 5.10
+    # voxels). The image vanishes close to the boundary so that the
+    # truncation of the PSF at the boundary has no effect.
+    # \date       2026-10-17 06:22:14+0000
+    #
+    def test_separable_psf_operators_axis_aligned(self):
+
+        np.random.seed(0)
+        nda = np.zeros((64, 64, 64))
+        nda[14:50, 14:50, 14:50] = np.random.rand(36, 36, 36)
+        reconstruction_sitk = sitk.GetImageFromArray(nda)
+        reconstruction = st.Stack.from_sitk_image(
+            reconstruction_sitk, slice_thickness=1, extract_slices=False)
+
+        stack_sitk = sitk.GetImageFromArray(np.random.rand(16, 32, 32))
+        stack_sitk.SetSpacing((2, 2, 4))
+        stack = st.Stack.from_sitk_image(stack_sitk, slice_thickness=4)
+
+        solvers = [
+            tk.TikhonovSolver(
+                stacks=[stack],
+                reconstruction=st.Stack.from_stack(reconstruction),
+                alpha_cut=3,
+                use_separable_psf=use_separable_psf)
+            for use_separable_psf in [False, True]
+        ]
+        self.assertIsNotNone(solvers[1]._get_psf_groups(stack))
+
+        x = solvers[0].get_x0()
+        y = solvers[0].get_b()
+
+        A_x, A_x_separable = [solver.get_A()(x) for solver in solvers]
+        self.assertAlmostEqual(
+            np.linalg.norm(A_x - A_x_separable) / np.linalg.norm(A_x), 0,
+            places=self.precision)
+
+        A_adj_y, A_adj_y_separable = [
+            solver.get_A_adj()(y) for solver in solvers]
+        self.assertAlmostEqual(
+            np.linalg.norm(A_adj_y - A_adj_y_separable) /
+            np.linalg.norm(A_adj_y), 0, places=self.precision)
+
+    ##
+    # Test that only the row blocks of moved slices are reassembled and
+    # blocks of deleted slices are dropped
+    # \date       2026-10-17 05:47:06+0000
+    #
+    def test_system_matrix_block_cache(self):
+
+        solver = self._get_solver(use_system_matrix=True)
+        solver.set_system_matrix_memory_limit(np.inf)
+        solver.get_system_matrix()
+        acquisition_model = solver.get_acquisition_model()
+        blocks = dict(acquisition_model._system_matrix_blocks)
+
+        slices = self.stacks[0].get_slices()
+        slice_moved = slices[1]
+        slice_deleted = slices[2]
+
+        transform_sitk = sitk.Euler3DTransform()
+        transform_sitk.SetRotation(0.1, 0.05, -0.1)
+        slice_moved.update_motion_correction(transform_sitk)
+        self.stacks[0].delete_slice(slice_deleted)
+
+        system_matrix = solver.get_system_matrix()
+        self.assertEqual(system_matrix.shape[0], solver.get_b().size)
+
+        system_matrix_blocks = acquisition_model._system_matrix_blocks
+        self.assertNotIn(slice_deleted, system_matrix_blocks)
+        for slice, cached in system_matrix_blocks.items():
+            if slice is slice_moved:
+                self.assertIsNot(cached[1], blocks[slice][1])
+            else:
+                self.assertIs(cached[1], blocks[slice][1])
+
+        solver_ref = self._get_solver(use_system_matrix=True)
+        solver_ref.set_system_matrix_memory_limit(np.inf)
+        system_matrix_ref = solver_ref.get_system_matrix()
+        self.assertEqual(system_matrix.shape, system_matrix_ref.shape)
+        self.assertAlmostEqual(
+            abs(system_matrix - system_matrix_ref).sum(), 0,
+            places=self.precision)
+
+        # Blocks of slices whose mask was replaced are reassembled
+        slice_masked = slices[0]
+        slice_masked.sitk_mask = sitk.Image(slice_masked.sitk_mask)
+        solver.get_system_matrix()
+        self.assertIsNot(
+            system_matrix_blocks[slice_masked][1],
+            acquisition_model._system_matrix_blocks[slice_masked][1])
+
+    ##
+    # Test that solvers sharing an acquisition model reuse its masked slice
+    # data and system matrix and that both are updated once slices move
+    # \date       2026-10-17 05:53:42+0000
+    #
+    def test_shared_acquisition_model(self):
+
+        solver = self._get_solver(use_system_matrix=True)
+        solver.set_system_matrix_memory_limit(np.inf)
+        acquisition_model = solver.get_acquisition_model()
+
+        solver_shared = pd.PrimalDualSolver(
+            stacks=self.stacks,
+            reconstruction=st.Stack.from_stack(self.reconstruction),
+            use_system_matrix=True,
+            acquisition_model=acquisition_model,
+        )
+        solver_shared.set_system_matrix_memory_limit(np.inf)
+
+        b = solver.get_b()
+        system_matrix = solver.get_system_matrix()
+        self.assertIs(solver_shared.get_b(), b)
+        self.assertIs(solver_shared.get_system_matrix(), system_matrix)
+
+        transform_sitk = sitk.Euler3DTransform()
+        transform_sitk.SetRotation(0.1, 0.05, -0.1)
+        self.stacks[0].get_slices()[1].update_motion_correction(transform_sitk)
+
+        system_matrix_shared = solver_shared.get_system_matrix()
+        self.assertIsNot(system_matrix_shared, system_matrix)
+        self.assertIs(solver.get_system_matrix(), system_matrix_shared)
+        self.assertIs(solver_shared.get_b(), b)
+
+        solver_ref = self._get_solver(use_system_matrix=True)
+        solver_ref.set_system_matrix_memory_limit(np.inf)
+        self.assertAlmostEqual(
+            abs(system_matrix_shared - solver_ref.get_system_matrix()).sum(),
+            0, places=self.precision)
+
+        # Solvers assuming a different acquisition cannot share the model
+        with self.assertRaises(ValueError):
+            self._get_solver(alpha_cut=2, acquisition_model=acquisition_model)
+
+    ##
+    # Test that components reconstructed concurrently by worker processes
+    # match the serial multi-component reconstruction and that they are
+    # streamed to the data writer in order
+    # \date       2026-10-17 05:54:48+0000
+    #
+    def test_multi_component_reconstruction_processes(self):
+
+        reconstructions = {}
+        for n_processes in [1, 2]:
+            multi_component_reconstruction = \
+                pipeline.MultiComponentReconstruction(
+                    stacks=self.stacks,
+                    reconstruction_method=self._get_solver(
+                        iter_max=5, verbose=0),
+                    n_processes=n_processes,
+                )
+            multi_component_reconstruction.run()
+            reconstructions[n_processes] = \
+                multi_component_reconstruction.get_reconstructions()
+
+        self.assertEqual(len(reconstructions[2]), len(self.stacks))
+        for stack, recon, recon_processes in zip(
+                self.stacks, reconstructions[1], reconstructions[2]):
+            self.assertEqual(
+                recon_processes.get_filename(),
+                stack.get_filename() + "_recon")
+            nda = sitk.GetArrayFromImage(recon.sitk)
+            nda_processes = sitk.GetArrayFromImage(recon_processes.sitk)
+            self.assertAlmostEqual(
+                np.linalg.norm(nda_processes - nda) / np.linalg.norm(nda), 0,
+                places=self.precision)
+
+        data_writer = dw.MultiComponentImageWriter(
+            [], os.path.join(DIR_TMP, "multi_component_reconstruction.nii.gz"))
+        multi_component_reconstruction = \
+            pipeline.MultiComponentReconstruction(
+                stacks=self.stacks,
+                reconstruction_method=self._get_solver(
+                    iter_max=5, verbose=0),
+                n_processes=2,
+                data_writer=data_writer,
+            )
+        multi_component_reconstruction.run()
+        self.assertEqual(
+            len(multi_component_reconstruction.get_reconstructions()), 0)
+        self.assertEqual(len(data_writer._stacks), len(self.stacks))
+        for recon, component in zip(reconstructions[1], data_writer._stacks):
+            nda = sitk.GetArrayFromImage(recon.sitk)
+            self.assertAlmostEqual(
+                np.linalg.norm(
+                    sitk.GetArrayFromImage(component.sitk) - nda) /
+                np.linalg.norm(nda), 0, places=5)
+        data_writer.write_data()
+
+    ##
+    # Test that the block-parallel evaluation of the temporal Tikhonov
+    # problem matches the serial one
+    # \date       2026-10-17 05:56:15+0000
+    #
+    def test_temporal_tikhonov_threads(self):
+
+        reconstructions = []
+        for n_threads in [1, 2, 3]:
+            solver = tk.TemporalTikhonovSolver(
+                stacks=self.stacks,
+                reconstruction=st.Stack.from_stack(self.reconstruction),
+                alpha=0.03,
+                beta=0.1,
+                iter_max=5,
+                verbose=0,
+                n_threads=n_threads,
+            )
+            solver.run()
+            reconstructions.append([
+                sitk.GetArrayFromImage(recon.sitk)
+                for recon in solver.get_reconstructions()])
+
+        for reconstructions_k in reconstructions[1:]:
+            for nda, nda_k in zip(reconstructions[0], reconstructions_k):
+                self.assertAlmostEqual(
+                    np.linalg.norm(nda_k - nda) / np.linalg.norm(nda), 0,
+                    places=self.precision)